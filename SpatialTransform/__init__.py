@@ -1,3 +1,54 @@
-from .lib.transform import Transform
-from .lib.pose import Pose
-from .lib.euler import Euler
+from typing import TYPE_CHECKING
+
+# Classes are loaded on first access, so importing the package stays fast and numpy is only loaded by the array based classes.
+# - Accessing an attribute imports its module once, afterwards it is a regular attribute of the package.
+
+_Modules = {
+    'Transform': '.lib.transform',
+    'Pose': '.lib.pose',
+    'Euler': '.lib.euler',
+    'Hierarchy': '.lib.hierarchy',
+    'SpatialIndex': '.lib.spatialindex',
+    'FeatureDatabase': '.lib.features',
+    'Retarget': '.lib.retarget',
+    'IKChain': '.lib.ik',
+    'PoseStream': '.lib.stream',
+    'WorldCache': '.lib.cache',
+    'Export': '.lib.export',
+    'AimConstraint': '.lib.aim',
+    'RootMotion': '.lib.rootmotion',
+    'PoseMetrics': '.lib.metrics',
+    'ArrayStorage': '.lib.storage',
+}
+
+__all__ = list(_Modules)
+
+if TYPE_CHECKING:
+    from .lib.transform import Transform
+    from .lib.pose import Pose
+    from .lib.euler import Euler
+    from .lib.hierarchy import Hierarchy
+    from .lib.spatialindex import SpatialIndex
+    from .lib.features import FeatureDatabase
+    from .lib.retarget import Retarget
+    from .lib.ik import IKChain
+    from .lib.stream import PoseStream
+    from .lib.cache import WorldCache
+    from .lib.export import Export
+    from .lib.aim import AimConstraint
+    from .lib.rootmotion import RootMotion
+    from .lib.metrics import PoseMetrics
+    from .lib.storage import ArrayStorage
+
+
+def __getattr__(name: str):
+    if name not in _Modules: raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    import importlib
+    value = getattr(importlib.import_module(_Modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_Modules))
@@ -0,0 +1,99 @@
+import numpy as np
+from typing import Union
+from . import arrays
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class AimConstraint:
+    """Aims the Z- axis of many transforms of a hierarchy at once, like 'Transform.lookAt' and 'Transform.lookAtWorld'.
+    - Directions or targets are given per aimed transform. Many frames of a clip are solved at once.
+    - The up axis is handled like 'Pose.lookAt'. If a direction is almost parallel to the Y axis, the X axis is used as up axis instead.
+    - Aimed transforms within other aimed transforms are solved after them, like calling 'lookAtWorld' parents first.
+    - Constraints are solved with the precision of the hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the aimed transforms are part of."""
+        return self._Hierarchy
+
+    @property
+    def Joints(self) -> list[Transform]:
+        """Aimed transforms, in the order of the given directions or targets."""
+        return [self._Hierarchy.Nodes[index] for index in self._Joints]
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], joints: list) -> None:
+        """Selects the aimed transforms of the hierarchy.
+        - Joints is a list of transforms or their names.
+        - If hierarchy is a transform -> The hierarchy of it is used."""
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        self._Joints = np.array([self._Hierarchy.index(joint) for joint in joints], dtype=np.intp)
+        if len(self._Joints) == 0: raise ValueError('At least one transform is required')
+        if len(set(self._Joints.tolist())) != len(self._Joints): raise ValueError('Transforms must be aimed only once')
+
+        # aimed transforms are grouped by the amount of aimed ancestors, each group is solved in a single pass
+        aimed = set(self._Joints.tolist())
+        levels = []
+        for joint in self._Joints.tolist():
+            level, parent = 0, self._Hierarchy.Parents[joint]
+            while parent >= 0:
+                if parent in aimed: level += 1
+                parent = self._Hierarchy.Parents[parent]
+            levels.append(level)
+        levels = np.array(levels)
+        self._Groups = [np.flatnonzero(levels == level) for level in range(levels.max() + 1)]
+
+    def __len__(self) -> int:
+        return len(self._Joints)
+
+    def __repr__(self) -> str:
+        return (f"{self._Hierarchy.Root.Name}: {len(self._Joints)}")
+
+    def solve(self, directions: np.ndarray = None, targets: np.ndarray = None, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None,
+              up: np.ndarray = (0, 1, 0), space: str = 'world') -> np.ndarray:
+        """Rotates the aimed transforms so their Z- axis aligns with the given directions or points at the given world targets.
+        - Directions or targets have the shape (..., joints, 3), the leading axes are broadcasted with the ones of the clip.
+        - Up has the shape (3,) or (..., joints, 3) and is considered as local space, like for 'Transform.lookAtWorld'.
+        - If space is 'world' -> Directions are considered as world space, like 'Transform.lookAtWorld'.
+        - If space is 'local' -> Directions are considered as local space, like 'Transform.lookAt'.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - The transforms are not changed.
+
+        Returns the local rotations of all transforms of the hierarchy."""
+        if (directions is None) == (targets is None): raise ValueError('Either directions or targets must be set')
+        if space not in ('world', 'local'): raise ValueError(f'given space "{space}" is invalid. Must be "world" or "local"')
+
+        dtype = self._Hierarchy.DType
+        positions, rotations, scales = self._Hierarchy.complete(positions, rotations, scales)
+        values = np.asarray(directions if targets is None else targets, dtype=dtype)
+        if values.shape[-2:] != (len(self._Joints), 3):
+            raise ValueError(f'Expected an array with shape (..., {len(self._Joints)}, 3), but got {values.shape}')
+
+        rotations = np.asarray(rotations, dtype=dtype)
+        shape = np.broadcast_shapes(values.shape[:-2], np.shape(positions)[:-2], rotations.shape[:-2], np.shape(scales)[:-2])
+        rotations = np.array(np.broadcast_to(rotations, shape + rotations.shape[-2:]))
+        values = np.broadcast_to(values, shape + values.shape[-2:])
+        up = np.broadcast_to(np.asarray(up, dtype=dtype), values.shape)
+
+        for group in self._Groups:
+            joints = self._Joints[group]
+            direction = values[..., group, :]
+            if targets is not None or space == 'world':
+                worldPositions, worldRotations, _ = self._Hierarchy.toWorld(positions, rotations, scales)
+                if targets is not None: direction = direction - worldPositions[..., joints, :]
+
+                # the world rotation of the parents, which also covers the world space of the roots parent
+                parentRotations = arrays.quatMultiply(worldRotations[..., joints, :], arrays.quatInverse(rotations[..., joints, :]))
+                direction = arrays.quatRotate(arrays.quatInverse(parentRotations), direction)
+            rotations[..., joints, :] = arrays.quatLookAt(direction, up[..., group, :])
+
+        return rotations
+
+    def apply(self, directions: np.ndarray = None, targets: np.ndarray = None, up: np.ndarray = (0, 1, 0), space: str = 'world') -> "AimConstraint":
+        """Solves the constraint for the current pose and writes the rotations into the aimed transforms.
+
+        Returns itself."""
+        rotations = self.solve(directions, targets, up=up, space=space)
+        for index in self._Joints:
+            self._Hierarchy.Nodes[index].Rotation = rotations[index].tolist()
+        return self
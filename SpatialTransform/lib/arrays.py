@@ -0,0 +1,250 @@
+import numpy as np
+
+
+# Vectorized counterparts of the glm operations used by 'Pose' and 'Transform'.
+# - Values are stored on the last axis, all leading axes are broadcasted.
+# - Quaternions are stored as (w, x, y, z), like the glm.quat constructor.
+# - Matrices are row major, so they can be applied with 'matrix @ vector'.
+
+
+def quatMultiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product of quaternions, like 'a * b' for glm.quat."""
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+
+def quatInverse(q: np.ndarray) -> np.ndarray:
+    """Inverse of quaternions, like glm.inverse."""
+    return quatConjugate(q) / np.sum(q * q, axis=-1, keepdims=True)
+
+
+def quatConjugate(q: np.ndarray) -> np.ndarray:
+    """Conjugate of quaternions, which is the inverse for unit quaternions."""
+    return q * np.array((1, -1, -1, -1), dtype=q.dtype)
+
+
+def quatNormalize(q: np.ndarray) -> np.ndarray:
+    """Normalizes quaternions to unit length."""
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def quatRotate(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Rotates vectors by quaternions, like 'q * v' for glm.quat and glm.vec3."""
+    w = q[..., :1]
+    u = q[..., 1:]
+    uv = np.cross(u, v)
+    uuv = np.cross(u, uv)
+    return v + ((uv * w) + uuv) * 2
+
+
+def quatToMat(q: np.ndarray) -> np.ndarray:
+    """Converts quaternions to 3x3 rotation matrices, like glm.mat3_cast."""
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    return np.stack((
+        np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+        np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+        np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+    ), axis=-2)
+
+
+def matApply(m: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Applies matrices to vectors, like 'm * v' for glm.mat3 and glm.vec3."""
+    return np.matmul(m, v[..., None])[..., 0]
+
+
+def quatBetween(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Shortest rotations that align the directions a with the directions b.
+    - Directions with a length of zero result in no rotation."""
+    lengthA = np.linalg.norm(a, axis=-1, keepdims=True)
+    lengthB = np.linalg.norm(b, axis=-1, keepdims=True)
+    valid = (lengthA > 1e-12) & (lengthB > 1e-12)
+    a = a / np.where(valid, lengthA, 1)
+    b = b / np.where(valid, lengthB, 1)
+
+    # opposite directions are rotated around any perpendicular axis
+    dot = np.sum(a * b, axis=-1, keepdims=True)
+    axis = np.cross(a, b)
+    fallback = np.cross(a, np.where(np.abs(a[..., :1]) < 0.9, np.array((1, 0, 0), dtype=a.dtype), np.array((0, 1, 0), dtype=a.dtype)))
+    opposite = dot < -1 + 1e-9
+    result = np.concatenate((np.where(opposite, 0.0, 1 + dot), np.where(opposite, fallback, axis)), axis=-1)
+    result = np.where(valid, result, np.array((1, 0, 0, 0), dtype=a.dtype))
+    return quatNormalize(result)
+
+
+def quatAngle(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Geodesic angles in radians between the rotations of unit quaternions, within [0, pi].
+    - Quaternions q and -q are considered as the same rotation."""
+    # the half angle between both quaternions is taken from the chord lengths, which is precise for small and large angles
+    b = np.where(np.sum(a * b, axis=-1, keepdims=True) < 0, -b, b)
+    return 4 * np.arctan2(np.linalg.norm(a - b, axis=-1), np.linalg.norm(a + b, axis=-1))
+
+
+def matToQuat(m: np.ndarray) -> np.ndarray:
+    """Converts 3x3 rotation matrices to quaternions, like glm.quat_cast."""
+    m00, m11, m22 = m[..., 0, 0], m[..., 1, 1], m[..., 2, 2]
+    candidates = np.stack((m00 + m11 + m22, m00 - m11 - m22, m11 - m00 - m22, m22 - m00 - m11), axis=-1)
+    biggest = np.argmax(candidates, axis=-1)[..., None]
+    value = np.sqrt(np.take_along_axis(candidates, biggest, axis=-1)[..., 0] + 1) * 0.5
+    mult = 0.25 / value
+
+    # the largest component is computed directly, the others from the off diagonal elements
+    wx, wy, wz = m[..., 2, 1] - m[..., 1, 2], m[..., 0, 2] - m[..., 2, 0], m[..., 1, 0] - m[..., 0, 1]
+    xy, xz, yz = m[..., 1, 0] + m[..., 0, 1], m[..., 0, 2] + m[..., 2, 0], m[..., 2, 1] + m[..., 1, 2]
+    results = np.stack((
+        np.stack((value, wx * mult, wy * mult, wz * mult), axis=-1),
+        np.stack((wx * mult, value, xy * mult, xz * mult), axis=-1),
+        np.stack((wy * mult, xy * mult, value, yz * mult), axis=-1),
+        np.stack((wz * mult, xz * mult, yz * mult, value), axis=-1),
+    ), axis=-2)
+    return np.take_along_axis(results, biggest[..., None], axis=-2)[..., 0, :]
+
+
+def quatLookAt(direction: np.ndarray, up: np.ndarray) -> np.ndarray:
+    """Rotations that align the Z- axis with the directions, like 'Pose.lookAt' and glm.quatLookAtRH.
+    - If a direction is almost parallel to the Y axis -> The X axis is used as up axis instead."""
+    direction = direction / np.linalg.norm(direction, axis=-1, keepdims=True)
+    up = np.where(np.abs(direction[..., 1:2]) < 0.999, up, np.array((1, 0, 0), dtype=direction.dtype))
+
+    back = -direction
+    right = np.cross(up, back)
+    right = right / np.sqrt(np.maximum(0.00001, np.sum(right * right, axis=-1, keepdims=True)))
+    return matToQuat(np.stack((right, np.cross(back, right), back), axis=-1))
+
+
+# Vectorized counterparts of the conversions of 'Euler', angles are stored as (x, y, z) radians on the last axis.
+
+
+def eulerToQuats(radians: np.ndarray, order: str = 'ZXY', extrinsic: bool = True, dtype: np.dtype = None) -> np.ndarray:
+    """Converts euler angles to quaternions, like 'Euler.toQuatsFrom'."""
+    dtype = np.float64 if dtype is None else dtype
+    radians = np.asarray(radians, dtype=dtype)
+    result = np.zeros(radians.shape[:-1] + (4,), dtype=dtype)
+    result[..., 0] = 1
+
+    order = order.upper()
+    if sorted(order) != ['X', 'Y', 'Z']: raise ValueError(f'given order "{order}" is invalid. Must be "XYZ" in any order')
+    if extrinsic:
+        order = reversed(order)
+    for axis in order:
+        index = 'XYZ'.index(axis)
+        result = quatMultiply(result, axisQuats(index, radians[..., index]))
+
+    return result
+
+
+def quatsToEuler(quats: np.ndarray, order: str = 'ZXY', extrinsic: bool = True, dtype: np.dtype = None) -> np.ndarray:
+    """Converts quaternions to euler angles, like 'Euler.fromQuatsTo'."""
+    dtype = np.float64 if dtype is None else dtype
+
+    # column major like glm, with the matrix axes leading to keep the indexing of the scalar conversions
+    mats = np.moveaxis(quatToMat(np.asarray(quats, dtype=dtype)), (-1, -2), (0, 1))
+
+    order = order.upper()
+    if extrinsic: order = order[::-1]
+
+    if order == 'XYZ': return fromMatsToXYZ(mats)
+    if order == 'XZY': return fromMatsToXZY(mats)
+    if order == 'YXZ': return fromMatsToYXZ(mats)
+    if order == 'YZX': return fromMatsToYZX(mats)
+    if order == 'ZXY': return fromMatsToZXY(mats)
+    if order == 'ZYX': return fromMatsToZYX(mats)
+
+    raise ValueError(f'given order "{order}" is invalid. Must be "XYZ" in any order')
+
+
+def quatSequenceToEuler(quats: np.ndarray, order: str = 'ZXY', extrinsic: bool = True, dtype: np.dtype = None) -> np.ndarray:
+    """Converts a sequence of quaternions to continuous euler curves, like 'Euler.fromQuatSequenceTo'."""
+    dtype = np.float64 if dtype is None else dtype
+    quats = np.asarray(quats, dtype=dtype)
+    angles = quatsToEuler(quats, order, extrinsic, dtype)
+    if len(angles) == 0: return angles
+
+    # axes in the order they are multiplied, the middle axis is the one that can lock
+    axes = ['XYZ'.index(axis) for axis in (order.upper()[::-1] if extrinsic else order.upper())]
+    first, middle, last = axes
+
+    # gimbal lock, only the sum or difference of the outer angles is defined
+    locked = np.abs(np.cos(angles[..., middle])) < np.sqrt(np.finfo(dtype).eps) * 10
+    if np.any(locked):
+        filled = np.where(locked, 0, np.arange(len(angles)).reshape((-1,) + (1,) * (locked.ndim - 1)))
+        filled = np.maximum.accumulate(filled, axis=0)
+        angles[..., first] = np.where(locked, np.take_along_axis(angles[..., first], filled, axis=0), angles[..., first])
+        residual = quatMultiply(quatConjugate(quatMultiply(
+            axisQuats(first, angles[..., first]), axisQuats(middle, angles[..., middle]))), quats)
+        angles[..., last] = np.where(locked, 2 * np.arctan2(residual[..., last + 1], residual[..., 0]), angles[..., last])
+
+    # the second solution of each frame, the solution family switches where it is closer to the previous frame
+    alternative = angles + np.pi
+    alternative[..., middle] = np.pi - angles[..., middle]
+    switch = wrappedDistance(angles[1:], alternative[:-1]) < wrappedDistance(angles[1:], angles[:-1])
+    family = np.concatenate((np.zeros_like(switch[:1]), np.cumsum(switch, axis=0) % 2 == 1), axis=0)
+    angles = np.where(family[..., None], alternative, angles)
+
+    return np.unwrap(angles, axis=0)
+
+
+def axisQuats(index: int, radians: np.ndarray) -> np.ndarray:
+    # quaternions rotating around the axis of the given index
+    result = np.zeros(np.shape(radians) + (4,), dtype=np.result_type(radians))
+    result[..., 0] = np.cos(radians * 0.5)
+    result[..., index + 1] = np.sin(radians * 0.5)
+    return result
+
+
+def wrappedDistance(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # squared distance of angles, ignoring full turns
+    return np.sum(((a - b + np.pi) % (2 * np.pi) - np.pi) ** 2, axis=-1)
+
+
+def fromMatsToXZY(mat: np.ndarray) -> np.ndarray:
+    return np.stack((
+        np.arctan2(mat[1, 2], mat[1, 1]),
+        np.arctan2(mat[2, 0], mat[0, 0]),
+        np.arctan2(-mat[1, 0], np.sqrt(np.maximum(0, 1 - mat[1, 0]**2))),
+    ), axis=-1)
+
+
+def fromMatsToXYZ(mat: np.ndarray) -> np.ndarray:
+    return np.stack((
+        np.arctan2(-mat[2, 1], mat[2, 2]),
+        np.arctan2(mat[2, 0], np.sqrt(np.maximum(0, 1 - mat[2, 0]**2))),
+        np.arctan2(-mat[1, 0], mat[0, 0]),
+    ), axis=-1)
+
+
+def fromMatsToYXZ(mat: np.ndarray) -> np.ndarray:
+    return np.stack((
+        np.arctan2(-mat[2, 1], np.sqrt(np.maximum(0, 1 - mat[2, 1]**2))),
+        np.arctan2(mat[2, 0], mat[2, 2]),
+        np.arctan2(mat[0, 1], mat[1, 1]),
+    ), axis=-1)
+
+
+def fromMatsToYZX(mat: np.ndarray) -> np.ndarray:
+    return np.stack((
+        np.arctan2(-mat[2, 1], mat[1, 1]),
+        np.arctan2(-mat[0, 2], mat[0, 0]),
+        np.arctan2(mat[0, 1], np.sqrt(np.maximum(0, 1 - mat[0, 1]**2))),
+    ), axis=-1)
+
+
+def fromMatsToZYX(mat: np.ndarray) -> np.ndarray:
+    return np.stack((
+        np.arctan2(mat[1, 2], mat[2, 2]),
+        np.arctan2(-mat[0, 2], np.sqrt(np.maximum(0, 1 - mat[0, 2]**2))),
+        np.arctan2(mat[0, 1], mat[0, 0]),
+    ), axis=-1)
+
+
+def fromMatsToZXY(mat: np.ndarray) -> np.ndarray:
+    return np.stack((
+        np.arctan2(mat[1, 2], np.sqrt(np.maximum(0, 1 - mat[1, 2]**2))),
+        np.arctan2(-mat[0, 2], mat[2, 2]),
+        np.arctan2(-mat[1, 0], mat[1, 1]),
+    ), axis=-1)
@@ -0,0 +1,171 @@
+import heapq
+import numpy as np
+
+
+class BoundingVolumeTree:
+    """Bounding volume hierarchy over points of any dimension, for proximity queries.
+    - Nodes split their points at the median of their widest axis, leafs hold up to 'leafSize' points.
+    - Points are referred by their index in the given array.
+    - Moved points can be refitted without rebuilding the tree, which keeps queries correct but may slow them down over time.
+    - The floating point precision of the given points is kept, other types are converted to float64."""
+
+    @property
+    def Points(self) -> np.ndarray:
+        """Indexed points with the shape (count, dimension)."""
+        return self._Points
+
+    def __init__(self, points: np.ndarray, leafSize: int = 8) -> None:
+        """Builds the tree for the given points with the shape (count, dimension)."""
+        points = asFloat(points)
+        if points.ndim != 2 or len(points) == 0: raise ValueError(f'Expected a non empty array with shape (count, dimension), but got {points.shape}')
+        if leafSize < 1: raise ValueError('Leaf size must be at least 1')
+
+        self._Points = points
+        self._LeafSize = leafSize
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self._Points)
+
+    def rebuild(self) -> "BoundingVolumeTree":
+        """Rebuilds the tree structure from the current points.
+
+        Returns itself."""
+        points = self._Points
+        order = np.arange(len(points))
+        starts, counts, lefts, rights, depths = [0], [len(points)], [-1], [-1], [0]
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            start, count = starts[node], counts[node]
+            if count <= self._LeafSize: continue
+
+            indices = order[start:start + count]
+            values = points[indices]
+            axis = np.argmax(values.max(axis=0) - values.min(axis=0))
+            half = count // 2
+            order[start:start + count] = indices[np.argpartition(values[:, axis], half)]
+
+            for childStart, childCount in ((start, half), (start + half, count - half)):
+                starts.append(childStart)
+                counts.append(childCount)
+                lefts.append(-1)
+                rights.append(-1)
+                depths.append(depths[node] + 1)
+                stack.append(len(starts) - 1)
+            lefts[node], rights[node] = len(starts) - 2, len(starts) - 1
+
+        self._Order = order
+        self._Start = np.array(starts)
+        self._Count = np.array(counts)
+        self._Left = np.array(lefts)
+        self._Right = np.array(rights)
+        self._Leafs = np.flatnonzero(self._Left < 0)
+        self._Leafs = self._Leafs[np.argsort(self._Start[self._Leafs])]
+
+        depths = np.array(depths)
+        internal = self._Left >= 0
+        self._Levels = [np.flatnonzero(internal & (depths == depth)) for depth in range(depths.max(), -1, -1)]
+        return self.refit()
+
+    def refit(self, points: np.ndarray = None) -> "BoundingVolumeTree":
+        """Updates the bounds of all nodes bottom up, without changing the tree structure.
+        - If points is set -> The points are replaced before, the amount of points must not change.
+
+        Returns itself."""
+        if points is not None:
+            points = asFloat(points)
+            if points.shape != self._Points.shape: raise ValueError(f'Expected an array with shape {self._Points.shape}, but got {points.shape}')
+            self._Points = points
+
+        ordered = self._Points[self._Order]
+        self._Min = np.empty((len(self._Start), ordered.shape[1]), dtype=ordered.dtype)
+        self._Max = np.empty((len(self._Start), ordered.shape[1]), dtype=ordered.dtype)
+        self._Min[self._Leafs] = np.minimum.reduceat(ordered, self._Start[self._Leafs], axis=0)
+        self._Max[self._Leafs] = np.maximum.reduceat(ordered, self._Start[self._Leafs], axis=0)
+
+        for level in self._Levels:
+            self._Min[level] = np.minimum(self._Min[self._Left[level]], self._Min[self._Right[level]])
+            self._Max[level] = np.maximum(self._Max[self._Left[level]], self._Max[self._Right[level]])
+        return self
+
+    def queryRadius(self, point: np.ndarray, radius: float) -> np.ndarray:
+        """Returns the indices of all points within the radius around the given point."""
+        point = np.asarray(point, dtype=self._Points.dtype)
+        candidates = self._collect(lambda nodes: np.sum((np.clip(point, self._Min[nodes], self._Max[nodes]) - point) ** 2, axis=1) <= radius * radius)
+        return candidates[np.sum((self._Points[candidates] - point) ** 2, axis=1) <= radius * radius]
+
+    def queryBox(self, minimum: np.ndarray, maximum: np.ndarray) -> np.ndarray:
+        """Returns the indices of all points within the axis aligned box, including its borders."""
+        minimum = np.asarray(minimum, dtype=self._Points.dtype)
+        maximum = np.asarray(maximum, dtype=self._Points.dtype)
+        candidates = self._collect(lambda nodes: np.all((self._Min[nodes] <= maximum) & (self._Max[nodes] >= minimum), axis=1))
+        values = self._Points[candidates]
+        return candidates[np.all((values >= minimum) & (values <= maximum), axis=1)]
+
+    def queryNearest(self, point: np.ndarray, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the indices and distances of the k nearest points to the given point, ordered by distance."""
+        point = np.asarray(point, dtype=self._Points.dtype)
+        return self._search(
+            k,
+            lambda node: np.sqrt(np.sum((np.clip(point, self._Min[node], self._Max[node]) - point) ** 2)),
+            lambda indices: np.sqrt(np.sum((self._Points[indices] - point) ** 2, axis=1)))
+
+    def queryRay(self, origin: np.ndarray, direction: np.ndarray, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the indices and distances of the k points nearest to the ray, ordered by distance.
+        - Points behind the origin are measured to the origin."""
+        origin = np.asarray(origin, dtype=self._Points.dtype)
+        direction = np.asarray(direction, dtype=self._Points.dtype)
+        direction = direction / np.linalg.norm(direction)
+
+        def distance(points: np.ndarray) -> np.ndarray:
+            offsets = points - origin
+            along = np.maximum(offsets @ direction, 0)
+            return np.linalg.norm(offsets - along[..., None] * direction, axis=-1)
+
+        # the distance to the bounding sphere of a node is a lower bound for all its points
+        return self._search(
+            k,
+            lambda node: max(0.0, distance((self._Min[node] + self._Max[node]) * 0.5) - np.linalg.norm(self._Max[node] - self._Min[node]) * 0.5),
+            lambda indices: distance(self._Points[indices]))
+
+    def _collect(self, test) -> np.ndarray:
+        # traverses the tree breadth first, testing all nodes of a level at once
+        ranges = []
+        nodes = np.zeros(1, dtype=np.intp)
+        while len(nodes) > 0:
+            nodes = nodes[test(nodes)]
+            leafs = nodes[self._Left[nodes] < 0]
+            ranges.extend(self._Order[start:start + count] for start, count in zip(self._Start[leafs], self._Count[leafs]))
+            nodes = nodes[self._Left[nodes] >= 0]
+            nodes = np.concatenate((self._Left[nodes], self._Right[nodes]))
+        return np.concatenate(ranges) if ranges else np.zeros(0, dtype=np.intp)
+
+    def _search(self, k: int, nodeDistance, pointDistance) -> tuple[np.ndarray, np.ndarray]:
+        # best first traversal, nodes are skipped as soon as their lower bound exceeds the current k-th distance
+        if k < 1: raise ValueError('k must be at least 1')
+
+        best = []
+        queue = [(nodeDistance(0), 0)]
+        while queue:
+            bound, node = heapq.heappop(queue)
+            if len(best) == k and bound > -best[0][0]: break
+
+            if self._Left[node] >= 0:
+                for child in (self._Left[node], self._Right[node]):
+                    heapq.heappush(queue, (nodeDistance(child), child))
+                continue
+
+            indices = self._Order[self._Start[node]:self._Start[node] + self._Count[node]]
+            for index, distance in zip(indices.tolist(), pointDistance(indices).tolist()):
+                if len(best) < k: heapq.heappush(best, (-distance, index))
+                elif distance < -best[0][0]: heapq.heapreplace(best, (-distance, index))
+
+        best = sorted((-distance, index) for distance, index in best)
+        return (np.array([index for _, index in best], dtype=np.intp), np.array([distance for distance, _ in best]))
+
+
+def asFloat(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    return values if np.issubdtype(values.dtype, np.floating) else values.astype(np.float64)
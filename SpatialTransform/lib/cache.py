@@ -0,0 +1,162 @@
+import os
+import time
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from typing import Union
+from . import arrays
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+# names of the stored arrays, in order of the returned tuple
+Fields = ('positions', 'rotations', 'scales', 'directions')
+Version = b'world-cache-1'
+# file of each entry with the time of its last use in nanoseconds
+Use = 'use'
+
+
+class WorldCache:
+    """Persistent cache of world space clip data, to skip repeated evaluations of the same clips over many runs.
+    - Entries are keyed by a content hash of the hierarchy structure, the world space of the roots parent and the local properties.
+    - World positions, rotations, scales and forward directions are stored as '.npy' files and returned as read only memory mapped arrays.
+    - If the size of all entries exceeds the limit, the least recently used entries are removed. The last use is stored in each entry, instead of relying on file system times.
+    - Entries are written to a temporary directory and moved in place, so multiple processes can share the cache directory."""
+
+    @property
+    def Directory(self) -> str:
+        """Directory the entries are stored in."""
+        return self._Directory
+
+    @property
+    def MaxBytes(self) -> int:
+        """Size limit of all entries in bytes."""
+        return self._MaxBytes
+
+    @property
+    def Size(self) -> int:
+        """Current size of all entries in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def __init__(self, directory: str, maxBytes: int = 1 << 30) -> None:
+        """Opens or creates the cache in the given directory."""
+        if maxBytes < 0: raise ValueError('Size limit must not be negative')
+        self._Directory = os.path.abspath(directory)
+        self._MaxBytes = maxBytes
+        self._LastUse = 0
+        os.makedirs(self._Directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.isdir(os.path.join(self._Directory, key))
+
+    def __repr__(self) -> str:
+        return (f"{self._Directory}")
+
+    def key(self, hierarchy: Union[Transform, Hierarchy], positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> str:
+        """Returns the content hash of the given hierarchy and local properties.
+        - Properties that are None are taken from the current local properties of the transforms."""
+        hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        values = hierarchy.broadcast(*hierarchy.complete(positions, rotations, scales))
+
+        digest = hashlib.sha256(Version)
+        digest.update(np.ascontiguousarray(hierarchy.Parents).tobytes())
+        digest.update(hierarchy.DType.str.encode())
+        for value in hierarchy._base(hierarchy.DType) + values:
+            digest.update(str(value.shape).encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        return digest.hexdigest()
+
+    def toWorld(self, hierarchy: Union[Transform, Hierarchy], positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Converts local properties of all transforms to world space like 'Hierarchy.toWorld', or loads the result of an earlier run.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - Directions are the world forward directions like 'Transform.ForwardWorld'.
+
+        Returns read only world positions, rotations, scales and directions."""
+        hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        values = hierarchy.complete(positions, rotations, scales)
+        key = self.key(hierarchy, *values)
+        path = os.path.join(self._Directory, key)
+
+        if key not in self:
+            worldPositions, worldRotations, worldScales = hierarchy.toWorld(*values)
+            directions = arrays.quatRotate(worldRotations, np.array((0, 0, -1), dtype=worldRotations.dtype))
+            self._store(path, (worldPositions, worldRotations, worldScales, directions))
+            self._evict(keep=key)
+        else:
+            self._touch(path)
+
+        return tuple(np.load(os.path.join(path, f'{field}.npy'), mmap_mode='r') for field in Fields)
+
+    def remove(self, key: str) -> "WorldCache":
+        """Removes the entry of the given key, if it exists.
+
+        Returns itself."""
+        shutil.rmtree(os.path.join(self._Directory, key), ignore_errors=True)
+        return self
+
+    def clear(self) -> "WorldCache":
+        """Removes all entries.
+
+        Returns itself."""
+        for key, _, _ in self._entries():
+            self.remove(key)
+        return self
+
+    def _store(self, path: str, values: tuple) -> None:
+        temporary = tempfile.mkdtemp(prefix='.', dir=self._Directory)
+        try:
+            for field, value in zip(Fields, values):
+                np.save(os.path.join(temporary, f'{field}.npy'), value)
+            self._touch(temporary)
+            os.replace(temporary, path)
+        except OSError:
+            # another process stored the same entry meanwhile
+            if not os.path.isdir(path): raise
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    def _touch(self, path: str) -> None:
+        # the last use is written to a temporary file and moved in place, so readers never see a partial value
+        # uses of this cache are strictly increasing, even if the clock has a coarse resolution
+        self._LastUse = max(time.time_ns(), self._LastUse + 1)
+        try:
+            handle, temporary = tempfile.mkstemp(prefix='.', dir=path)
+            with os.fdopen(handle, 'w') as file:
+                file.write(str(self._LastUse))
+            os.replace(temporary, os.path.join(path, Use))
+        except FileNotFoundError:
+            # another process removed the entry meanwhile
+            pass
+
+    def _lastUse(self, path: str) -> int:
+        # entries without a valid last use fall back to the modification time of their directory
+        try:
+            with open(os.path.join(path, Use)) as file:
+                return int(file.read())
+        except (FileNotFoundError, ValueError):
+            return os.stat(path).st_mtime_ns
+
+    def _entries(self) -> list[tuple[str, int, int]]:
+        # key, last use and size of all entries, temporary directories and files start with a dot
+        entries = []
+        for entry in os.scandir(self._Directory):
+            if entry.name.startswith('.') or not entry.is_dir(): continue
+            try:
+                size = sum(item.stat().st_size for item in os.scandir(entry.path))
+                entries.append((entry.name, self._lastUse(entry.path), size))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entrySize for _, _, entrySize in entries)
+        for key, _, entrySize in entries:
+            if size <= self._MaxBytes: break
+            if key == keep: continue
+            self.remove(key)
+            size -= entrySize
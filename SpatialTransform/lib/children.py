@@ -0,0 +1,130 @@
+from typing import Iterable, Iterator
+
+
+class ChildList:
+    """Ordered collection of child transforms.
+    - Membership, appending and removal are constant time, regardless of the amount of children.
+    - Keeps the insertion order and behaves like a list for iteration, indexing, assignment, concatenation and comparison.
+    - Appending, removal and popping the last item keep the ordered snapshot or rebuild it lazily, inserting, sorting and assignment rebuild it in linear time like a list.
+    - Every transform can only be contained once."""
+
+    def __init__(self, items: Iterable = ()) -> None:
+        """Creates a new collection with the given items in order."""
+        self._Items = dict.fromkeys(items)
+        self._Order = None
+
+    def __repr__(self) -> str:
+        return f"{list(self._Items)}"
+
+    def __len__(self) -> int:
+        return len(self._Items)
+
+    def __bool__(self) -> bool:
+        return len(self._Items) > 0
+
+    def __iter__(self) -> Iterator:
+        return iter(self._list())
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._list())
+
+    def __contains__(self, item) -> bool:
+        try:
+            return item in self._Items
+        except TypeError:
+            return False
+
+    def __getitem__(self, index):
+        return self._list()[index]
+
+    def __setitem__(self, index, value) -> None:
+        order = self._list().copy()
+        order[index] = value
+        self._replace(order)
+
+    def __add__(self, other) -> list:
+        if not isinstance(other, (ChildList, list, tuple)): return NotImplemented
+        return self._list() + list(other)
+
+    def __radd__(self, other) -> list:
+        if not isinstance(other, (list, tuple)): return NotImplemented
+        return list(other) + self._list()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ChildList): return self._list() == other._list()
+        if isinstance(other, (list, tuple)): return self._list() == list(other)
+        return NotImplemented
+
+    def _list(self) -> list:
+        # indexed access is served by an ordered snapshot, which is rebuilt after modifications only
+        # the snapshot is published with a single assignment, so concurrent readers never see a partial one
+        order = self._Order
+        if order is None:
+            order = list(self._Items)
+            self._Order = order
+        return order
+
+    def _replace(self, order: list) -> None:
+        items = dict.fromkeys(order)
+        if len(items) != len(order): raise ValueError('Every transform can only be contained once')
+        self._Items = items
+        self._Order = order
+
+    def index(self, item) -> int:
+        """Returns the position of the given item. Raises ValueError if it is not contained."""
+        if item not in self._Items: raise ValueError(f'{item} is not in the children')
+        return self._list().index(item)
+
+    def append(self, item) -> None:
+        """Adds the item at the end. Nothing will change if the item is already contained."""
+        if item in self._Items: return
+        self._Items[item] = None
+        if self._Order is not None: self._Order.append(item)
+
+    def insert(self, index: int, item) -> None:
+        """Adds the item before the given position, like 'list.insert'. Nothing will change if the item is already contained."""
+        if item in self._Items: return
+        order = self._list().copy()
+        order.insert(index, item)
+        self._replace(order)
+
+    def extend(self, items: Iterable) -> None:
+        """Adds the items at the end, in order. Items that are already contained are skipped."""
+        for item in items:
+            self.append(item)
+
+    def remove(self, item) -> None:
+        """Removes the item. Raises ValueError if it is not contained."""
+        try:
+            del self._Items[item]
+        except KeyError:
+            raise ValueError(f'{item} is not in the children') from None
+        self._Order = None
+
+    def pop(self, index: int = -1):
+        """Removes and returns the item at the given position, by default the last one. Raises IndexError if there is none."""
+        order = self._list()
+        if not order: raise IndexError('pop from empty children')
+        item = order[index]
+        del self._Items[item]
+        if index == -1 or index == len(order) - 1: order.pop()
+        else: self._Order = None
+        return item
+
+    def discard(self, item) -> None:
+        """Removes the item if it is contained."""
+        if self._Items.pop(item, self) is not self:
+            self._Order = None
+
+    def clear(self) -> None:
+        """Removes all items."""
+        self._Items.clear()
+        self._Order = None
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """Sorts the items in place, like 'list.sort'."""
+        self._replace(sorted(self._list(), key=key, reverse=reverse))
+
+    def copy(self) -> list:
+        """Returns the items as new list."""
+        return list(self._Items)
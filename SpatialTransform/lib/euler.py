@@ -1,5 +1,10 @@
 import math
 import glm
+from typing import TYPE_CHECKING
+
+# numpy is only loaded by the array based conversions
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # https://en.wikipedia.org/wiki/Euler_angles
@@ -68,6 +73,35 @@ class Euler:
 
         raise ValueError(f'given order "{order}" is invalid. Must be "XYZ" in any order')
 
+    def toQuatsFrom(radians: "np.ndarray", order: str = 'ZXY', extrinsic: bool = True, dtype: "np.dtype" = None) -> "np.ndarray":
+        """Converts arrays of euler angles to quaternions, like 'toQuatFrom'.
+        - Angles have the shape (..., 3), quaternions are returned with the shape (..., 4) as (w, x, y, z).
+        - Dtype is the floating point precision of the computation and the result, float64 if None.
+
+        If extrinsic the rotation will be around the world axes, ignoring previous rotations."""
+        from . import arrays
+        return arrays.eulerToQuats(radians, order, extrinsic, dtype)
+
+    def fromQuatsTo(quats: "np.ndarray", order: str = 'ZXY', extrinsic: bool = True, dtype: "np.dtype" = None) -> "np.ndarray":
+        """Converts arrays of quaternions to euler angles as radians, like 'fromQuatTo'.
+        - Quaternions have the shape (..., 4) as (w, x, y, z), angles are returned with the shape (..., 3).
+        - Dtype is the floating point precision of the computation and the result, float64 if None.
+
+        If extrinsic the rotation will be around the world axes, ignoring previous rotations."""
+        from . import arrays
+        return arrays.quatsToEuler(quats, order, extrinsic, dtype)
+
+    def fromQuatSequenceTo(quats: "np.ndarray", order: str = 'ZXY', extrinsic: bool = True, dtype: "np.dtype" = None) -> "np.ndarray":
+        """Converts a sequence of quaternions to continuous euler curves as radians, like for exporting animation curves.
+        - Quaternions have the shape (frames, ..., 4) as (w, x, y, z), angles are returned with the shape (frames, ..., 3).
+        - Of both euler solutions of a rotation, the one closest to the previous frame is chosen and angles are not wrapped at +-180 degrees.
+        - In gimbal lock, the first rotated axis keeps its previous angle and the last rotated axis takes the remaining rotation.
+        - Dtype is the floating point precision of the computation and the result, float64 if None.
+
+        If extrinsic the rotation will be around the world axes, ignoring previous rotations."""
+        from . import arrays
+        return arrays.quatSequenceToEuler(quats, order, extrinsic, dtype)
+
 
 def fromMatToXZY(mat: glm.mat3) -> glm.vec3:
     return glm.vec3(
@@ -0,0 +1,74 @@
+import json
+import glm
+from typing import Iterator, TextIO
+from .transform import Transform
+
+
+class Export:
+    """Static collection of streaming exporters for transform hierarchies.
+    - Hierarchies are traversed iteratively and written transform by transform, so very large and deep hierarchies are supported.
+    - If space is 'local' or 'world' -> Positions, rotations as (w, x, y, z) and scales of that space are included."""
+
+    def getSpaces() -> list[str]:
+        """List of possible spaces of the exported properties."""
+        return list(['local', 'world'])
+
+    def toJson(root: Transform, stream: TextIO, space: str = None) -> None:
+        """Writes the hierarchy of the given transform as nested JSON objects to the text stream.
+        - Each transform is written as object with 'name', the optional properties and 'children'."""
+        # a transform with children leaves its list open, the lists are closed when the traversal returns to a lower depth
+        previous, opened = 0, True
+        for node, _, _, depth, properties in walk(root, space):
+            if not opened: stream.write(']}' * (previous - depth) + ',')
+            stream.write(f'{{"name": {json.dumps(node.Name)}')
+            for key, values in zip(('position', 'rotation', 'scale'), properties):
+                stream.write(f', "{key}": {json.dumps(list(values))}')
+            stream.write(', "children": [' if node.Children else '}')
+            previous, opened = depth, len(node.Children) > 0
+        stream.write(']}' * previous)
+
+    def toDot(root: Transform, stream: TextIO, space: str = None) -> None:
+        """Writes the hierarchy of the given transform as directed graph in the DOT language to the text stream.
+        - Transforms are identified by their index in depth first order and labeled with their name and the optional properties."""
+        nodes = walk(root, space)
+        stream.write(f'digraph "{quote(root.Name)}" {{\n')
+        for node, index, parent, _, properties in nodes:
+            label = '\\n'.join(quote(line) for line in [node.Name] + [f'{key}: {tuple(values)}' for key, values in zip('PRS', properties)])
+            stream.write(f'    n{index} [label="{label}"];\n')
+            if parent >= 0: stream.write(f'    n{parent} -> n{index};\n')
+        stream.write('}\n')
+
+
+def walk(root: Transform, space: str = None) -> Iterator[tuple[Transform, int, int, int, tuple]]:
+    # validates before the traversal starts, so nothing is written for invalid arguments
+    if space not in (None, 'local', 'world'): raise ValueError(f'given space "{space}" is invalid. Must be None, "local" or "world"')
+    return traverse(root, space)
+
+
+def traverse(root: Transform, space: str) -> Iterator[tuple[Transform, int, int, int, tuple]]:
+    # depth first traversal with index, parent index, depth and the properties of the requested space
+    # world properties are accumulated from the parents, instead of walking up the hierarchy for each transform
+
+    parent = root.Parent
+    base = (parent.SpaceWorld, parent.RotationWorld, parent.ScaleWorld) if parent and space == 'world' else (glm.mat4(), glm.quat(), glm.vec3(1))
+    stack = [(root, -1, 0, base)]
+    index = 0
+    while stack:
+        node, parentIndex, depth, (parentSpace, parentRotation, parentScale) = stack.pop()
+        world = base
+        if space == 'world':
+            world = (parentSpace * node.Space, parentRotation * node.Rotation, parentScale * node.Scale)
+            properties = (parentSpace * node.Position, world[1], world[2])
+        elif space == 'local':
+            properties = (node.Position, node.Rotation, node.Scale)
+        else:
+            properties = ()
+
+        yield (node, index, parentIndex, depth, properties)
+        stack.extend((child, index, depth + 1, world) for child in reversed(node.Children))
+        index += 1
+
+
+def quote(text: str) -> str:
+    # escapes text for quoted DOT strings
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,125 @@
+import numpy as np
+from typing import Union
+from . import arrays
+from .bvh import BoundingVolumeTree
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class FeatureDatabase:
+    """Contiguous database of per frame motion features with nearest neighbour search, like for motion matching.
+    - Features are joint positions, forward directions and velocities, relative to the position and rotation of a reference transform.
+    - Clips are given as local properties of the hierarchy with the shape (frames, transforms, ...), see 'Hierarchy'.
+    - Each feature group is normalized by its mean and average deviation over the whole database and weighted afterwards.
+    - Features are stored with the precision of the hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the features are computed from."""
+        return self._Hierarchy
+
+    @property
+    def Features(self) -> np.ndarray:
+        """Raw features of all frames with the shape (frames, dimension)."""
+        return self._Features
+
+    @property
+    def Clips(self) -> list[range]:
+        """Frame range in the database for each added clip."""
+        return self._Clips
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], positions: list = None, directions: list = None, velocities: list = None,
+                 reference: Union[Transform, str] = None, weights: tuple[float, float, float] = (1, 1, 1), frameTime: float = 1 / 30) -> None:
+        """Creates an empty database for the given hierarchy.
+        - Positions, directions and velocities are lists of transforms or their names, whose features are recorded.
+        - If reference is None -> Features are relative to the root of the hierarchy.
+        - Weights are applied to the normalized positions, directions and velocities.
+        - Frame time is the time in seconds between two frames, to compute velocities."""
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        self._Positions = np.array([self._Hierarchy.index(node) for node in positions or []], dtype=np.intp)
+        self._Directions = np.array([self._Hierarchy.index(node) for node in directions or []], dtype=np.intp)
+        self._Velocities = np.array([self._Hierarchy.index(node) for node in velocities or []], dtype=np.intp)
+        self._Reference = 0 if reference is None else self._Hierarchy.index(reference)
+        self._Weights = tuple(float(weight) for weight in weights)
+        self._FrameTime = frameTime
+
+        sizes = [3 * len(self._Positions), 3 * len(self._Directions), 3 * len(self._Velocities)]
+        if sum(sizes) == 0: raise ValueError('At least one transform for positions, directions or velocities is required')
+        self._Groups = [slice(start, start + size) for start, size in zip(np.cumsum([0] + sizes[:-1]), sizes)]
+
+        self._Features = np.zeros((0, sum(sizes)), dtype=self._Hierarchy.DType)
+        self._Clips = []
+        self._Tree = None
+
+    def __len__(self) -> int:
+        return len(self._Features)
+
+    def compute(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> np.ndarray:
+        """Computes the raw features of a clip, without adding them to the database.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - Velocities of the first frame are the same as of the second frame.
+
+        Returns features with the shape (frames, dimension)."""
+        worldPositions, worldRotations, _ = self._Hierarchy.toWorld(positions, rotations, scales)
+        if worldPositions.ndim == 2:
+            worldPositions, worldRotations = worldPositions[None], worldRotations[None]
+
+        origin = worldPositions[:, self._Reference, None, :]
+        inverse = arrays.quatConjugate(arrays.quatNormalize(worldRotations[:, self._Reference, None, :]))
+
+        jointPositions = arrays.quatRotate(inverse, worldPositions[:, self._Positions] - origin)
+        jointDirections = arrays.quatRotate(inverse, arrays.quatRotate(worldRotations[:, self._Directions], np.array((0, 0, -1), dtype=worldRotations.dtype)))
+        jointVelocities = np.zeros((len(worldPositions), len(self._Velocities), 3), dtype=worldPositions.dtype)
+        if len(worldPositions) > 1:
+            jointVelocities[1:] = (worldPositions[1:, self._Velocities] - worldPositions[:-1, self._Velocities]) / self._FrameTime
+        jointVelocities = arrays.quatRotate(inverse, jointVelocities)
+        if len(worldPositions) > 1:
+            jointVelocities[0] = jointVelocities[1]
+
+        frames = len(worldPositions)
+        return np.concatenate((jointPositions.reshape(frames, -1), jointDirections.reshape(frames, -1), jointVelocities.reshape(frames, -1)), axis=1)
+
+    def add(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> range:
+        """Computes the features of a clip and adds them to the database.
+        - Properties that are None are taken from the current local properties of the transforms, which adds the current pose.
+
+        Returns the frame range of the clip in the database."""
+        features = self.compute(positions, rotations, scales)
+        frames = range(len(self._Features), len(self._Features) + len(features))
+
+        self._Features = np.concatenate((self._Features, features))
+        self._Clips.append(frames)
+        self._Tree = None
+        return frames
+
+    def locate(self, index: int) -> tuple[int, int]:
+        """Returns the clip index and the frame within that clip for a frame index of the database."""
+        for clip, frames in enumerate(self._Clips):
+            if index in frames: return (clip, index - frames.start)
+        raise IndexError(f'Frame {index} is not in the database')
+
+    def normalize(self, features: np.ndarray) -> np.ndarray:
+        """Normalizes and weights raw features with the statistics of the database."""
+        self._update()
+        return (np.asarray(features, dtype=self._Features.dtype) - self._Mean) / self._Scale
+
+    def query(self, features: np.ndarray, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the k frames with the most similar features.
+        - Features are expected as raw features, like from 'compute()', with the shape (dimension,).
+
+        Returns the frame indices and distances of the normalized features, ordered by distance."""
+        self._update()
+        return self._Tree.queryNearest(self.normalize(features), k)
+
+    def _update(self) -> None:
+        # statistics and the search tree are updated lazy, after clips have been added
+        if self._Tree is not None: return
+        if len(self._Features) == 0: raise ValueError('The database is empty')
+
+        self._Mean = self._Features.mean(axis=0)
+        self._Scale = np.ones(self._Features.shape[1], dtype=self._Features.dtype)
+        for group, weight in zip(self._Groups, self._Weights):
+            deviation = self._Features[:, group].std(axis=0).mean() if group.stop > group.start else 0.0
+            self._Scale[group] = (deviation if deviation > 1e-6 else 1.0) / weight if weight > 0 else np.inf
+
+        self._Tree = BoundingVolumeTree((self._Features - self._Mean) / self._Scale)
@@ -0,0 +1,334 @@
+import glm
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+from . import arrays
+from .transform import Transform
+
+
+class Hierarchy:
+    """Flat and array based access to a transform hierarchy, for vectorized operations on whole poses and clips.
+    - Transforms are ordered like 'Transform.layout()', so parents are always listed before their children.
+    - Arrays have the transforms on the second last axis. Leading axes are free, like frames of a clip -> (frames, transforms, 3).
+    - Rotations are stored as (w, x, y, z), like the glm.quat constructor.
+    - Arrays are computed with the precision of 'DType', unless a dtype is given. Use float64 for accuracy over deep hierarchies and float32 to save memory.
+    - The structure is captured on creation. Create a new hierarchy after attaching or detaching transforms.
+    - Local properties of transforms that are stored in an 'ArrayStorage' are read and written as whole arrays.
+    - Conversions only read the transforms, so they can be called from many threads at once. With 'workers' the frames of a clip are split into ranges, which are evaluated on a thread pool."""
+
+    @property
+    def Root(self) -> Transform:
+        """Top most transform of the hierarchy."""
+        return self._Root
+
+    @property
+    def Nodes(self) -> list[Transform]:
+        """Transforms of the hierarchy in depth first order."""
+        return self._Nodes
+
+    @property
+    def Names(self) -> list[str]:
+        """Names of the transforms in depth first order."""
+        return [node.Name for node in self._Nodes]
+
+    @property
+    def Parents(self) -> np.ndarray:
+        """Index of the parent for each transform. The root has -1 as parent."""
+        return self._Parents
+
+    @property
+    def Depths(self) -> np.ndarray:
+        """Depth of each transform, where the root has a depth of 0."""
+        return self._Depths
+
+    @property
+    def DType(self) -> np.dtype:
+        """Floating point precision of computed arrays."""
+        return self._DType
+
+    @property
+    def Levels(self) -> list[np.ndarray]:
+        """Indices of the transforms for each depth, starting with depth 1. Processing them in order visits parents before their children."""
+        return self._Levels
+
+    def __init__(self, root: Transform, dtype: np.dtype = np.float64) -> None:
+        """Captures the hierarchy of the given root transform.
+        - If the root has a parent -> Its world space is considered for world properties, but it is not part of the hierarchy.
+        - Dtype is the default floating point precision of computed arrays."""
+        if not np.issubdtype(dtype, np.floating): raise ValueError(f'given dtype "{dtype}" is invalid. Must be a floating point type')
+        layout = root.layout()
+
+        self._DType = np.dtype(dtype)
+
+        self._Root = root
+        self._Nodes = [node for node, _, _ in layout]
+        self._Indices = {id(node): index for index, node in enumerate(self._Nodes)}
+        self._Depths = np.array([depth for _, _, depth in layout], dtype=np.int32)
+        self._Parents = np.array([-1] + [self._Indices[id(node.Parent)] for node in self._Nodes[1:]], dtype=np.int32)
+        self._Levels = [np.flatnonzero(self._Depths == depth) for depth in range(1, self._Depths.max() + 1)]
+
+        # transforms that are views of an 'ArrayStorage' in the same order are read and written as whole arrays
+        storage = getattr(root, '_Storage', None)
+        self._Storage = storage if storage is not None and len(self._Nodes) == len(storage) and all(
+            getattr(node, '_Storage', None) is storage and node._Index == index for index, node in enumerate(self._Nodes)) else None
+
+    def __len__(self) -> int:
+        return len(self._Nodes)
+
+    def __repr__(self) -> str:
+        return (f"{self.Root.Name}")
+
+    def __str__(self) -> str:
+        return (f"Root: {self.Root.Name}, Transforms: {len(self)}, Depth: {len(self._Levels) + 1}")
+
+    def __reduce__(self) -> tuple:
+        # transforms are pickled once with the root, instead of one subtree per transform
+        return (Hierarchy, (self._Root, self._DType))
+
+    def index(self, node: Union[Transform, str, int]) -> int:
+        """Returns the index of the given transform.
+        - If node is a string -> The index of the first transform with that name is returned.
+        - If node is an integer -> It is validated and returned as it is."""
+        if isinstance(node, (int, np.integer)):
+            if not 0 <= node < len(self._Nodes): raise ValueError(f'Index {node} is out of range for the hierarchy "{self.Root.Name}"')
+            return int(node)
+        if isinstance(node, str):
+            for index, item in enumerate(self._Nodes):
+                if item.Name == node: return index
+            raise ValueError(f'Transform "{node}" is not part of the hierarchy "{self.Root.Name}"')
+
+        if id(node) not in self._Indices: raise ValueError(f'Transform "{node.Name}" is not part of the hierarchy "{self.Root.Name}"')
+        return self._Indices[id(node)]
+
+    def getLocal(self, dtype: np.dtype = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the local positions, rotations and scales of all transforms."""
+        dtype = self._DType if dtype is None else dtype
+        if self._shared():
+            return (np.array(self._Storage.Positions, dtype=dtype), np.array(self._Storage.Rotations, dtype=dtype), np.array(self._Storage.Scales, dtype=dtype))
+        return (
+            np.array([tuple(node._Position) for node in self._Nodes], dtype=dtype),
+            np.array([tuple(node._Rotation) for node in self._Nodes], dtype=dtype),
+            np.array([tuple(node._Scale) for node in self._Nodes], dtype=dtype))
+
+    def setLocal(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> "Hierarchy":
+        """Writes the given local properties into the transforms.
+        - Properties that are None are not changed.
+
+        Returns itself."""
+        if self._shared():
+            for values, target, size in ((positions, self._Storage.Positions, 3), (rotations, self._Storage.Rotations, 4), (scales, self._Storage.Scales, 3)):
+                if values is not None: target[...] = self._validate(values, size)
+            return self
+        if positions is not None:
+            for node, value in zip(self._Nodes, self._validate(positions, 3).tolist()): node.Position = value
+        if rotations is not None:
+            for node, value in zip(self._Nodes, self._validate(rotations, 4).tolist()): node.Rotation = value
+        if scales is not None:
+            for node, value in zip(self._Nodes, self._validate(scales, 3).tolist()): node.Scale = value
+        return self
+
+    def snapshot(self) -> np.ndarray:
+        """Returns the local properties of all transforms as compact buffer, to restore them later with 'restore()'.
+        - The buffer has the shape (transforms, 10) with the position, rotation as (w, x, y, z) and scale of each transform.
+        - Values are stored as float32 like the properties of the transforms, so restoring them is lossless."""
+        return np.array([(*node._Position, *node._Rotation, *node._Scale) for node in self._Nodes], dtype=np.float32)
+
+    def restore(self, buffer: np.ndarray) -> "Hierarchy":
+        """Writes the local properties of a buffer from 'snapshot()' back into the transforms.
+        - Properties and cached spaces are replaced directly, without the copies and checks of the property setters.
+
+        Returns itself."""
+        buffer = np.asarray(buffer)
+        if buffer.shape != (len(self), 10): raise ValueError(f'Expected an array with shape ({len(self)}, 10), but got {buffer.shape}')
+
+        for node, values in zip(self._Nodes, buffer.tolist()):
+            node._Position = glm.vec3(values[0:3])
+            node._Rotation = glm.quat(values[3:7])
+            node._Scale = glm.vec3(values[7:10])
+            node._Space = None
+        return self
+
+    def getWorld(self, dtype: np.dtype = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the world positions, rotations and scales of all transforms."""
+        return self.toWorld(*self.getLocal(dtype), dtype=dtype)
+
+    def setWorld(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> "Hierarchy":
+        """Converts the given world properties in a single parent first pass to local space and writes them into the transforms.
+        - Properties that are None keep their current world space alignment.
+
+        Returns itself."""
+        return self.setLocal(*self.toLocal(positions, rotations, scales))
+
+    def toWorld(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None,
+                workers: int = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Converts local properties of all transforms, like a clip of frames, to world space.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - If workers is set -> Ranges of frames are evaluated on a thread pool with that many threads.
+        - The transforms are not changed.
+
+        Returns world positions, rotations and scales."""
+        positions, rotations, scales = self.complete(positions, rotations, scales)
+        return self._chunked(lambda *values: self._forward(*values)[1:], (positions, rotations, scales), dtype, workers)
+
+    def toSpaceWorld(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None,
+                     workers: int = None) -> np.ndarray:
+        """Converts local properties of all transforms, like a clip of frames, to world space matrices like 'Transform.SpaceWorld'.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - If workers is set -> Ranges of frames are evaluated on a thread pool with that many threads.
+        - The transforms are not changed.
+
+        Returns row major matrices with the shape (..., transforms, 4, 4)."""
+        positions, rotations, scales = self.complete(positions, rotations, scales)
+        return self._chunked(lambda *values: (self._spaces(*values),), (positions, rotations, scales), dtype, workers)[0]
+
+    def toLocal(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None,
+                workers: int = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Converts world properties of all transforms, like a clip of frames, to local space in a single parent first pass.
+        - Properties that are None are taken from the current world properties of the transforms.
+        - The result equals setting the world properties transform by transform, starting at the root.
+        - If workers is set -> Ranges of frames are evaluated on a thread pool with that many threads.
+        - The transforms are not changed.
+
+        Returns local positions, rotations and scales."""
+        positions, rotations, scales = self.complete(positions, rotations, scales, 'world')
+        return self._chunked(self._backward, (positions, rotations, scales), dtype, workers)
+
+    def pointsToWorld(self, node: Union[Transform, str, int], points: np.ndarray, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None) -> np.ndarray:
+        """Transforms points in the space of the given transform to world space, like 'Transform.pointToWorld'.
+        - Points have the shape (..., count, 3), leading axes are broadcasted with the ones of the given local properties.
+        - Properties that are None are taken from the current local properties of the transforms."""
+        space = self.toSpaceWorld(positions, rotations, scales, dtype)[..., self.index(node), None, :, :]
+        return arrays.matApply(space[..., :3, :3], np.asarray(points, dtype=space.dtype)) + space[..., :3, 3]
+
+    def pointsToLocal(self, node: Union[Transform, str, int], points: np.ndarray, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None) -> np.ndarray:
+        """Transforms points in world space to the space of the given transform, like 'Transform.pointToLocal'.
+        - Points have the shape (..., count, 3), leading axes are broadcasted with the ones of the given local properties.
+        - Properties that are None are taken from the current local properties of the transforms."""
+        space = self.toSpaceWorld(positions, rotations, scales, dtype)[..., self.index(node), None, :, :]
+        offsets = np.asarray(points, dtype=space.dtype) - space[..., :3, 3]
+        return np.linalg.solve(np.broadcast_to(space[..., :3, :3], offsets.shape + (3,)), offsets[..., None])[..., 0]
+
+    def directionsToWorld(self, node: Union[Transform, str, int], directions: np.ndarray, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None) -> np.ndarray:
+        """Transforms directions in the space of the given transform to world space, like 'Transform.directionToWorld'.
+        - Directions have the shape (..., count, 3), leading axes are broadcasted with the ones of the given local properties.
+        - Properties that are None are taken from the current local properties of the transforms."""
+        rotation = self.toWorld(positions, rotations, scales, dtype)[1][..., self.index(node), None, :]
+        return arrays.quatRotate(rotation, np.asarray(directions, dtype=rotation.dtype))
+
+    def directionsToLocal(self, node: Union[Transform, str, int], directions: np.ndarray, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, dtype: np.dtype = None) -> np.ndarray:
+        """Transforms directions in world space to the space of the given transform, like 'Transform.directionToLocal'.
+        - Directions have the shape (..., count, 3), leading axes are broadcasted with the ones of the given local properties.
+        - Properties that are None are taken from the current local properties of the transforms."""
+        rotation = self.toWorld(positions, rotations, scales, dtype)[1][..., self.index(node), None, :]
+        return arrays.quatRotate(arrays.quatInverse(rotation), np.asarray(directions, dtype=rotation.dtype))
+
+    def complete(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None, space: str = 'local') -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the given properties, those that are None are replaced by the current properties of the transforms.
+        - If space is 'local' -> Missing properties are taken from 'getLocal()', if 'world' -> from 'getWorld()'.
+        - The current properties are only read if a property is missing, given properties are returned as they are."""
+        if space not in ('world', 'local'): raise ValueError(f'given space "{space}" is invalid. Must be "world" or "local"')
+        values = (positions, rotations, scales)
+        if any(value is None for value in values):
+            current = self.getLocal() if space == 'local' else self.getWorld()
+            values = tuple(default if value is None else value for value, default in zip(values, current))
+        return values
+
+    def broadcast(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray, dtype: np.dtype = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Validates properties of all transforms and broadcasts their leading axes to a common shape, like a clip of positions with a single pose of scales.
+        - Properties have the shapes (..., transforms, 3), (..., transforms, 4) and (..., transforms, 3), otherwise a ValueError is raised.
+
+        Returns read only positions, rotations and scales with the same leading shape."""
+        positions = self._validate(positions, 3, dtype)
+        rotations = self._validate(rotations, 4, dtype)
+        scales = self._validate(scales, 3, dtype)
+        shape = np.broadcast_shapes(positions.shape[:-1], rotations.shape[:-1], scales.shape[:-1])
+        return (
+            np.broadcast_to(positions, shape + (3,)),
+            np.broadcast_to(rotations, shape + (4,)),
+            np.broadcast_to(scales, shape + (3,)))
+
+    def _shared(self) -> bool:
+        return self._Storage is not None and self._Storage.Active
+
+    def _validate(self, values: np.ndarray, size: int, dtype: np.dtype = None) -> np.ndarray:
+        values = np.asarray(values, dtype=self._DType if dtype is None else dtype)
+        if values.shape[-2:] != (len(self), size):
+            raise ValueError(f'Expected an array with shape (..., {len(self)}, {size}), but got {values.shape}')
+        return values
+
+    def _forward(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # world linear parts, positions, rotations and scales in a single parent first pass
+        linear = scales[..., None] * arrays.quatToMat(rotations)
+        worldLinear = np.empty_like(linear)
+        worldPositions = np.empty_like(positions)
+        worldRotations = np.empty_like(rotations)
+        worldScales = np.empty_like(scales)
+
+        baseLinear, basePosition, baseRotation, baseScale = self._base(positions.dtype)
+        worldLinear[..., 0, :, :] = baseLinear @ linear[..., 0, :, :]
+        worldPositions[..., 0, :] = arrays.matApply(baseLinear, positions[..., 0, :]) + basePosition
+        worldRotations[..., 0, :] = arrays.quatMultiply(baseRotation, rotations[..., 0, :])
+        worldScales[..., 0, :] = baseScale * scales[..., 0, :]
+
+        for level in self._Levels:
+            parents = self._Parents[level]
+            parentLinear = worldLinear[..., parents, :, :]
+            worldLinear[..., level, :, :] = parentLinear @ linear[..., level, :, :]
+            worldPositions[..., level, :] = arrays.matApply(parentLinear, positions[..., level, :]) + worldPositions[..., parents, :]
+            worldRotations[..., level, :] = arrays.quatMultiply(worldRotations[..., parents, :], rotations[..., level, :])
+            worldScales[..., level, :] = worldScales[..., parents, :] * scales[..., level, :]
+
+        return (worldLinear, worldPositions, worldRotations, worldScales)
+
+    def _backward(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # local positions, rotations and scales from world properties in a single parent first pass
+        localPositions = np.empty_like(positions)
+        localRotations = np.empty_like(rotations)
+        localScales = np.empty_like(scales)
+        worldLinear = np.empty(positions.shape + (3,), dtype=positions.dtype)
+
+        baseLinear, basePosition, baseRotation, baseScale = self._base(positions.dtype)
+        localRotations[..., 0, :] = arrays.quatMultiply(arrays.quatInverse(baseRotation), rotations[..., 0, :])
+        localScales[..., 0, :] = scales[..., 0, :] / baseScale
+        localPositions[..., 0, :] = arrays.matApply(np.linalg.inv(baseLinear), positions[..., 0, :] - basePosition)
+        worldLinear[..., 0, :, :] = baseLinear @ (localScales[..., 0, :, None] * arrays.quatToMat(localRotations[..., 0, :]))
+
+        for level in self._Levels:
+            parents = self._Parents[level]
+            localRotations[..., level, :] = arrays.quatMultiply(arrays.quatInverse(rotations[..., parents, :]), rotations[..., level, :])
+            localScales[..., level, :] = scales[..., level, :] / scales[..., parents, :]
+            localPositions[..., level, :] = np.linalg.solve(worldLinear[..., parents, :, :], (positions[..., level, :] - positions[..., parents, :])[..., None])[..., 0]
+            worldLinear[..., level, :, :] = worldLinear[..., parents, :, :] @ (localScales[..., level, :, None] * arrays.quatToMat(localRotations[..., level, :]))
+
+        return (localPositions, localRotations, localScales)
+
+    def _spaces(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        worldLinear, worldPositions, _, _ = self._forward(positions, rotations, scales)
+
+        spaces = np.zeros(worldPositions.shape[:-1] + (4, 4), dtype=worldPositions.dtype)
+        spaces[..., :3, :3] = worldLinear
+        spaces[..., :3, 3] = worldPositions
+        spaces[..., 3, 3] = 1
+        return spaces
+
+    def _chunked(self, function, values: tuple, dtype: np.dtype, workers: int) -> tuple:
+        # frames are independent, so ranges of them are evaluated in parallel while numpy releases the GIL
+        values = self.broadcast(*values, dtype)
+        shape = values[0].shape[:-2]
+        frames = int(np.prod(shape))
+        if workers is None or workers < 2 or frames < 2: return function(*values)
+
+        values = [value.reshape((frames,) + value.shape[-2:]) for value in values]
+        bounds = np.linspace(0, frames, min(workers, frames) + 1).astype(int).tolist()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda start, end: function(*(value[start:end] for value in values)), bounds[:-1], bounds[1:]))
+        return tuple(np.concatenate(parts).reshape(shape + parts[0].shape[1:]) for parts in zip(*results))
+
+    def _base(self, dtype: np.dtype) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # world space of the roots parent, as linear part, position, rotation and scale
+        parent = self._Root.Parent
+        if parent is None:
+            return (np.identity(3, dtype=dtype), np.zeros(3, dtype=dtype), np.array((1, 0, 0, 0), dtype=dtype), np.ones(3, dtype=dtype))
+
+        space = np.array(parent.SpaceWorld, dtype=dtype)
+        return (space[:3, :3], space[:3, 3], np.array(tuple(parent.RotationWorld), dtype=dtype), np.array(tuple(parent.ScaleWorld), dtype=dtype))
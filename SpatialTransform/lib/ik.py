@@ -0,0 +1,124 @@
+import numpy as np
+from typing import Union
+from . import arrays
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class IKChain:
+    """Inverse kinematics for a chain of transforms within a hierarchy, like a leg or an arm.
+    - The chain reaches from a start transform down to an end effector. All transforms of the chain, except the end effector, are rotated.
+    - Many frames or targets are solved at once. The world data of the chain is cached between iterations.
+    - Rotations are solved in world space like 'Transform.RotationWorld', which assumes uniform scales along the chain.
+    - Chains are solved with the precision of the hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the chain is part of."""
+        return self._Hierarchy
+
+    @property
+    def Joints(self) -> list[Transform]:
+        """Transforms of the chain, from the start to the end effector."""
+        return [self._Hierarchy.Nodes[index] for index in self._Joints]
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], start: Union[Transform, str], end: Union[Transform, str]) -> None:
+        """Selects the chain from the start transform down to the end effector.
+        - If hierarchy is a transform -> The hierarchy of it is used, so the start transform can be the root."""
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+
+        first = self._Hierarchy.index(start)
+        joints = [self._Hierarchy.index(end)]
+        while joints[-1] != first:
+            if joints[-1] < 0: raise ValueError(f'Transform "{self._Hierarchy.Nodes[joints[0]].Name}" is not a descendant of "{self._Hierarchy.Nodes[first].Name}"')
+            joints.append(self._Hierarchy.Parents[joints[-1]])
+        if len(joints) < 2: raise ValueError('The chain requires at least two transforms')
+
+        self._Joints = np.array(joints[::-1], dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self._Joints)
+
+    def __repr__(self) -> str:
+        return (f"{self._Hierarchy.Nodes[self._Joints[0]].Name} -> {self._Hierarchy.Nodes[self._Joints[-1]].Name}")
+
+    def solve(self, targets: np.ndarray, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None,
+              method: str = 'FABRIK', iterations: int = 10, tolerance: float = 1e-4) -> np.ndarray:
+        """Rotates the chain so the end effector reaches the given world targets.
+        - Targets have the shape (..., 3), the leading axes are broadcasted with the ones of the clip, to solve for many frames and or targets.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - Method is either 'FABRIK' or 'CCD'.
+        - Iterations stop early, if all end effectors are closer than the tolerance to their targets.
+        - The transforms are not changed.
+
+        Returns the local rotations of all transforms of the hierarchy."""
+        method = method.upper()
+        if method not in ('FABRIK', 'CCD'): raise ValueError(f'given method "{method}" is invalid. Must be "FABRIK" or "CCD"')
+
+        positions, rotations, scales = self._Hierarchy.complete(positions, rotations, scales)
+        targets = np.asarray(targets, dtype=self._Hierarchy.DType)
+        rotations = np.asarray(rotations, dtype=self._Hierarchy.DType)
+        shape = np.broadcast_shapes(targets.shape[:-1], np.shape(positions)[:-2], rotations.shape[:-2], np.shape(scales)[:-2])
+        targets = np.broadcast_to(targets, shape + (3,))
+        rotations = np.array(np.broadcast_to(rotations, shape + rotations.shape[-2:]))
+
+        worldPositions, worldRotations, _ = self._Hierarchy.toWorld(positions, rotations, scales)
+        points = np.array(np.broadcast_to(worldPositions[..., self._Joints, :], shape + (len(self._Joints), 3)))
+        orientations = np.array(np.broadcast_to(arrays.quatNormalize(worldRotations[..., self._Joints[:-1], :]), shape + (len(self._Joints) - 1, 4)))
+        parentOrientation = arrays.quatMultiply(orientations[..., 0, :], arrays.quatInverse(rotations[..., self._Joints[0], :]))
+
+        if method == 'CCD': solveCCD(points, orientations, targets, iterations, tolerance)
+        else: solveFABRIK(points, orientations, targets, iterations, tolerance)
+
+        parents = np.concatenate((parentOrientation[..., None, :], orientations[..., :-1, :]), axis=-2)
+        rotations[..., self._Joints[:-1], :] = arrays.quatMultiply(arrays.quatInverse(parents), orientations)
+        return rotations
+
+    def apply(self, target: np.ndarray, method: str = 'FABRIK', iterations: int = 10, tolerance: float = 1e-4) -> "IKChain":
+        """Solves the chain for a single world target in the current pose and writes the rotations into the transforms.
+
+        Returns itself."""
+        rotations = self.solve(target, method=method, iterations=iterations, tolerance=tolerance)
+        for index in self._Joints[:-1]:
+            self._Hierarchy.Nodes[index].Rotation = rotations[index].tolist()
+        return self
+
+
+def rotateChain(points: np.ndarray, orientations: np.ndarray, index: int, rotations: np.ndarray) -> None:
+    # rotates the chain beginning at the given joint around its position, in place
+    pivot = points[..., index, None, :]
+    points[..., index + 1:, :] = pivot + arrays.quatRotate(rotations[..., None, :], points[..., index + 1:, :] - pivot)
+    orientations[..., index:, :] = arrays.quatNormalize(arrays.quatMultiply(rotations[..., None, :], orientations[..., index:, :]))
+
+
+def reached(points: np.ndarray, targets: np.ndarray, tolerance: float) -> bool:
+    return bool(np.all(np.linalg.norm(points[..., -1, :] - targets, axis=-1) <= tolerance))
+
+
+def solveCCD(points: np.ndarray, orientations: np.ndarray, targets: np.ndarray, iterations: int, tolerance: float) -> None:
+    for _ in range(iterations):
+        if reached(points, targets, tolerance): return
+        for index in range(points.shape[-2] - 2, -1, -1):
+            pivot = points[..., index, :]
+            rotateChain(points, orientations, index, arrays.quatBetween(points[..., -1, :] - pivot, targets - pivot))
+
+
+def solveFABRIK(points: np.ndarray, orientations: np.ndarray, targets: np.ndarray, iterations: int, tolerance: float) -> None:
+    solved = points.copy()
+    lengths = np.linalg.norm(np.diff(points, axis=-2), axis=-1, keepdims=True)
+    for _ in range(iterations):
+        if reached(solved, targets, tolerance): break
+
+        solved[..., -1, :] = targets
+        for index in range(points.shape[-2] - 2, -1, -1):
+            direction = solved[..., index, :] - solved[..., index + 1, :]
+            solved[..., index, :] = solved[..., index + 1, :] + direction / np.maximum(np.linalg.norm(direction, axis=-1, keepdims=True), 1e-12) * lengths[..., index, :]
+
+        solved[..., 0, :] = points[..., 0, :]
+        for index in range(points.shape[-2] - 1):
+            direction = solved[..., index + 1, :] - solved[..., index, :]
+            solved[..., index + 1, :] = solved[..., index, :] + direction / np.maximum(np.linalg.norm(direction, axis=-1, keepdims=True), 1e-12) * lengths[..., index, :]
+
+    # the solved positions are converted to rotations, from the start to the end effector
+    for index in range(points.shape[-2] - 1):
+        rotateChain(points, orientations, index, arrays.quatBetween(points[..., index + 1, :] - points[..., index, :], solved[..., index + 1, :] - solved[..., index, :]))
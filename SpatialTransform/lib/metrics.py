@@ -0,0 +1,106 @@
+import numpy as np
+from typing import Union
+from . import arrays
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class PoseMetrics:
+    """Vectorized distances between poses or clips of a hierarchy, like for clustering, duplicate frame detection and evaluations.
+    - Poses are given as local properties (positions, rotations, scales) like 'Hierarchy.getLocal()', clips with the frames on the first axis.
+    - Position errors are the distances between the positions of each transform, rotation errors the geodesic angles in radians between the rotations.
+    - The aggregated distance is the weighted mean over the transforms of the position error plus the weighted rotation error.
+    - Pairwise distances of large clips are computed in blocks of frames, so the memory stays bounded.
+    - Metrics are computed with the precision of the hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the poses belong to."""
+        return self._Hierarchy
+
+    @property
+    def Weights(self) -> np.ndarray:
+        """Weight of each transform for the aggregated distance."""
+        return self._Weights
+
+    @property
+    def Space(self) -> str:
+        """Space the poses are compared in, 'world' or 'local'."""
+        return self._Space
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], weights: np.ndarray = None, rotationWeight: float = 1.0, space: str = 'world') -> None:
+        """Prepares the metrics for the given hierarchy.
+        - Weights has the shape (transforms,), if None -> All transforms are weighted equally.
+        - Rotation weight scales the rotation errors of the aggregated distance, like units per radian.
+        - If space is 'world' -> Poses are compared in world space, like 'Transform.PositionWorld' and 'Transform.RotationWorld'.
+        - If space is 'local' -> Poses are compared by their local properties.
+        - If hierarchy is a transform -> The hierarchy of it is used."""
+        if space not in ('world', 'local'): raise ValueError(f'given space "{space}" is invalid. Must be "world" or "local"')
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        self._Space = space
+        self._RotationWeight = rotationWeight
+
+        dtype = self._Hierarchy.DType
+        self._Weights = np.ones(len(self._Hierarchy), dtype=dtype) if weights is None else np.array(weights, dtype=dtype)
+        if self._Weights.shape != (len(self._Hierarchy),):
+            raise ValueError(f'Expected weights with shape ({len(self._Hierarchy)},), but got {self._Weights.shape}')
+        if np.any(self._Weights < 0) or not np.any(self._Weights): raise ValueError('Weights must not be negative and at least one must be positive')
+        self._Weights.flags.writeable = False
+
+    def __repr__(self) -> str:
+        return (f"{self._Hierarchy.Root.Name}: {self._Space}")
+
+    def positionErrors(self, a: tuple, b: tuple = None) -> np.ndarray:
+        """Distances between the positions of each transform of both poses or clips.
+        - Properties that are None, or the whole pose, are taken from the current local properties of the transforms.
+
+        Returns the errors with the shape (..., transforms)."""
+        return np.linalg.norm(self._properties(a)[0] - self._properties(b)[0], axis=-1)
+
+    def rotationErrors(self, a: tuple, b: tuple = None) -> np.ndarray:
+        """Geodesic angles in radians between the rotations of each transform of both poses or clips.
+        - Properties that are None, or the whole pose, are taken from the current local properties of the transforms.
+
+        Returns the errors with the shape (..., transforms)."""
+        return arrays.quatAngle(self._properties(a)[1], self._properties(b)[1])
+
+    def distance(self, a: tuple, b: tuple = None) -> np.ndarray:
+        """Aggregated distance between both poses or clips, frame by frame.
+        - Properties that are None, or the whole pose, are taken from the current local properties of the transforms.
+
+        Returns the distances with the leading shape of the poses, like (frames,) for clips or () for poses."""
+        return self._distance(self._properties(a), self._properties(b))
+
+    def pairwise(self, a: tuple, b: tuple = None, chunkSize: int = 64) -> np.ndarray:
+        """Aggregated distances between all frames of clip a and all frames of clip b.
+        - Clips have the shape (frames, transforms, ...). If b is None -> The frames of a are compared with each other.
+        - Blocks of up to 'chunkSize' x 'chunkSize' frames are compared at once, which bounds the temporary memory.
+
+        Returns the distance matrix with the shape (frames of a, frames of b)."""
+        if chunkSize < 1: raise ValueError('Chunk size must be at least 1')
+        first = self._properties(a)
+        second = first if b is None else self._properties(b)
+        if first[0].ndim != 3 or second[0].ndim != 3: raise ValueError('Clips must have exactly one leading axis for the frames')
+
+        rows, columns = len(first[0]), len(second[0])
+        result = np.zeros((rows, columns), dtype=self._Hierarchy.DType)
+        for row in range(0, rows, chunkSize):
+            # the distances between the frames of a single clip are symmetric, so only the upper blocks are computed
+            for column in range(row if b is None else 0, columns, chunkSize):
+                block = self._distance(
+                    tuple(values[row:row + chunkSize, None] for values in first),
+                    tuple(values[None, column:column + chunkSize] for values in second))
+                result[row:row + chunkSize, column:column + chunkSize] = block
+                if b is None and column != row: result[column:column + chunkSize, row:row + chunkSize] = block.T
+        return result
+
+    def _properties(self, values: tuple) -> tuple[np.ndarray, np.ndarray]:
+        # positions and rotations of the compared space
+        values = self._Hierarchy.complete(*(() if values is None else values))
+        if self._Space == 'world': return self._Hierarchy.toWorld(*values)[:2]
+        return self._Hierarchy.broadcast(*values)[:2]
+
+    def _distance(self, a: tuple, b: tuple) -> np.ndarray:
+        errors = np.linalg.norm(a[0] - b[0], axis=-1)
+        if self._RotationWeight: errors = errors + self._RotationWeight * arrays.quatAngle(a[1], b[1])
+        return (errors @ self._Weights) / np.sum(self._Weights)
@@ -7,17 +7,18 @@ class Pose:
     - ONLY provides properties and methods for local space.
     - There is no parent child relation between poses
     - Space is defined as right handed where -> Y+ is up, and X+ is right and Z- is forward.
-    - Positive rotations are counter clockwise."""
+    - Positive rotations are counter clockwise.
+    - Reading properties is thread safe, also while other threads read. Changing properties while other threads read them is not synchronized."""
 
     @property
     def Space(self) -> glm.mat4:
         """Transform space with properties."""
-        if self.__isOutdated:
-            self._Space = glm.translate(self.Position)
-            self._Space = glm.scale(self._Space, self.Scale)
-            self._Space = self._Space * glm.mat4_cast(self.Rotation)
-            self.__isOutdated = False
-        return glm.mat4(self._Space)
+        # the cache is computed locally and published with a single assignment, so concurrent readers never see a partial space
+        space = self._Space
+        if space is None:
+            space = glm.scale(glm.translate(self._Position), self._Scale) * glm.mat4_cast(self._Rotation)
+            self._Space = space
+        return glm.mat4(space)
 
     @property
     def SpaceInverse(self) -> glm.mat4:
@@ -32,7 +33,7 @@ class Pose:
     @Position.setter
     def Position(self, value: glm.vec3) -> None:
         self._Position = glm.vec3(value)
-        self.__isOutdated = True
+        self._Space = None
 
     @property
     def Rotation(self) -> glm.quat:
@@ -42,7 +43,7 @@ class Pose:
     @Rotation.setter
     def Rotation(self, value: glm.quat) -> None:
         self._Rotation = glm.quat(value)
-        self.__isOutdated = True
+        self._Space = None
 
     @property
     def Scale(self) -> glm.vec3:
@@ -52,7 +53,7 @@ class Pose:
     @Scale.setter
     def Scale(self, value: glm.vec3) -> None:
         self._Scale = glm.vec3(value)
-        self.__isOutdated = True
+        self._Space = None
 
     @property
     def Forward(self) -> glm.vec3:
@@ -72,11 +73,10 @@ class Pose:
     def __init__(self, position: glm.vec3 = None, rotation: glm.quat = None, scale: glm.vec3 = None) -> None:
         """Creates a new pose."""
 
-        self._Space = glm.mat4(1)
+        self._Space: glm.mat4 = None
         self._Position = glm.vec3() if position is None else glm.vec3(position)
         self._Rotation = glm.quat() if rotation is None else glm.quat(rotation)
         self._Scale = glm.vec3(1) if scale is None else glm.vec3(scale)
-        self.__isOutdated = True
 
     def __repr__(self) -> str:
         return (f"Pos: {self.Position}, Rot: {self.Rotation}, Scale: {self.Scale}")
@@ -84,6 +84,9 @@ class Pose:
     def __str__(self) -> str:
         return self.__repr__()
 
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (tuple(self._Position), tuple(self._Rotation), tuple(self._Scale)))
+
     def reset(self) -> "Pose":
         self.Position = glm.vec3(0)
         self.Rotation = glm.quat()
@@ -0,0 +1,131 @@
+import re
+import numpy as np
+from typing import Union
+from . import arrays
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class Retarget:
+    """Transfers clips between hierarchies with different names and proportions.
+    - The joint mapping and the rest pose offsets are resolved once, on creation. The current poses are the rest poses.
+    - Rotations are transferred in world space, so different rest poses are compensated.
+    - Target transforms without a mapping keep their rest rotation, all target transforms keep their rest positions and scales.
+    - The root motion is scaled by the ratio of the leg lengths.
+    - Clips are retargeted with the precision of the target hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the clips are retargeted from."""
+        return self._Source
+
+    @property
+    def Target(self) -> Hierarchy:
+        """Hierarchy the clips are retargeted to."""
+        return self._Target
+
+    @property
+    def Mapping(self) -> dict[str, str]:
+        """Names of the mapped source transforms and their target transforms."""
+        return {self._Source.Nodes[source].Name: self._Target.Nodes[target].Name for source, target in zip(self._SourceJoints, self._TargetJoints)}
+
+    @property
+    def Ratio(self) -> float:
+        """Scale of the root motion from the source to the target."""
+        return self._Ratio
+
+    def __init__(self, source: Union[Transform, Hierarchy], target: Union[Transform, Hierarchy], mapping: dict[str, str] = None,
+                 sourceLeg: list = None, targetLeg: list = None, ratio: float = None) -> None:
+        """Resolves the mapping between the given hierarchies in their current pose.
+        - If mapping is None -> Transforms are mapped by their names, ignoring case, namespaces like 'rig:' and non alphanumeric characters.
+        - If mapping is set -> It maps source to target names.
+        - The shallowest mapped source transform carries the root motion, like the hips.
+        - Legs are lists of transforms or names from the hip to the foot. If not set, the rest height of the root motion transform is used.
+        - If ratio is set -> It is used as scale of the root motion, instead of the leg lengths."""
+        self._Source = source if isinstance(source, Hierarchy) else Hierarchy(source)
+        self._Target = target if isinstance(target, Hierarchy) else Hierarchy(target)
+
+        if mapping is None:
+            targetNames = {}
+            for index, name in enumerate(self._Target.Names): targetNames.setdefault(normalizeName(name), index)
+            pairs = [(index, targetNames.get(normalizeName(name))) for index, name in enumerate(self._Source.Names)]
+        else:
+            pairs = [(self._Source.index(sourceName), self._Target.index(targetName)) for sourceName, targetName in mapping.items()]
+        pairs = sorted((source, target) for source, target in pairs if target is not None)
+        if len(pairs) == 0: raise ValueError(f'No transforms of "{self._Source.Root.Name}" could be mapped to "{self._Target.Root.Name}"')
+        if len({target for _, target in pairs}) != len(pairs): raise ValueError('Target transforms must be mapped only once')
+
+        self._SourceJoints = np.array([source for source, _ in pairs], dtype=np.intp)
+        self._TargetJoints = np.array([target for _, target in pairs], dtype=np.intp)
+        self._Mapped = np.full(len(self._Target), -1, dtype=np.intp)
+        self._Mapped[self._TargetJoints] = np.arange(len(pairs))
+
+        # rest pose
+        sourceWorld = self._Source.getWorld(self._Target.DType)
+        targetWorld = self._Target.getWorld()
+        self._TargetLocal = self._Target.getLocal()
+        self._TargetRestRotations = targetWorld[1]
+        self._Offsets = arrays.quatMultiply(arrays.quatInverse(sourceWorld[1][self._SourceJoints]), targetWorld[1][self._TargetJoints])
+        self._BaseInverse = arrays.quatMultiply(self._TargetLocal[1][0], arrays.quatInverse(targetWorld[1][0]))
+
+        # root motion
+        self._SourceRoot, self._TargetRoot = pairs[np.argmin(self._Source.Depths[self._SourceJoints])]
+        self._SourceRootRest = sourceWorld[0][self._SourceRoot]
+        self._TargetRootRest = targetWorld[0][self._TargetRoot]
+        if ratio is None:
+            sourceLength = legLength(self._Source, sourceWorld[0], sourceLeg, self._SourceRoot)
+            targetLength = legLength(self._Target, targetWorld[0], targetLeg, self._TargetRoot)
+            ratio = targetLength / sourceLength if sourceLength > 0 else 1.0
+        self._Ratio = float(ratio)
+
+    def __repr__(self) -> str:
+        return (f"{self._Source.Root.Name} -> {self._Target.Root.Name}")
+
+    def __str__(self) -> str:
+        return (f"Source: {self._Source.Root.Name}, Target: {self._Target.Root.Name}, Mapped: {len(self._SourceJoints)}, Ratio: {self._Ratio}")
+
+    def retarget(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retargets local properties of the source, like a clip of frames, to the target.
+        - Properties that are None are taken from the current local properties of the source transforms.
+        - The transforms are not changed, use 'Target.setLocal()' to apply a single frame.
+
+        Returns local positions, rotations and scales of the target."""
+        sourcePositions, sourceRotations, _ = self._Source.toWorld(positions, rotations, scales, self._Target.DType)
+        frames = sourceRotations.shape[:-2]
+
+        # world rotations, transforms without mapping follow their parents with their rest rotation
+        mappedRotations = arrays.quatMultiply(sourceRotations[..., self._SourceJoints, :], self._Offsets)
+        worldRotations = np.empty(frames + (len(self._Target), 4), dtype=sourceRotations.dtype)
+        worldRotations[..., 0, :] = mappedRotations[..., self._Mapped[0], :] if self._Mapped[0] >= 0 else self._TargetRestRotations[0]
+        for level in self._Target.Levels:
+            mapped = self._Mapped[level]
+            follow = arrays.quatMultiply(worldRotations[..., self._Target.Parents[level], :], self._TargetLocal[1][level])
+            worldRotations[..., level, :] = np.where((mapped >= 0)[:, None], mappedRotations[..., np.maximum(mapped, 0), :], follow)
+
+        localRotations = np.empty_like(worldRotations)
+        localRotations[..., 0, :] = arrays.quatMultiply(self._BaseInverse, worldRotations[..., 0, :])
+        localRotations[..., 1:, :] = arrays.quatMultiply(arrays.quatInverse(worldRotations[..., self._Target.Parents[1:], :]), worldRotations[..., 1:, :])
+
+        # root motion, relative to the world space of the roots parent
+        localPositions = np.array(np.broadcast_to(self._TargetLocal[0], frames + self._TargetLocal[0].shape))
+        localScales = np.array(np.broadcast_to(self._TargetLocal[2], frames + self._TargetLocal[2].shape))
+        rootPositions = self._TargetRootRest + (sourcePositions[..., self._SourceRoot, :] - self._SourceRootRest) * self._Ratio
+        parent = self._Target.Parents[self._TargetRoot]
+        if parent < 0:
+            parentSpaces = np.broadcast_to(np.array(self._Target.Root.Parent.SpaceWorld if self._Target.Root.Parent else np.identity(4), dtype=sourceRotations.dtype), frames + (4, 4))
+        else:
+            parentSpaces = self._Target.toSpaceWorld(localPositions, localRotations, localScales)[..., parent, :, :]
+        localPositions[..., self._TargetRoot, :] = np.linalg.solve(parentSpaces[..., :3, :3], (rootPositions - parentSpaces[..., :3, 3])[..., None])[..., 0]
+
+        return (localPositions, localRotations, localScales)
+
+
+def normalizeName(name: str) -> str:
+    return re.sub(r'[^0-9a-z]', '', name.lower().rsplit(':', 1)[-1].rsplit('|', 1)[-1])
+
+
+def legLength(hierarchy: Hierarchy, positions: np.ndarray, leg: list, root: int) -> float:
+    if leg is None:
+        return float(positions[root, 1] - positions[:, 1].min())
+    joints = [hierarchy.index(node) for node in leg]
+    return float(np.sum(np.linalg.norm(np.diff(positions[joints], axis=0), axis=1)))
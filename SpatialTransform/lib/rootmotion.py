@@ -0,0 +1,91 @@
+import numpy as np
+from typing import Union
+from . import arrays
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class RootMotion:
+    """Splits clips into the root motion on the ground and the motion of all transforms relative to it, like for machine learning datasets.
+    - The root motion follows a chosen transform, like the hips, projected onto the ground plane (XZ) with the Y+ axis as up.
+    - The heading is the rotation around the Y+ axis towards the projected facing direction of the chosen transform.
+    - Clips are given as local properties of the hierarchy with the frames on the first axis, like (frames, transforms, ...).
+    - Root motion is computed with the precision of the hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the root motion is extracted from."""
+        return self._Hierarchy
+
+    @property
+    def Joint(self) -> Transform:
+        """Transform the root motion follows."""
+        return self._Hierarchy.Nodes[self._Joint]
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], joint: Union[Transform, str, int], forward: np.ndarray = (0, 0, -1)) -> None:
+        """Selects the transform the root motion follows.
+        - Forward is the local axis of the transform, which is considered as its facing direction.
+        - If hierarchy is a transform -> The hierarchy of it is used."""
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        self._Joint = self._Hierarchy.index(joint)
+        self._Forward = np.asarray(forward, dtype=self._Hierarchy.DType)
+        if self._Forward.shape != (3,) or not np.any(self._Forward): raise ValueError('Forward must be a direction with three components')
+
+    def __repr__(self) -> str:
+        return (f"{self._Hierarchy.Root.Name}: {self.Joint.Name}")
+
+    def extract(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> tuple[np.ndarray, np.ndarray]:
+        """Extracts the root motion on the ground for each frame.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - If the facing is vertical -> The heading of the previous frame is kept, or no rotation for the first frames.
+
+        Returns the ground positions (..., 3) and the headings as rotations (..., 4) around the Y+ axis."""
+        worldPositions, worldRotations, _ = self._Hierarchy.toWorld(positions, rotations, scales)
+        return self._ground(worldPositions[..., self._Joint, :], worldRotations[..., self._Joint, :])
+
+    def toRelative(self, positions: np.ndarray = None, rotations: np.ndarray = None, scales: np.ndarray = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Converts local properties of all transforms to the space of the root motion, for each frame.
+        - Properties that are None are taken from the current local properties of the transforms.
+        - Directions are the forward directions like 'Transform.ForwardWorld', relative to the heading.
+
+        Returns relative positions, rotations and directions of all transforms."""
+        worldPositions, worldRotations, _ = self._Hierarchy.toWorld(positions, rotations, scales)
+        trajectory, headings = self._ground(worldPositions[..., self._Joint, :], worldRotations[..., self._Joint, :])
+
+        inverse = arrays.quatConjugate(headings)[..., None, :]
+        relativeRotations = arrays.quatMultiply(inverse, worldRotations)
+        return (
+            arrays.quatRotate(inverse, worldPositions - trajectory[..., None, :]),
+            relativeRotations,
+            arrays.quatRotate(relativeRotations, np.array((0, 0, -1), dtype=worldRotations.dtype)))
+
+    def toWorld(self, trajectory: np.ndarray, headings: np.ndarray, positions: np.ndarray, rotations: np.ndarray = None) -> tuple[np.ndarray, np.ndarray]:
+        """Converts relative positions and rotations, like from 'toRelative()', back to world space with the given root motion.
+        - Trajectory and headings have the shape (..., 3) and (..., 4), relative properties (..., transforms, 3) and (..., transforms, 4).
+
+        Returns world positions and rotations. Rotations are None if no relative rotations are given."""
+        dtype = self._Hierarchy.DType
+        headings = np.asarray(headings, dtype=dtype)[..., None, :]
+        worldPositions = arrays.quatRotate(headings, np.asarray(positions, dtype=dtype)) + np.asarray(trajectory, dtype=dtype)[..., None, :]
+        worldRotations = None if rotations is None else arrays.quatMultiply(headings, np.asarray(rotations, dtype=dtype))
+        return (worldPositions, worldRotations)
+
+    def _ground(self, positions: np.ndarray, rotations: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # ground projected positions and headings, frames without a horizontal facing take the heading of the previous frame
+        trajectory = positions * np.array((1, 0, 1), dtype=positions.dtype)
+        facing = arrays.quatRotate(rotations, self._Forward.astype(positions.dtype))
+        angles = np.arctan2(-facing[..., 0], -facing[..., 2])
+
+        valid = np.hypot(facing[..., 0], facing[..., 2]) > 1e-6
+        if not np.all(valid):
+            if angles.ndim > 0:
+                filled = np.where(valid, np.arange(len(angles)).reshape((-1,) + (1,) * (angles.ndim - 1)), 0)
+                filled = np.maximum.accumulate(filled, axis=0)
+                angles = np.take_along_axis(angles, filled, axis=0)
+                valid = np.take_along_axis(valid, filled, axis=0)
+            angles = np.where(valid, angles, 0)
+
+        headings = np.zeros(angles.shape + (4,), dtype=positions.dtype)
+        headings[..., 0] = np.cos(angles * 0.5)
+        headings[..., 2] = np.sin(angles * 0.5)
+        return (trajectory, headings)
@@ -0,0 +1,76 @@
+import numpy as np
+from typing import Union
+from .bvh import BoundingVolumeTree
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class SpatialIndex:
+    """Spatial index over the world positions of all transforms of one or more hierarchies.
+    - Supports radius, nearest neighbour, box and ray queries, which return the matching transforms.
+    - Positions are captured on creation and by 'refit()'. After poses change, refit the index instead of creating a new one.
+    - Positions are stored with the precision of the first hierarchy, see 'Hierarchy.DType'."""
+
+    @property
+    def Hierarchies(self) -> list[Hierarchy]:
+        """Indexed hierarchies."""
+        return self._Hierarchies
+
+    @property
+    def Nodes(self) -> list[Transform]:
+        """Indexed transforms, in order of the hierarchies."""
+        return self._Nodes
+
+    @property
+    def Positions(self) -> np.ndarray:
+        """World positions of the indexed transforms, as captured by the last refit."""
+        return self._Tree.Points
+
+    def __init__(self, *roots: Union[Transform, Hierarchy], leafSize: int = 8) -> None:
+        """Creates the index over the world positions of the given hierarchies."""
+        if len(roots) == 0: raise ValueError('At least one hierarchy is required')
+
+        self._Hierarchies = [root if isinstance(root, Hierarchy) else Hierarchy(root) for root in roots]
+        self._Nodes = [node for hierarchy in self._Hierarchies for node in hierarchy.Nodes]
+        self._Tree = BoundingVolumeTree(self._capture(), leafSize=leafSize)
+
+    def __len__(self) -> int:
+        return len(self._Nodes)
+
+    def refit(self, positions: np.ndarray = None) -> "SpatialIndex":
+        """Updates the index to the changed world positions, without rebuilding it.
+        - If positions is None -> The current world positions are read from the hierarchies.
+        - If positions is set -> They are expected in the order of 'Nodes', like from a clip frame.
+
+        Returns itself."""
+        self._Tree.refit(self._capture() if positions is None else positions)
+        return self
+
+    def rebuild(self) -> "SpatialIndex":
+        """Rebuilds the index from the current world positions of the hierarchies.
+        - Queries stay fast after large changes, which are not well handled by 'refit()'.
+
+        Returns itself."""
+        self._Tree.refit(self._capture()).rebuild()
+        return self
+
+    def queryRadius(self, point: np.ndarray, radius: float) -> list[Transform]:
+        """Returns all transforms within the radius around the given world point."""
+        return [self._Nodes[index] for index in self._Tree.queryRadius(point, radius)]
+
+    def queryBox(self, minimum: np.ndarray, maximum: np.ndarray) -> list[Transform]:
+        """Returns all transforms within the axis aligned world box."""
+        return [self._Nodes[index] for index in self._Tree.queryBox(minimum, maximum)]
+
+    def queryNearest(self, point: np.ndarray, k: int = 1) -> list[tuple[Transform, float]]:
+        """Returns the k nearest transforms to the given world point with their distance, ordered by distance."""
+        indices, distances = self._Tree.queryNearest(point, k)
+        return [(self._Nodes[index], distance) for index, distance in zip(indices, distances.tolist())]
+
+    def queryRay(self, origin: np.ndarray, direction: np.ndarray, k: int = 1) -> list[tuple[Transform, float]]:
+        """Returns the k nearest transforms to the given world ray with their distance, ordered by distance."""
+        indices, distances = self._Tree.queryRay(origin, direction, k)
+        return [(self._Nodes[index], distance) for index, distance in zip(indices, distances.tolist())]
+
+    def _capture(self) -> np.ndarray:
+        return np.concatenate([hierarchy.getWorld(self._Hierarchies[0].DType)[0] for hierarchy in self._Hierarchies])
@@ -0,0 +1,132 @@
+import glm
+import numpy as np
+from typing import Union
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+class ArrayStorage:
+    """Stores the local properties of all transforms of a hierarchy as rows of shared arrays, instead of separate glm values per transform.
+    - The transforms become views of their rows. Scalar properties and methods read and write the arrays, and changes of the arrays are seen by the transforms, without copies.
+    - Rows follow the order of 'Hierarchy.Nodes'. Hierarchies of the same transforms in the same order read and write the arrays as a whole, see 'Hierarchy.getLocal'.
+    - Rotations are stored as (w, x, y, z). The default precision is float32, like the glm values of the transforms.
+    - Spaces of views are not cached, as the arrays can be changed at any time. Every read of 'Space' or a world property rebuilds the matrices of the transform and its parents, for many reads use 'Hierarchy.getWorld()' instead.
+    - Transforms keep their rows when the hierarchy changes, transforms created later store their properties as glm values.
+    - Views keep the class of the transforms, so they are still instances of it."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the rows belong to."""
+        return self._Hierarchy
+
+    @property
+    def Positions(self) -> np.ndarray:
+        """Local positions of all transforms with the shape (transforms, 3)."""
+        return self._Positions
+
+    @property
+    def Rotations(self) -> np.ndarray:
+        """Local rotations of all transforms with the shape (transforms, 4)."""
+        return self._Rotations
+
+    @property
+    def Scales(self) -> np.ndarray:
+        """Local scales of all transforms with the shape (transforms, 3)."""
+        return self._Scales
+
+    @property
+    def Active(self) -> bool:
+        """Whether the transforms are views of the rows, until 'release()' is called."""
+        return self._Active
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], dtype: np.dtype = np.float32) -> None:
+        """Moves the current local properties of all transforms into the arrays and turns the transforms into views of their rows.
+        - If hierarchy is a transform -> The hierarchy of it is used."""
+        if not np.issubdtype(dtype, np.floating): raise ValueError(f'given dtype "{dtype}" is invalid. Must be a floating point type')
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        if any(isinstance(node, View) for node in self._Hierarchy.Nodes): raise ValueError('Transforms are already stored in arrays')
+
+        self._Positions, self._Rotations, self._Scales = self._Hierarchy.getLocal(dtype)
+        for index, node in enumerate(self._Hierarchy.Nodes):
+            share(node, self, index)
+        self._Active = True
+        self._Hierarchy._Storage = self
+
+    def __len__(self) -> int:
+        return len(self._Positions)
+
+    def __repr__(self) -> str:
+        return (f"{self._Hierarchy.Root.Name}: {len(self)}")
+
+    def release(self) -> "ArrayStorage":
+        """Copies the rows back into glm values of the transforms, afterwards the transforms and arrays are independent.
+
+        Returns itself."""
+        for node in self._Hierarchy.Nodes:
+            if isinstance(node, View) and node._Storage is self: unshare(node)
+        self._Active = False
+        return self
+
+
+class View:
+    """Local properties of a transform, which are read from and written to a row of an 'ArrayStorage'."""
+    # the properties replace the attributes of 'Pose', so all scalar methods work unchanged
+
+    _Transient = Transform._Transient | {'_Storage', '_Index'}
+
+    @property
+    def _Position(self) -> glm.vec3:
+        return glm.vec3(self._Storage._Positions[self._Index].tolist())
+
+    @_Position.setter
+    def _Position(self, value: glm.vec3) -> None:
+        self._Storage._Positions[self._Index] = tuple(value)
+
+    @property
+    def _Rotation(self) -> glm.quat:
+        return glm.quat(self._Storage._Rotations[self._Index].tolist())
+
+    @_Rotation.setter
+    def _Rotation(self, value: glm.quat) -> None:
+        self._Storage._Rotations[self._Index] = tuple(value)
+
+    @property
+    def _Scale(self) -> glm.vec3:
+        return glm.vec3(self._Storage._Scales[self._Index].tolist())
+
+    @_Scale.setter
+    def _Scale(self, value: glm.vec3) -> None:
+        self._Storage._Scales[self._Index] = tuple(value)
+
+    @property
+    def _Space(self) -> glm.mat4:
+        return None
+
+    @_Space.setter
+    def _Space(self, value: glm.mat4) -> None:
+        pass
+
+
+# view classes are created once per transform class, their '_Base' is the original class, which is also used for copies
+Views: dict[type, type] = {}
+
+
+def share(node: Transform, storage: ArrayStorage, index: int) -> None:
+    # turns the transform into a view of the row, the glm values are dropped as the row already holds them
+    base = type(node)
+    if base not in Views:
+        Views[base] = type(f'{base.__name__}View', (View, base), {'__module__': base.__module__, '_Base': base})
+
+    node.__class__ = Views[base]
+    for name in ('_Position', '_Rotation', '_Scale', '_Space'):
+        node.__dict__.pop(name, None)
+    node._Storage = storage
+    node._Index = index
+
+
+def unshare(node: Transform) -> None:
+    values = (node._Position, node._Rotation, node._Scale)
+    node.__class__ = type(node)._Base
+    del node._Storage, node._Index
+    node._Position, node._Rotation, node._Scale = values
+    node._Space = None
@@ -0,0 +1,149 @@
+import asyncio
+import time
+import numpy as np
+from typing import AsyncIterable, AsyncIterator, Union
+from .euler import Euler
+from .hierarchy import Hierarchy
+from .transform import Transform
+
+
+# marks the end of the stream, errors are passed downstream as exceptions
+End = object()
+
+
+class PoseStream:
+    """Asynchronous pipeline that converts a live stream of local frames to world space.
+    - Frames are read from an async iterator, like a socket reader or a queue, and converted in batches to share the costs.
+    - Stages are connected by bounded queues. A slow consumer pauses the reading of frames, instead of buffering them without limit.
+    - Frames are (positions, rotations, scales) like 'Hierarchy.getLocal()' or, if an euler order is set, (positions, degrees).
+    - Conversions run in a worker thread, so the event loop stays responsive.
+    - The latency of every stage is measured, see 'Latency'."""
+
+    @property
+    def Source(self) -> Hierarchy:
+        """Hierarchy the frames are applied to."""
+        return self._Hierarchy
+
+    @property
+    def Latency(self) -> dict[str, tuple[int, float, float]]:
+        """Count, mean and maximum seconds for each stage.
+        - 'batch': From the first frame of a batch until the batch is complete.
+        - 'convert': Conversion of a batch to world space.
+        - 'total': From reading a frame until its result is taken by the consumer."""
+        return {name: (count, total / count, maximum) for name, (count, total, maximum) in self._Latency.items()}
+
+    def __init__(self, hierarchy: Union[Transform, Hierarchy], batchSize: int = 8, maxDelay: float = 0.01, queueSize: int = 4,
+                 order: str = None, extrinsic: bool = True, apply: bool = False) -> None:
+        """Creates the pipeline for the given hierarchy.
+        - Batches are converted as soon as they hold 'batchSize' frames or their first frame waited 'maxDelay' seconds.
+        - Queues between the stages hold up to 'queueSize' batches.
+        - If order is set -> Frames carry euler angles in degrees instead of rotations, the scales of the transforms at the creation of the stream are used.
+        - If apply is True -> The latest frame of every batch is written into the transforms."""
+        if batchSize < 1: raise ValueError('Batch size must be at least 1')
+        if queueSize < 1: raise ValueError('Queue size must be at least 1')
+
+        self._Hierarchy = hierarchy if isinstance(hierarchy, Hierarchy) else Hierarchy(hierarchy)
+        self._BatchSize = batchSize
+        self._MaxDelay = maxDelay
+        self._QueueSize = queueSize
+        self._Order = order
+        self._Extrinsic = extrinsic
+        self._Apply = apply
+        self._Scales = self._Hierarchy.getLocal()[2]
+        self._Latency: dict[str, tuple[int, float, float]] = {}
+
+    def __repr__(self) -> str:
+        return (f"{self._Hierarchy.Root.Name}")
+
+    async def process(self, frames: AsyncIterable) -> AsyncIterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Reads local frames from the given async iterator and yields their world positions, rotations and scales, frame by frame and in order.
+        - Errors of the source or the conversion are raised to the consumer."""
+        frameQueue = asyncio.Queue(self._QueueSize * self._BatchSize)
+        batchQueue = asyncio.Queue(self._QueueSize)
+        resultQueue = asyncio.Queue(self._QueueSize)
+        tasks = [asyncio.ensure_future(stage) for stage in (
+            self._read(frames, frameQueue),
+            self._batch(frameQueue, batchQueue),
+            self._convert(batchQueue, resultQueue))]
+
+        try:
+            while True:
+                item = await resultQueue.get()
+                if item is End: break
+                if isinstance(item, Exception): raise item
+
+                arrivals, world = item
+                for index, arrival in enumerate(arrivals):
+                    self._measure('total', arrival)
+                    yield tuple(values[index] for values in world)
+        finally:
+            # the stages are awaited after cancelling, so none of them outlives the stream
+            for task in tasks: task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _read(self, frames: AsyncIterable, target: asyncio.Queue) -> None:
+        try:
+            async for frame in frames:
+                await target.put((time.perf_counter(), frame))
+            await target.put(End)
+        except Exception as error:
+            await target.put(error)
+
+    async def _batch(self, source: asyncio.Queue, target: asyncio.Queue) -> None:
+        # a read that is still pending when the delay ends is kept for the next batch, so no frame is dropped
+        getter = None
+        try:
+            while True:
+                item = await (source.get() if getter is None else getter)
+                getter = None
+                batch, start = [], time.perf_counter()
+                while isinstance(item, tuple):
+                    batch.append(item)
+                    item = None
+                    remaining = start + self._MaxDelay - time.perf_counter()
+                    if len(batch) >= self._BatchSize or remaining <= 0: break
+                    getter = asyncio.ensure_future(source.get())
+                    done, _ = await asyncio.wait({getter}, timeout=remaining)
+                    if not done: break
+                    item, getter = getter.result(), None
+
+                if batch:
+                    self._measure('batch', start)
+                    await target.put(batch)
+                if item is not None:
+                    await target.put(item)
+                    return
+        finally:
+            if getter is not None: getter.cancel()
+
+    async def _convert(self, source: asyncio.Queue, target: asyncio.Queue) -> None:
+        while True:
+            batch = await source.get()
+            if not isinstance(batch, list):
+                await target.put(batch)
+                return
+
+            start = time.perf_counter()
+            try:
+                local = self._stack([frame for _, frame in batch])
+                world = await asyncio.to_thread(self._Hierarchy.toWorld, *local)
+            except Exception as error:
+                await target.put(error)
+                return
+            if self._Apply: self._Hierarchy.setLocal(*(values[-1] for values in local))
+            self._measure('convert', start)
+            await target.put(([arrival for arrival, _ in batch], world))
+
+    def _stack(self, frames: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        dtype = self._Hierarchy.DType
+        positions = np.asarray([frame[0] for frame in frames], dtype=dtype)
+        if self._Order is None:
+            return (positions, np.asarray([frame[1] for frame in frames], dtype=dtype), np.asarray([frame[2] for frame in frames], dtype=dtype))
+
+        rotations = Euler.toQuatsFrom(np.radians(np.asarray([frame[1] for frame in frames], dtype=dtype)), self._Order, self._Extrinsic, dtype)
+        return (positions, rotations, np.broadcast_to(self._Scales, positions.shape))
+
+    def _measure(self, name: str, start: float) -> None:
+        duration = time.perf_counter() - start
+        count, total, maximum = self._Latency.get(name, (0, 0.0, 0.0))
+        self._Latency[name] = (count + 1, total + duration, max(maximum, duration))
@@ -1,15 +1,18 @@
 import re
+import sys
 import glm
-import random
-import string
+from array import array
+from typing import TextIO
 from .pose import Pose
+from .children import ChildList
 
 
 class Transform(Pose):
     """Spatial definition of an linear space with position, rotation and scale.
     - Based on 'Pose' class, extended with parent child relation ship propertis and methods.
     - Space is defined as right handed where -> Y+ is up, and X+ is right and Z- is forward.
-    - Positive rotations are counter clockwise."""
+    - Positive rotations are counter clockwise.
+    - Pickling and copying with 'copy.deepcopy' include the transform and its children as flat arrays, but not its parent. 'copy.copy' copies the transform alone."""
 
     @property
     def Name(self) -> str:
@@ -39,7 +42,7 @@ class Transform(Pose):
     @PositionWorld.setter
     def PositionWorld(self, value: glm.vec3) -> None:
         parentSpaceInverse = self.Parent.SpaceWorldInverse if self.Parent else glm.mat4()
-        self._Position = parentSpaceInverse * value
+        self.Position = parentSpaceInverse * value
 
     @property
     def RotationWorld(self) -> glm.quat:
@@ -50,7 +53,7 @@ class Transform(Pose):
     @RotationWorld.setter
     def RotationWorld(self, value: glm.quat) -> None:
         parentSpaceInverse = self.Parent.RotationWorldInverse if self.Parent else glm.quat()
-        self._Rotation = parentSpaceInverse * value
+        self.Rotation = parentSpaceInverse * value
 
     @property
     def RotationWorldInverse(self) -> glm.quat:
@@ -66,7 +69,7 @@ class Transform(Pose):
     @ScaleWorld.setter
     def ScaleWorld(self, value: glm.vec3) -> None:
         parentSpaceInverse = self.Parent.ScaleWorldInverse if self.Parent else glm.vec3(1)
-        self._Scale = parentSpaceInverse * value
+        self.Scale = parentSpaceInverse * value
 
     @property
     def ScaleWorldInverse(self) -> glm.vec3:
@@ -94,21 +97,53 @@ class Transform(Pose):
         return self._Parent
 
     @property
-    def Children(self) -> list["Transform"]:
-        """Attachted transforms. This transform builds the parent space for those children."""
+    def Children(self) -> ChildList:
+        """Attachted transforms. This transform builds the parent space for those children.
+        - Behaves like a list, but membership tests and removals are constant time."""
         return self._Children
 
+    # attributes that are restored from the flat arrays of the tree when unpickling, all others are pickled per transform
+    _Transient = frozenset(('_Name', '_Parent', '_Children', '_Position', '_Rotation', '_Scale', '_Space'))
+
     def __init__(self, name: str = None, position: glm.vec3 = None, rotation: glm.quat = None, scale: glm.vec3 = None) -> None:
         """Creates a new transform. Parameters are considered as local space properties."""
         super().__init__(position, rotation, scale)
 
-        self.Name = name if name is not None else ''.join(random.choice(string.ascii_letters) for _ in range(8))
+        if name is None:
+            # random names are rare, so the modules are loaded on first use
+            import random
+            import string
+            name = ''.join(random.choices(string.ascii_letters, k=8))
+
+        self.Name = name
         self._Parent: "Transform" = None
-        self._Children: list["Transform"] = []
+        self._Children = ChildList()
 
     def __repr__(self) -> str:
         return (f"{self.Name}")
 
+    def __reduce__(self) -> tuple:
+        return (loadTree, self._encode(recursive=True))
+
+    def __copy__(self) -> "Transform":
+        # a shallow copy is the transform alone, without parent and children
+        return loadTree(*self._encode(recursive=False))
+
+    def _encode(self, recursive: bool) -> tuple:
+        # the subtree is encoded as flat arrays, so pickling and copying do not recurse along the hierarchy
+        # views of an 'ArrayStorage' are restored as their original class, which stores the properties as glm values
+        nodes = [node for node, _, _ in self.layout()] if recursive else [self]
+        indices = {id(node): index for index, node in enumerate(nodes)}
+        parents = array('i', [-1] + [indices[id(node._Parent)] for node in nodes[1:]])
+        values = array('f')
+        for node in nodes:
+            values.extend(node._Position)
+            values.extend(node._Rotation)
+            values.extend(node._Scale)
+        classes = [getattr(type(node), '_Base', type(node)) for node in nodes]
+        extras = [{key: value for key, value in node.__dict__.items() if key not in node._Transient} or None for node in nodes]
+        return (parents.tobytes(), values.tobytes(), [node.Name for node in nodes], classes, extras, sys.byteorder)
+
     def __str__(self) -> str:
         return (f"Name: {self.Name}, Children: {len(self.Children)}, {super().__str__()}")
 
@@ -210,6 +245,48 @@ class Transform(Pose):
             node._Parent = None
         return self
 
+    def graft(self, *nodes: "Transform", keep: list[str] = ['position', 'rotation', 'scale']) -> "Transform":
+        """Attaches whole subtrees to this transform in one step, like 'attach' for many transforms.
+        - Only the given subtree roots are corrected, their children follow without changes.
+        - If keep contains properties -> the property is modified to keep its spatial algiment in world space, with one correction per previous parent.
+        - If keep is None or empty -> Local space propteries do not change.
+        - Transforms that are already children of this one are skipped.
+
+        Returns itself."""
+        # a transform can not be grafted into its own subtree, the ancestors are collected once for all given transforms
+        ancestors = set()
+        parent = self
+        while parent is not None:
+            ancestors.add(id(parent))
+            parent = parent._Parent
+        for node in nodes:
+            if node is None: raise ValueError('Given joint value is None')
+            if id(node) in ancestors: raise ValueError(f'Joint "{node.Name}" cannot be grafted to "{self.Name}", as it is the same or one of its parents')
+
+        # corrections combine the world space of the previous parent with the inverse world space of this transform
+        # they are computed before any change, so subtrees within other given subtrees are corrected consistently
+        nodes = [node for node in dict.fromkeys(nodes) if node._Parent is not self]
+        keep = [] if keep is None else keep
+        corrections = {}
+        if keep:
+            inverse = (self.SpaceWorldInverse, self.RotationWorldInverse, self.ScaleWorldInverse)
+            for node in nodes:
+                parent = node._Parent
+                if id(parent) in corrections: continue
+                world = (parent.SpaceWorld, parent.RotationWorld, parent.ScaleWorld) if parent else (glm.mat4(), glm.quat(), glm.vec3(1))
+                corrections[id(parent)] = (inverse[0] * world[0], inverse[1] * world[1], inverse[2] * world[2])
+
+        for node in nodes:
+            if keep:
+                space, rotation, scale = corrections[id(node._Parent)]
+                if 'position' in keep: node.Position = space * node.Position
+                if 'rotation' in keep: node.Rotation = rotation * node.Rotation
+                if 'scale' in keep: node.Scale = scale * node.Scale
+            if node._Parent is not None: node._Parent._Children.discard(node)
+            node._Parent = self
+        self._Children.extend(nodes)
+        return self
+
     def clearParent(self, keep: list[str] = ['position', 'rotation', 'scale']) -> "Transform":
         """Detaches/detachs itself from the parent.
         - If keep contains properties -> the property is modified to keep its spatial algiment in world space.
@@ -230,6 +307,32 @@ class Transform(Pose):
             self.detach(*self.Children, keep=keep)
         return self
 
+    def extract(self, duplicate: bool = False, keep: list[str] = ['position', 'rotation', 'scale']) -> "Transform":
+        """Splits the subtree of this transform from its parent in one step.
+        - If keep contains properties -> the property of the subtree root is modified to keep its spatial algiment in world space, its children follow without changes.
+        - If keep is None or empty -> Local space propteries do not change.
+        - If duplicate is True -> A copy of the subtree is returned and the hierarchy does not change. The copy is created from flat arrays, like 'fromArrays'.
+
+        Returns the root of the extracted subtree."""
+        if not duplicate:
+            return self.clearParent(keep=keep)
+
+        nodes = [node for node, _, _ in self.layout()]
+        indices = {id(node): index for index, node in enumerate(nodes)}
+        root = Transform.fromArrays(
+            [-1] + [indices[id(node._Parent)] for node in nodes[1:]],
+            [node._Position for node in nodes],
+            [node._Rotation for node in nodes],
+            [node._Scale for node in nodes],
+            [node.Name for node in nodes])[0]
+
+        keep = [] if keep is None else keep
+        if self._Parent is not None:
+            if 'position' in keep: root.Position = self.PositionWorld
+            if 'rotation' in keep: root.Rotation = self.RotationWorld
+            if 'scale' in keep: root.Scale = self.ScaleWorld
+        return root
+
     def _applyPositionGetChanges(self, position: glm.vec3 = None) -> tuple[glm.vec3, glm.vec3]:
         change = -self.Position if position is None else position
         changeInverse = glm.inverse(self.Rotation) * ((1.0 / self.Scale) * -change)
@@ -326,34 +429,34 @@ class Transform(Pose):
     def layout(self, index: int = 0, depth: int = 0) -> list[tuple["Transform", int, int]]:
         """Returns the hierarchy, inclunding this transform, in order of 'depth first' with their index and depth.
         - Order of the tuple -> [transform, index, depth]"""
-        result = [[self, index, depth]]
-        for child in self.Children:
-            result.extend(child.layout(result[-1][1] + 1, depth + 1))
+        result = []
+        stack = [(self, depth)]
+        while stack:
+            node, level = stack.pop()
+            result.append([node, index + len(result), level])
+            stack.extend((child, level + 1) for child in reversed(node.Children))
         return result
 
-    def printTree(self, markerStr="+- ", levelMarkers=[]) -> None:
-        # src: https://simonhessner.de/python-3-recursively-print-structured-tree-including-hierarchy-markers-using-depth-first-search/
-        """
-        Recursive function that prints the hierarchical structure of a tree including markers that indicate parent-child relationships between nodes.
-
-        Parameters:
-        - root: Node instance, possibly containing children Nodes
-        - markerStr: String to print in front of each node  ("+- " by default)
-        - levelMarkers: Internally used by recursion to indicate where to
-                        print markers and connections (see explanations below)
-        """
-
-        def mapper(draw): return connectionStr if draw else emptyStr
+    def printTree(self, markerStr="+- ", levelMarkers=[], stream: TextIO = None) -> None:
+        """Prints the hierarchical structure of this transform and its children, including markers that indicate parent-child relationships.
+        - The tree is traversed iteratively, so very deep hierarchies are supported.
+        - MarkerStr is printed in front of each transform ("+- " by default).
+        - LevelMarkers are the markers of the levels above, which indicate if a connection is drawn for them.
+        - If stream is set -> The lines are written to that text stream instead of stdout."""
         emptyStr = " " * len(markerStr)
         connectionStr = "|" + emptyStr[:-1]
-        level = len(levelMarkers)   # recursion level
-        markers = "".join(map(mapper, levelMarkers[:-1]))
-        markers += markerStr if level > 0 else ""
-        print(f"{markers}{self.Name}")
+        def mapper(draw): return connectionStr if draw else emptyStr
+
+        # each entry carries the markers of its own line and the indentation for its children
+        linePrefix = "".join(map(mapper, levelMarkers[:-1])) + (markerStr if len(levelMarkers) > 0 else "")
+        stack = [(self, linePrefix, "".join(map(mapper, levelMarkers)))]
+        while stack:
+            node, linePrefix, childPrefix = stack.pop()
+            print(f"{linePrefix}{node.Name}", file=stream)
 
-        for i, child in enumerate(self.Children):
-            isLast = i == len(self.Children) - 1
-            child.printTree(markerStr, [*levelMarkers, not isLast])
+            lastIndex = len(node.Children) - 1
+            for index, child in reversed(list(enumerate(node.Children))):
+                stack.append((child, childPrefix + markerStr, childPrefix + mapper(index != lastIndex)))
 
     def filter(self, pattern: str, isEqual: bool = False, caseSensitive: bool = False) -> list["Transform"]:
         """Tries to find transforms that matches the pattern in their name name.
@@ -401,3 +504,57 @@ class Transform(Pose):
         """Returns this pose as new transform.
         - If name is set -> The name will be set for the new transform."""
         return Transform(name=name, position=pose.Position, rotation=pose.Rotation, scale=pose.Scale)
+
+    def fromArrays(parents: list[int], positions: list[glm.vec3] = None, rotations: list[glm.quat] = None, scales: list[glm.vec3] = None, names: list[str] = None) -> list["Transform"]:
+        """Creates a whole hierarchy in a single pass and returns all transforms in the given order.
+        - Parents contains for each transform the index of its parent, or -1 for a root. Parents have to be listed before their children, like in 'layout()'.
+        - Positions, rotations and scales are optional and considered as local space properties.
+        - If names is None -> The transforms are named by their index, like 'Transform0'.
+        - There is no world space correction, like attaching with keep=None."""
+        count = len(parents)
+        for values in (positions, rotations, scales, names):
+            if values is not None and len(values) != count:
+                raise ValueError(f'Given arrays must have the same length as parents ({count})')
+
+        nodes = []
+        for index in range(count):
+            parent = int(parents[index])
+            if not -1 <= parent < index: raise ValueError(f'Parent index {parent} of transform {index} is invalid. Parents have to be listed before their children')
+
+            node = Transform(
+                name=f'Transform{index}' if names is None else names[index],
+                position=None if positions is None else positions[index],
+                rotation=None if rotations is None else rotations[index],
+                scale=None if scales is None else scales[index])
+
+            if parent >= 0:
+                node._Parent = nodes[parent]
+                nodes[parent]._Children.append(node)
+            nodes.append(node)
+
+        return nodes
+
+
+def loadTree(parents: bytes, values: bytes, names: list[str], classes: list[type], extras: list[dict], byteorder: str) -> Transform:
+    # counterpart of 'Transform.__reduce__', the parent of the root is not part of the tree
+    parents, values = array('i', parents), array('f', values)
+    if byteorder != sys.byteorder:
+        parents.byteswap()
+        values.byteswap()
+
+    # transforms are created without initialization, like the default unpickling, so subclasses need no compatible constructor
+    nodes = [cls.__new__(cls) for cls in classes]
+    children = [[] for _ in nodes]
+    for index, (node, parent) in enumerate(zip(nodes, parents)):
+        offset = index * 10
+        if extras[index]: node.__dict__.update(extras[index])
+        node._Name = names[index]
+        node._Space = None
+        node._Position = glm.vec3(values[offset:offset + 3])
+        node._Rotation = glm.quat(values[offset + 3:offset + 7])
+        node._Scale = glm.vec3(values[offset + 7:offset + 10])
+        node._Parent = None if parent < 0 else nodes[parent]
+        if parent >= 0: children[parent].append(node)
+    for node, items in zip(nodes, children):
+        node._Children = ChildList(items)
+    return nodes[0]
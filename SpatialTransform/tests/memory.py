@@ -0,0 +1,52 @@
+import gc
+import os
+import tracemalloc
+from typing import Callable, NamedTuple
+
+# Memory measurements with tracemalloc, to catch regressions of the memory footprint.
+# - Budgets can be overridden by environment variables, like SPATIALTRANSFORM_BUDGET_TRANSFORM_BYTES=700.
+# - Only allocations that are alive after a call are counted as blocks, temporary ones are only part of the peaks.
+# - Temporary allocations of a call are measured by its own peak, which also covers objects that are freed before the call returns.
+
+
+class Measurement(NamedTuple):
+    retained: float   # bytes per call that are still allocated afterwards
+    blocks: float     # allocated blocks per call that are still allocated afterwards
+    peak: int         # highest amount of bytes allocated at once, over all calls
+    temporary: float  # median of the highest amount of bytes allocated at once within each call, including its result
+
+
+def measure(function: Callable, repeat: int = 1, keep: bool = True) -> Measurement:
+    # if keep is False -> results are dropped after each call, so retained allocations show leaks instead of results
+    results = [None] * repeat
+    peaks = [0] * repeat
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start = tracemalloc.get_traced_memory()[0]
+        peak = 0
+
+        for index in range(repeat):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            result = function()
+            if keep: results[index] = result
+            del result
+            callPeak = tracemalloc.get_traced_memory()[1]
+            peaks[index] = callPeak - current
+            peak = max(peak, callPeak - start)
+
+        current = tracemalloc.get_traced_memory()[0]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # the snapshots themselves are not traced, filtering the tracemalloc module keeps its own bookkeeping out
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    blocks = sum(stat.count_diff for stat in after.filter_traces(filters).compare_to(before.filter_traces(filters), 'filename'))
+    return Measurement((current - start) / repeat, blocks / repeat, peak, sorted(peaks)[repeat // 2])
+
+
+def budget(name: str, default: float) -> float:
+    return float(os.environ.get(f'SPATIALTRANSFORM_BUDGET_{name.upper()}', default))
@@ -0,0 +1,67 @@
+import glm
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, AimConstraint
+
+
+class Constraints(unittest.TestCase):
+    def setUp(self):
+        parent = Transform(position=randomPosition(), rotation=randomRotation())
+        self.hierarchy = Hierarchy(randomHierarchy(20, uniformScale=True))
+        parent.attach(self.hierarchy.Root, keep=None)
+        self.joints = [0, 3, 7, 8, 12, 19]
+        self.constraint = AimConstraint(self.hierarchy, self.joints)
+
+    def assertRotations(self, expected: Hierarchy, rotations: np.ndarray):
+        for node, rotation in zip(expected.Nodes, rotations):
+            self.assertGreater(deltaRotation, 1 - abs(glm.dot(node.Rotation, glm.quat(*rotation))))
+
+    def test_world(self):
+        directions = np.array([tuple(randomDirection()) for _ in self.joints])
+        directions[1] = (0, 1, 0)
+        rotations = self.constraint.solve(directions)
+
+        for joint, direction in zip(self.joints, directions):
+            self.hierarchy.Nodes[joint].lookAtWorld(glm.vec3(direction))
+        self.assertRotations(self.hierarchy, rotations)
+
+    def test_local(self):
+        directions = np.array([tuple(randomDirection()) for _ in self.joints])
+        up = np.array([tuple(randomDirection()) for _ in self.joints])
+        rotations = self.constraint.solve(directions, up=up, space='local')
+
+        for joint, direction, jointUp in zip(self.joints, directions, up):
+            self.hierarchy.Nodes[joint].lookAt(glm.vec3(direction), glm.vec3(jointUp))
+        self.assertRotations(self.hierarchy, rotations)
+
+    def test_targets(self):
+        targets = np.array([tuple(randomPosition() * 5) for _ in self.joints])
+        self.constraint.apply(targets=targets)
+        for joint, target in zip(self.joints, targets):
+            node = self.hierarchy.Nodes[joint]
+            direction = glm.normalize(glm.vec3(target) - node.PositionWorld)
+            self.assertGreater(deltaPosition, glm.distance2(direction, glm.normalize(node.ForwardWorld)))
+
+    def test_clip(self):
+        local = self.hierarchy.getLocal()
+        clip = np.stack([local[1], np.roll(local[1], 1, axis=0), np.roll(local[1], 2, axis=0)])
+        directions = np.array([tuple(randomDirection()) for _ in self.joints])
+        rotations = self.constraint.solve(directions, rotations=clip)
+        self.assertEqual(clip.shape, rotations.shape)
+
+        for frame in range(len(clip)):
+            self.hierarchy.setLocal(rotations=clip[frame])
+            for joint, direction in zip(self.joints, directions):
+                self.hierarchy.Nodes[joint].lookAtWorld(glm.vec3(direction))
+            self.assertRotations(self.hierarchy, rotations[frame])
+
+    def test_exceptions(self):
+        self.assertRaises(ValueError, AimConstraint, self.hierarchy, [])
+        self.assertRaises(ValueError, AimConstraint, self.hierarchy, [1, 1])
+        self.assertRaises(ValueError, self.constraint.solve)
+        self.assertRaises(ValueError, self.constraint.solve, np.zeros((2, 3)))
+        self.assertRaises(ValueError, self.constraint.solve, np.ones((len(self.joints), 3)), space='parent')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import glm
+import unittest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, SpatialIndex, IKChain, Retarget, FeatureDatabase
+
+
+class Structure(unittest.TestCase):
+    def test_Init(self):
+        root = randomHierarchy()
+        hierarchy = Hierarchy(root)
+
+        self.assertEqual(len(root.layout()), len(hierarchy))
+        self.assertEqual([item[0] for item in root.layout()], hierarchy.Nodes)
+        self.assertEqual([item[2] for item in root.layout()], hierarchy.Depths.tolist())
+        self.assertEqual(-1, hierarchy.Parents[0])
+        for node, parent in zip(hierarchy.Nodes[1:], hierarchy.Parents[1:]):
+            self.assertIs(node.Parent, hierarchy.Nodes[parent])
+
+    def test_index(self):
+        root = Transform('Root').attach(Transform('Child'))
+        hierarchy = Hierarchy(root)
+
+        self.assertEqual(1, hierarchy.index('Child'))
+        self.assertEqual(1, hierarchy.index(root.Children[0]))
+        self.assertRaises(ValueError, hierarchy.index, 'Missing')
+        self.assertRaises(ValueError, hierarchy.index, Transform())
+
+
+class Spaces(unittest.TestCase):
+    def test_getWorld(self):
+        for _ in range(20):
+            parent = Transform(position=randomPosition(), rotation=randomRotation(), scale=randomScale())
+            root = randomHierarchy()
+            parent.attach(root, keep=None)
+            hierarchy = Hierarchy(root)
+            positions, rotations, scales = hierarchy.getWorld()
+
+            for index, node in enumerate(hierarchy.Nodes):
+                self.assertGreater(deltaPosition, glm.distance2(node.PositionWorld, glm.vec3(positions[index])))
+                self.assertGreater(deltaRotation, glm.angle(node.RotationWorld * glm.inverse(glm.quat(rotations[index]))))
+                self.assertGreater(deltaScale, glm.distance2(node.ScaleWorld, glm.vec3(scales[index])))
+
+    def test_toWorldClip(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        positions, rotations, scales = hierarchy.getLocal()
+        clip = np.stack([rotations, np.roll(rotations, 1, axis=0)])
+
+        worldPositions, worldRotations, worldScales = hierarchy.toWorld(rotations=clip)
+        self.assertEqual((2, len(hierarchy), 3), worldPositions.shape)
+        self.assertTrue(np.allclose(worldPositions[0], hierarchy.getWorld()[0]))
+
+        hierarchy.setLocal(rotations=clip[1])
+        self.assertTrue(np.allclose(worldPositions[1], hierarchy.getWorld()[0], atol=1e-5))
+
+    def test_setWorld(self):
+        for _ in range(20):
+            parent = Transform(position=randomPosition(), rotation=randomRotation(), scale=abs(randomScale()) + 0.5)
+            source = Hierarchy(randomHierarchy(uniformScale=True))
+            target = Hierarchy(source.Root.duplicate(recursive=True).reset(recursive=True))
+            parent.attach(target.Root, keep=None)
+
+            positions, rotations, scales = source.getWorld()
+            target.setWorld(positions, rotations, scales)
+
+            for sourceNode, targetNode in zip(source.Nodes, target.Nodes):
+                self.assertGreater(deltaPosition, glm.distance2(sourceNode.PositionWorld, targetNode.PositionWorld))
+                self.assertGreater(deltaRotation, glm.angle(sourceNode.RotationWorld * glm.inverse(targetNode.RotationWorld)))
+                self.assertGreater(deltaScale, glm.distance2(sourceNode.ScaleWorld, targetNode.ScaleWorld))
+
+    def test_toLocal(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        local = hierarchy.getLocal()
+        clip = [np.stack([values, values]) for values in hierarchy.getWorld()]
+
+        for expected, actual in zip(local, hierarchy.toLocal(*clip)):
+            self.assertTrue(np.allclose(expected, actual[1], atol=1e-4))
+
+    def test_snapshot(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        expected = [(node.Position, node.Rotation, node.Scale, node.SpaceWorld) for node in hierarchy.Nodes]
+        buffer = hierarchy.snapshot()
+        self.assertEqual((len(hierarchy), 10), buffer.shape)
+
+        for node in hierarchy.Nodes:
+            node.Position = randomPosition()
+            node.Rotation = randomRotation()
+            node.Scale = randomScale()
+            node.SpaceWorld
+
+        hierarchy.restore(buffer)
+        for node, (position, rotation, scale, spaceWorld) in zip(hierarchy.Nodes, expected):
+            self.assertEqual(position, node.Position)
+            self.assertEqual(rotation, node.Rotation)
+            self.assertEqual(scale, node.Scale)
+            self.assertEqual(spaceWorld, node.SpaceWorld)
+
+        self.assertRaises(ValueError, hierarchy.restore, buffer[1:])
+
+    def test_complete(self):
+        hierarchy = Hierarchy(randomHierarchy(5))
+        positions = np.zeros((3, 5, 3))
+        result = hierarchy.complete(positions, space='world')
+        self.assertIs(positions, result[0])
+        self.assertTrue(np.array_equal(hierarchy.getWorld()[1], result[1]))
+
+        positions, rotations, scales = hierarchy.broadcast(*result)
+        self.assertEqual((3, 5, 4), rotations.shape)
+        self.assertEqual((3, 5, 3), scales.shape)
+        self.assertFalse(scales.flags.writeable)
+        self.assertRaises(ValueError, hierarchy.complete, space='parent')
+        self.assertRaises(ValueError, hierarchy.broadcast, np.zeros((4, 3)), *result[1:])
+
+    def test_validate(self):
+        hierarchy = Hierarchy(randomHierarchy(5))
+        self.assertRaises(ValueError, hierarchy.toWorld, np.zeros((4, 3)))
+        self.assertRaises(ValueError, hierarchy.setLocal, None, np.zeros((5, 3)))
+
+
+class Conversions(unittest.TestCase):
+    def test_points(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        node = hierarchy.Nodes[-1]
+        points = np.array([tuple(randomPosition()) for _ in range(5)])
+
+        world = hierarchy.pointsToWorld(node, points)
+        directions = hierarchy.directionsToWorld(node, points)
+        for point, worldPoint, direction in zip(points, world, directions):
+            self.assertGreater(deltaPosition, glm.distance2(node.pointToWorld(glm.vec3(point)), glm.vec3(worldPoint)))
+            self.assertGreater(deltaPosition, glm.distance2(node.directionToWorld(glm.vec3(point)), glm.vec3(direction)))
+        self.assertTrue(np.allclose(points, hierarchy.pointsToLocal(node, world), atol=1e-4))
+        self.assertTrue(np.allclose(points, hierarchy.directionsToLocal(node, directions), atol=1e-5))
+
+    def test_pointsClip(self):
+        hierarchy = Hierarchy(randomHierarchy(10))
+        _, rotations, _ = hierarchy.getLocal()
+        clip = np.stack([rotations, np.roll(rotations, 1, axis=0), np.roll(rotations, 2, axis=0)])
+
+        world = hierarchy.pointsToWorld(3, np.zeros((3, 1, 3)), rotations=clip)
+        self.assertEqual((3, 1, 3), world.shape)
+        self.assertTrue(np.allclose(hierarchy.toWorld(rotations=clip)[0][:, 3], world[:, 0]))
+
+
+class Concurrency(unittest.TestCase):
+    def test_workers(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        clip = [np.repeat(values[None], 7, axis=0) for values in hierarchy.getLocal()]
+        clip[1] = np.roll(clip[1], 1, axis=1)
+
+        for function in (hierarchy.toWorld, hierarchy.toLocal):
+            for expected, actual in zip(function(*clip), function(*clip, workers=3)):
+                self.assertEqual(expected.shape, actual.shape)
+                self.assertTrue(np.array_equal(expected, actual))
+        self.assertTrue(np.array_equal(hierarchy.toSpaceWorld(*clip), hierarchy.toSpaceWorld(*clip, workers=16)))
+        self.assertTrue(np.array_equal(hierarchy.toSpaceWorld(), hierarchy.toSpaceWorld(workers=4)))
+
+    def test_concurrentReads(self):
+        nodes = [node for node, _, _ in randomHierarchy(50).layout()]
+        for _ in range(20):
+            for node in nodes:
+                node.Position = node.Position
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda node: (node.SpaceWorld, node.Space), nodes * 4))
+
+            for node, (spaceWorld, space) in zip(nodes * 4, results):
+                self.assertEqual(glm.scale(glm.translate(node.Position), node.Scale) * glm.mat4_cast(node.Rotation), space)
+                self.assertEqual(node.SpaceWorld, spaceWorld)
+
+
+class Precision(unittest.TestCase):
+    def test_dtype(self):
+        hierarchy = Hierarchy(randomHierarchy(), dtype=np.float32)
+        self.assertEqual(np.float32, hierarchy.DType)
+        self.assertTrue(all(values.dtype == np.float32 for values in hierarchy.getLocal()))
+        self.assertTrue(all(values.dtype == np.float32 for values in hierarchy.getWorld()))
+        self.assertTrue(all(values.dtype == np.float32 for values in hierarchy.toLocal()))
+        self.assertTrue(all(values.dtype == np.float64 for values in hierarchy.toWorld(dtype=np.float64)))
+        self.assertEqual(np.float32, hierarchy.toSpaceWorld().dtype)
+        self.assertEqual(np.float32, hierarchy.pointsToWorld(1, np.zeros((1, 3))).dtype)
+        self.assertRaises(ValueError, Hierarchy, hierarchy.Root, np.int32)
+
+    def test_subsystems(self):
+        hierarchy = Hierarchy(randomHierarchy(10, uniformScale=True), dtype=np.float32)
+        clip = [np.repeat(values[None], 4, axis=0) for values in hierarchy.getLocal()]
+
+        self.assertEqual(np.float32, SpatialIndex(hierarchy).Positions.dtype)
+        self.assertEqual(np.float32, IKChain(hierarchy, 0, 5).solve(np.zeros(3), *clip).dtype)
+        self.assertEqual(np.float32, Retarget(Hierarchy(hierarchy.Root.duplicate(recursive=True)), hierarchy).retarget(*clip)[1].dtype)
+        database = FeatureDatabase(hierarchy, positions=[1, 2], directions=[3], velocities=[4])
+        database.add(*clip)
+        self.assertEqual(np.float32, database.Features.dtype)
+
+    def test_deepChain(self):
+        count = 500
+        rotation = glm.angleAxis(0.3, glm.normalize(glm.vec3(1, 2, 3)))
+        chain = Transform.fromArrays(range(-1, count - 1), [(0, 0.1, 0)] * count, [rotation] * count)
+
+        errors = []
+        for dtype in [np.float64, np.float32]:
+            hierarchy = Hierarchy(chain[0], dtype=dtype)
+            local = hierarchy.getLocal()
+            errors.append(max(np.abs(expected - actual).max() for expected, actual in zip(local, hierarchy.toLocal(*hierarchy.toWorld(*local)))))
+
+        self.assertGreater(1e-9, errors[0])
+        self.assertGreater(errors[1], errors[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import glm
+import os
+import tempfile
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Hierarchy, WorldCache
+
+
+class Entries(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_toWorld(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        cache = WorldCache(self.directory.name)
+        clip = [np.repeat(values[None], 5, axis=0) for values in hierarchy.getLocal()]
+        clip[1] = np.roll(clip[1], 1, axis=1)
+
+        stored = cache.toWorld(hierarchy, *clip)
+        loaded = cache.toWorld(hierarchy, *clip)
+        self.assertEqual(1, len(cache))
+        self.assertIsInstance(loaded[0], np.memmap)
+        for expected, first, second in zip(hierarchy.toWorld(*clip), stored, loaded):
+            self.assertTrue(np.array_equal(expected, first))
+            self.assertTrue(np.array_equal(expected, second))
+
+        for node, direction in zip(hierarchy.Nodes, cache.toWorld(hierarchy)[3]):
+            self.assertGreater(deltaPosition, glm.distance2(node.ForwardWorld, glm.vec3(direction)))
+
+    def test_key(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        cache = WorldCache(self.directory.name)
+        key = cache.key(hierarchy)
+
+        self.assertEqual(key, cache.key(Hierarchy(hierarchy.Root.duplicate(recursive=True))))
+        self.assertEqual(key, cache.key(hierarchy, *hierarchy.getLocal()))
+        self.assertNotEqual(key, cache.key(Hierarchy(hierarchy.Root, dtype=np.float32)))
+
+        hierarchy.Nodes[-1].Position += glm.vec3(1e-3)
+        self.assertNotEqual(key, cache.key(hierarchy))
+
+        cache.toWorld(hierarchy)
+        self.assertIn(cache.key(hierarchy), cache)
+        self.assertIn(cache.key(hierarchy), WorldCache(self.directory.name))
+
+    def test_eviction(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        cache = WorldCache(self.directory.name)
+        clips = [[np.repeat(values[None], 10, axis=0) + index for values in hierarchy.getLocal()] for index in range(4)]
+
+        cache.toWorld(hierarchy, *clips[0])
+        entrySize = cache.Size
+        cache = WorldCache(self.directory.name, maxBytes=entrySize * 2)
+
+        # back to back uses are ordered, regardless of the resolution of the clock and file system times
+        keys = [cache.key(hierarchy, *clip) for clip in clips]
+        for index in [0, 1, 2, 1, 3]:
+            cache.toWorld(hierarchy, *clips[index])
+
+        self.assertEqual([False, True, False, True], [key in cache for key in keys])
+        self.assertLessEqual(cache.Size, cache.MaxBytes)
+        self.assertEqual(0, len(cache.clear()))
+        self.assertEqual([], [name for name in os.listdir(self.directory.name)])
+
+if __name__ == '__main__':
+    unittest.main()
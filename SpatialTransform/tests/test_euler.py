@@ -1,5 +1,6 @@
 import glm
 import unittest
+import numpy as np
 from .utils import *
 from SpatialTransform import Euler
 
@@ -18,5 +19,58 @@ class Conversions(unittest.TestCase):
             m = glm.mat3_cast(r)
             self.assertGreater(0.01, glm.distance(e, Euler.fromMatTo(m, order='XYZ', extrinsic=True)))
 
+    def test_toQuatsFrom(self):
+        radians = np.random.uniform(-3, 3, (100, 3))
+        for order in Euler.getOrders():
+            for extrinsic in [True, False]:
+                quats = Euler.toQuatsFrom(radians, order=order, extrinsic=extrinsic)
+                for angles, quat in zip(radians, quats):
+                    self.assertGreater(deltaRotation, 1 - abs(glm.dot(Euler.toQuatFrom(glm.vec3(angles), order, extrinsic), glm.quat(quat))))
+
+    def test_fromQuatsTo(self):
+        quats = np.array([tuple(randomRotation()) for _ in range(100)])
+        for order in Euler.getOrders():
+            for extrinsic in [True, False]:
+                radians = Euler.fromQuatsTo(quats, order=order, extrinsic=extrinsic)
+                for angles, quat in zip(radians, quats):
+                    expected = Euler.fromQuatTo(glm.quat(quat), order, extrinsic)
+                    self.assertGreater(deltaRotation, 1 - abs(glm.dot(Euler.toQuatFrom(expected, order, extrinsic), Euler.toQuatFrom(glm.vec3(angles), order, extrinsic))))
+
+    def test_fromQuatSequenceTo(self):
+        frames = np.linspace(0, 4 * np.pi, 400)
+        radians = np.stack([np.sin(frames) * 3, frames * 0.9, np.cos(frames) * 2 + frames], axis=-1)
+        for order in Euler.getOrders():
+            for extrinsic in [True, False]:
+                quats = Euler.toQuatsFrom(radians, order=order, extrinsic=extrinsic)
+                curves = Euler.fromQuatSequenceTo(quats, order=order, extrinsic=extrinsic)
+                self.assertLess(np.max(np.abs(np.diff(curves, axis=0))), 0.1)
+                self.assertGreater(deltaRotation, np.max(1 - np.abs(np.sum(Euler.toQuatsFrom(curves, order, extrinsic) * quats, axis=-1))))
+
+    def test_fromQuatSequenceToLocked(self):
+        frames = np.linspace(0, 1, 50)
+        for order in Euler.getOrders():
+            for extrinsic in [True, False]:
+                first, middle, last = ['XYZ'.index(axis) for axis in (order[::-1] if extrinsic else order)]
+                radians = np.zeros((50, 2, 3))
+                radians[:, :, first] = 0.3 + frames[:, None]
+                radians[:, :, middle] = np.pi / 2
+                radians[:, :, last] = -0.2 + 2 * frames[:, None]
+                radians[:5, :, middle] = np.linspace(1.2, np.pi / 2, 5)[:, None]
+
+                quats = Euler.toQuatsFrom(radians, order=order, extrinsic=extrinsic)
+                curves = Euler.fromQuatSequenceTo(quats, order=order, extrinsic=extrinsic)
+                self.assertEqual((50, 2, 3), curves.shape)
+                self.assertLess(np.max(np.abs(np.diff(curves, axis=0))), 0.1)
+                self.assertTrue(np.allclose(curves[4:, :, first], curves[4, :, first]))
+                self.assertGreater(deltaRotation, np.max(1 - np.abs(np.sum(Euler.toQuatsFrom(curves, order, extrinsic) * quats, axis=-1))))
+
+    def test_precision(self):
+        radians = np.random.uniform(-3, 3, (10, 4, 3))
+        self.assertEqual(np.float32, Euler.toQuatsFrom(radians, dtype=np.float32).dtype)
+        self.assertEqual(np.float32, Euler.fromQuatsTo(Euler.toQuatsFrom(radians), dtype=np.float32).dtype)
+        self.assertEqual((10, 4, 3), Euler.fromQuatsTo(Euler.toQuatsFrom(radians)).shape)
+        self.assertEqual(np.float32, Euler.fromQuatSequenceTo(Euler.toQuatsFrom(radians), dtype=np.float32).dtype)
+        self.assertRaises(ValueError, Euler.toQuatsFrom, radians, order='XXY')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+import io
+import glm
+import json
+import unittest
+from .utils import *
+from SpatialTransform import Transform, Export
+
+
+class Rendering(unittest.TestCase):
+    def test_printTree(self):
+        root = Transform('Root').attach(Transform('A').attach(Transform('A1'), Transform('A2')), Transform('B').attach(Transform('B1')))
+        stream = io.StringIO()
+        root.printTree(stream=stream)
+        self.assertEqual([
+            'Root',
+            '+- A',
+            '|  +- A1',
+            '|  +- A2',
+            '+- B',
+            '   +- B1',
+        ], stream.getvalue().splitlines())
+
+        stream = io.StringIO()
+        root.Children[0].printTree(markerStr='-> ', levelMarkers=[True], stream=stream)
+        self.assertEqual(['-> A', '|  -> A1', '|  -> A2'], stream.getvalue().splitlines())
+
+    def test_printTreeDeep(self):
+        root = Transform.fromArrays([-1] + list(range(5000)))[0]
+        stream = io.StringIO()
+        root.printTree(stream=stream)
+        self.assertEqual(5001, len(stream.getvalue().splitlines()))
+
+
+class Exporters(unittest.TestCase):
+    def test_toJson(self):
+        root = randomHierarchy(30)
+        stream = io.StringIO()
+        Export.toJson(root, stream)
+
+        def compare(node: Transform, data: dict):
+            self.assertEqual(node.Name, data['name'])
+            self.assertNotIn('position', data)
+            self.assertEqual(len(node.Children), len(data.get('children', [])))
+            for child, childData in zip(node.Children, data.get('children', [])): compare(child, childData)
+        compare(root, json.loads(stream.getvalue()))
+
+        leaf = Transform('Leaf')
+        stream = io.StringIO()
+        Export.toJson(leaf, stream, space='local')
+        self.assertEqual({'name': 'Leaf', 'position': [0, 0, 0], 'rotation': [1, 0, 0, 0], 'scale': [1, 1, 1]}, json.loads(stream.getvalue()))
+
+    def test_toJsonWorld(self):
+        parent = Transform(position=randomPosition(), rotation=randomRotation(), scale=randomScale())
+        root = randomHierarchy(30)
+        parent.attach(root)
+        stream = io.StringIO()
+        Export.toJson(root, stream, space='world')
+
+        data = [json.loads(stream.getvalue())]
+        for node, _, _ in root.layout():
+            item = data.pop()
+            self.assertEqual(node.Name, item['name'])
+            self.assertGreater(deltaPosition, glm.distance2(node.PositionWorld, glm.vec3(item['position'])))
+            self.assertGreater(deltaRotation, 1 - abs(glm.dot(node.RotationWorld, glm.quat(*item['rotation']))))
+            self.assertGreater(deltaScale, glm.distance2(node.ScaleWorld, glm.vec3(item['scale'])))
+            data.extend(reversed(item.get('children', [])))
+
+    def test_toDot(self):
+        root = Transform('Root "main"').attach(Transform('A').attach(Transform('A1')), Transform('B'))
+        stream = io.StringIO()
+        Export.toDot(root, stream, space='local')
+        lines = stream.getvalue().splitlines()
+
+        self.assertEqual('digraph "Root \\"main\\"" {', lines[0])
+        self.assertEqual('}', lines[-1])
+        self.assertEqual(['    n0 -> n1;', '    n1 -> n2;', '    n0 -> n3;'], [line for line in lines if '->' in line])
+        self.assertIn('    n2 [label="A1\\nP: (0.0, 0.0, 0.0)\\nR: (1.0, 0.0, 0.0, 0.0)\\nS: (1.0, 1.0, 1.0)"];', lines)
+
+    def test_invalid(self):
+        stream = io.StringIO()
+        self.assertRaises(ValueError, Export.toDot, Transform(), stream, space='global')
+        self.assertEqual('', stream.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import glm
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, FeatureDatabase
+
+
+def createClip(hierarchy, frames):
+    positions, rotations, scales = hierarchy.getLocal()
+    clipPositions = np.repeat(positions[None], frames, axis=0)
+    clipRotations = np.array([[tuple(randomRotation()) for _ in range(len(hierarchy))] for _ in range(frames)])
+    clipPositions[:, 0] += np.cumsum(np.random.uniform(-0.1, 0.1, (frames, 3)), axis=0)
+    return (clipPositions, clipRotations, np.repeat(scales[None], frames, axis=0))
+
+
+class Features(unittest.TestCase):
+    def test_compute(self):
+        root = randomHierarchy(10, uniformScale=True)
+        hierarchy = Hierarchy(root)
+        hand, foot = hierarchy.Nodes[4], hierarchy.Nodes[7]
+        database = FeatureDatabase(hierarchy, positions=[hand], directions=[foot], velocities=[hand], frameTime=0.5)
+
+        clip = createClip(hierarchy, 2)
+        features = database.compute(*clip)
+        self.assertEqual((2, 9), features.shape)
+
+        hierarchy.setLocal(*(values[1] for values in clip))
+        previous = glm.vec3(hierarchy.toWorld(*(values[0] for values in clip))[0][4])
+        self.assertGreater(deltaPosition, glm.distance2(root.pointToLocal(hand.PositionWorld) * root.ScaleWorld, glm.vec3(features[1, 0:3])))
+        self.assertGreater(deltaRotation, glm.distance2(root.directionToLocal(foot.ForwardWorld), glm.vec3(features[1, 3:6])))
+        self.assertGreater(deltaPosition, glm.distance2(root.directionToLocal((hand.PositionWorld - previous) / 0.5), glm.vec3(features[1, 6:9])))
+        self.assertTrue(np.allclose(features[0, 6:9], features[1, 6:9]))
+
+    def test_query(self):
+        chain = Transform.fromArrays(range(-1, 9), [randomPosition() for _ in range(10)])
+        hierarchy = Hierarchy(chain[0])
+        database = FeatureDatabase(hierarchy, positions=hierarchy.Nodes[1:4], directions=hierarchy.Nodes[4:6], velocities=hierarchy.Nodes[1:2])
+
+        first = database.add(*createClip(hierarchy, 50))
+        second = database.add(*createClip(hierarchy, 30))
+        self.assertEqual(range(0, 50), first)
+        self.assertEqual(range(50, 80), second)
+        self.assertEqual((80, 18), database.Features.shape)
+        self.assertEqual((1, 12), database.locate(62))
+
+        query = database.Features[62] + np.random.normal(0, 1e-6, 18)
+        normalized = database.normalize(database.Features)
+        expected = np.argsort(np.linalg.norm(normalized - database.normalize(query), axis=1))[:4]
+
+        indices, distances = database.query(query, k=4)
+        self.assertEqual(62, indices[0])
+        self.assertEqual(expected.tolist(), indices.tolist())
+        self.assertTrue(np.all(np.diff(distances) >= 0))
+
+    def test_weights(self):
+        hierarchy = Hierarchy(randomHierarchy(5))
+        database = FeatureDatabase(hierarchy, positions=[hierarchy.Nodes[1]], directions=[hierarchy.Nodes[2]], weights=(1, 0, 1))
+        database.add(*createClip(hierarchy, 20))
+        self.assertTrue(np.allclose(0, database.normalize(database.Features)[:, 3:6]))
+        self.assertRaises(ValueError, FeatureDatabase, hierarchy)
+        self.assertRaises(ValueError, FeatureDatabase(hierarchy, positions=['Transform1']).query, np.zeros(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
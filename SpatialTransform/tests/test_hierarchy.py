@@ -1,6 +1,7 @@
 import unittest
 from .utils import *
 from SpatialTransform import Transform
+from SpatialTransform.lib.children import ChildList
 
 class AddRemove(unittest.TestCase):
     def test_attatch(self):
@@ -136,5 +137,159 @@ class AddRemove(unittest.TestCase):
         self.assertEqual(None, child2.Parent)
         self.assertEqual(0, len(root.Children))
 
+    def test_childrenOrder(self):
+        root = Transform()
+        children = [Transform() for _ in range(10)]
+
+        root.attach(*children)
+        self.assertEqual(children, root.Children)
+        self.assertEqual(children[3], root.Children[3])
+        self.assertEqual(children[-1], root.Children[-1])
+        self.assertEqual(4, root.Children.index(children[4]))
+
+        root.detach(children[4], children[0])
+        self.assertNotIn(children[4], root.Children)
+        self.assertEqual(children[1:4] + children[5:], list(root.Children))
+
+        root.attach(children[0])
+        self.assertEqual(children[0], root.Children[-1])
+
+    def test_childrenList(self):
+        children = [Transform(str(i)) for i in range(5)]
+        items = ChildList(children[:3])
+
+        items.insert(1, children[3])
+        items.insert(0, children[3])
+        self.assertEqual([children[0], children[3], children[1], children[2]], items)
+        self.assertEqual(children[2], items.pop())
+        self.assertEqual(children[3], items.pop(1))
+        self.assertEqual([children[0], children[1]], items)
+        self.assertNotIn(children[3], items)
+
+        items[0] = children[4]
+        items[1:] = children[2:4]
+        self.assertEqual([children[4], children[2], children[3]], items)
+        self.assertNotIn(children[0], items)
+        self.assertRaises(ValueError, items.__setitem__, 0, children[3])
+
+        items.sort(key=lambda child: child.Name)
+        self.assertEqual(children[2:], items)
+        self.assertEqual(children[:2] + children[2:], children[:2] + items)
+        self.assertEqual(children[2:] + children[:2], items + children[:2])
+        self.assertRaises(IndexError, ChildList().pop)
+
+    def test_wideHierarchy(self):
+        root = Transform('Root')
+        children = [Transform(str(i)) for i in range(20000)]
+
+        root.attach(*children, keep=None)
+        self.assertEqual(len(children), len(root.Children))
+        root.attach(*children, keep=None)
+        self.assertEqual(len(children), len(root.Children))
+
+        root.detach(*children[::2], keep=None)
+        self.assertEqual(children[1::2], root.Children)
+        self.assertTrue(all(child.Parent is None for child in children[::2]))
+
+        root.clearChildren(keep=None)
+        self.assertEqual(0, len(root.Children))
+
+    def test_fromArrays(self):
+        parents = [-1, 0, 1, 1, 0, -1]
+        positions = [randomPosition() for _ in parents]
+        rotations = [randomRotation() for _ in parents]
+        scales = [randomScale() for _ in parents]
+        nodes = Transform.fromArrays(parents, positions, rotations, scales)
+
+        self.assertEqual(len(parents), len(nodes))
+        self.assertEqual(['Transform0', 'Transform1', 'Transform2', 'Transform3', 'Transform4', 'Transform5'], [node.Name for node in nodes])
+        self.assertEqual([nodes[0], nodes[1], nodes[2], nodes[3], nodes[4]], [item[0] for item in nodes[0].layout()])
+        self.assertEqual([nodes[1], nodes[4]], nodes[0].Children)
+        self.assertEqual(None, nodes[5].Parent)
+
+        for node, position, rotation, scale in zip(nodes, positions, rotations, scales):
+            self.assertEqual(position, node.Position)
+            self.assertEqual(rotation, node.Rotation)
+            self.assertEqual(scale, node.Scale)
+
+        named = Transform.fromArrays([-1, 0], names=['Root', 'Child'])
+        self.assertEqual(['Root', 'Child'], [node.Name for node in named])
+        self.assertEqual(glm.vec3(1), named[1].Scale)
+
+    def test_fromArrays_Exceptions(self):
+        self.assertRaises(ValueError, Transform.fromArrays, [0])
+        self.assertRaises(ValueError, Transform.fromArrays, [-1, 2, 0])
+        self.assertRaises(ValueError, Transform.fromArrays, [-1, 0], names=['Root'])
+
+    def test_graft(self):
+        root = randomHierarchy(30, uniformScale=True)
+        target = Transform('Target', position=randomPosition(), rotation=randomRotation(), scale=glm.vec3(2))
+        nodes = [node for node, _, _ in root.layout()]
+        subtrees = [nodes[5], nodes[9], nodes[0].Children[0]]
+        world = {id(node): (node.PositionWorld, node.RotationWorld, node.ScaleWorld) for node in nodes}
+
+        target.graft(*subtrees)
+        for node in subtrees:
+            self.assertIs(target, node.Parent)
+            self.assertNotIn(node, root.Children)
+        self.assertEqual(len(set(subtrees)), len(target.Children))
+        self.assertEqual(len(nodes), len(root.layout()) + len(target.layout()) - 1)
+
+        for node in nodes:
+            position, rotation, scale = world[id(node)]
+            self.assertGreater(deltaPosition, glm.distance2(position, node.PositionWorld))
+            self.assertGreater(deltaRotation, 1 - abs(glm.dot(rotation, node.RotationWorld)))
+            self.assertGreater(deltaScale, glm.distance2(scale, node.ScaleWorld))
+
+    def test_graftKeepProperties(self):
+        for _ in range(100):
+            root = Transform(position=randomPosition(), rotation=randomRotation(), scale=randomScale())
+            parent = Transform(position=randomPosition(), rotation=randomRotation(), scale=randomScale())
+            child1 = Transform(position=randomPosition(), rotation=randomRotation())
+            child2 = Transform(position=randomPosition(), rotation=randomRotation())
+            expected = child1.duplicate()
+            parent.attach(child1, child2, expected, keep=None)
+            root.attach(expected)
+
+            root.graft(child1)
+            self.assertGreater(deltaPosition, glm.distance2(expected.Position, child1.Position))
+            self.assertGreater(deltaRotation, 1 - abs(glm.dot(expected.Rotation, child1.Rotation)))
+            self.assertGreater(deltaScale, glm.distance2(expected.Scale, child1.Scale))
+
+            local = (child2.Position, child2.Rotation, child2.Scale)
+            root.graft(child2, keep=None)
+            self.assertEqual(local, (child2.Position, child2.Rotation, child2.Scale))
+            self.assertEqual([expected, child1, child2], root.Children)
+            self.assertEqual(0, len(parent.Children))
+
+    def test_graft_Exceptions(self):
+        root = Transform('Root').attach(Transform('Child').attach(Transform('Leaf')))
+        leaf = root.Children[0].Children[0]
+        self.assertRaises(ValueError, leaf.graft, root)
+        self.assertRaises(ValueError, leaf.graft, leaf)
+        self.assertRaises(ValueError, root.graft, None)
+        self.assertIs(root, leaf.Parent.Parent)
+
+    def test_extract(self):
+        root = randomHierarchy(30, uniformScale=True)
+        node = root.Children[0]
+        world = (node.PositionWorld, node.RotationWorld, node.ScaleWorld)
+        layout = [(item.Name, item.Position, depth) for item, _, depth in node.layout()]
+
+        copied = node.extract(duplicate=True)
+        self.assertIsNot(node, copied)
+        self.assertIs(root, node.Parent)
+        self.assertIsNone(copied.Parent)
+        self.assertEqual(layout[1:], [(item.Name, item.Position, depth) for item, _, depth in copied.layout()][1:])
+        self.assertGreater(deltaPosition, glm.distance2(world[0], copied.Position))
+        self.assertGreater(deltaRotation, 1 - abs(glm.dot(world[1], copied.Rotation)))
+        self.assertGreater(deltaScale, glm.distance2(world[2], copied.Scale))
+        self.assertEqual(node.Position, node.extract(duplicate=True, keep=None).Position)
+
+        self.assertIs(node, node.extract())
+        self.assertIsNone(node.Parent)
+        self.assertNotIn(node, root.Children)
+        self.assertGreater(deltaPosition, glm.distance2(world[0], node.Position))
+
 if __name__ == '__main__':
     unittest.main()
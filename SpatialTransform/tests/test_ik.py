@@ -0,0 +1,58 @@
+import glm
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, IKChain
+
+
+def createArm():
+    parents = [-1, 0, 1, 2, 3, 0]
+    positions = [(0, 1, 0), (0.2, 0, 0), (0, 1, 0), (0, 1, 0), (0, 0.5, 0), (0, 1, 0)]
+    rotations = [randomRotation(), randomRotation(), randomRotation(), randomRotation(), None, None]
+    names = ['Root', 'Shoulder', 'Elbow', 'Wrist', 'Hand', 'Head']
+    return Hierarchy(Transform.fromArrays(parents, positions, rotations, names=names)[0])
+
+
+class Solvers(unittest.TestCase):
+    def setUp(self):
+        self.arm = createArm()
+        self.chain = IKChain(self.arm, 'Shoulder', 'Hand')
+        self.shoulder = np.array(self.arm.Nodes[1].PositionWorld)
+
+    def test_chain(self):
+        self.assertEqual(['Shoulder', 'Elbow', 'Wrist', 'Hand'], [node.Name for node in self.chain.Joints])
+        self.assertRaises(ValueError, IKChain, self.arm, 'Hand', 'Shoulder')
+        self.assertRaises(ValueError, IKChain, self.arm, 'Head', 'Hand')
+        self.assertRaises(ValueError, IKChain, self.arm, 'Hand', 'Hand')
+
+    def test_solve(self):
+        directions = np.array([tuple(randomDirection()) for _ in range(50)])
+        targets = self.shoulder + directions * np.random.uniform(1.0, 2.4, (50, 1))
+        _, restRotations, _ = self.arm.getLocal()
+        lengths = [glm.distance(a.PositionWorld, b.PositionWorld) for a, b in zip(self.chain.Joints[:-1], self.chain.Joints[1:])]
+
+        for method in ['FABRIK', 'CCD']:
+            rotations = self.chain.solve(targets, method=method, iterations=100, tolerance=1e-5)
+            self.assertEqual((50, len(self.arm), 4), rotations.shape)
+            self.assertTrue(np.allclose(restRotations[[0, 4, 5]], rotations[:, [0, 4, 5]]))
+
+            positions, _, _ = self.arm.toWorld(rotations=rotations)
+            self.assertTrue(np.all(np.linalg.norm(positions[:, 4] - targets, axis=-1) < 1e-3), method)
+            for index, length in enumerate(lengths):
+                self.assertTrue(np.allclose(length, np.linalg.norm(positions[:, index + 2] - positions[:, index + 1], axis=-1), atol=1e-4))
+
+    def test_unreachable(self):
+        target = self.shoulder + np.array((3.0, 4.0, 0.0))
+        rotations = self.chain.solve(target)
+        positions, _, _ = self.arm.toWorld(rotations=rotations)
+        self.assertTrue(np.allclose(self.shoulder + np.array((0.6, 0.8, 0.0)) * 2.5, positions[4], atol=1e-3))
+
+    def test_apply(self):
+        target = self.shoulder + np.array((1.0, 0.5, -0.5))
+        self.chain.apply(target, method='CCD', iterations=100, tolerance=1e-6)
+        self.assertGreater(1e-3, glm.distance(self.arm.Nodes[4].PositionWorld, glm.vec3(target)))
+        self.assertRaises(ValueError, self.chain.solve, target, method='Jacobian')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import json
+import unittest
+import subprocess
+from .memory import budget
+
+# imports are measured in a new interpreter, because the test runner has already loaded everything
+# the import of glm is the baseline of the same interpreter, so the duration does not depend on the speed of the machine
+script = '''
+import sys, time, json
+start = time.perf_counter()
+import glm
+baseline = time.perf_counter() - start
+start = time.perf_counter()
+from SpatialTransform import Pose, Euler
+duration = time.perf_counter() - start
+print(json.dumps({"baseline": baseline, "duration": duration, "modules": sorted(sys.modules)}))
+'''
+
+
+def run(code: str) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class Startup(unittest.TestCase):
+    def test_lazyModules(self):
+        modules = run(script)['modules']
+        self.assertIn('SpatialTransform.lib.pose', modules)
+        self.assertIn('SpatialTransform.lib.euler', modules)
+        for module in ['numpy', 'random', 'SpatialTransform.lib.transform', 'SpatialTransform.lib.hierarchy', 'SpatialTransform.lib.arrays']:
+            self.assertNotIn(module, modules)
+
+    def test_duration(self):
+        # importing the scalar classes takes a fraction of the glm import, importing numpy eagerly takes several times as long
+        results = [run(script) for _ in range(3)]
+        ratio = min(result['duration'] for result in results) / min(result['baseline'] for result in results)
+        limit = budget('import_ratio', 1.0)
+        self.assertLessEqual(ratio, limit, f'Import budget "import_ratio" exceeded: {ratio:.2f} > {limit:.2f}')
+
+    def test_attributes(self):
+        result = run('import json, SpatialTransform; print(json.dumps({"all": SpatialTransform.__all__, "dir": dir(SpatialTransform)}))')
+        self.assertIn('Hierarchy', result['dir'])
+        self.assertNotIn('Modules', result['dir'])
+        self.assertEqual(set(result['all']), set(result['all']) & set(result['dir']))
+
+        import SpatialTransform
+        for name in SpatialTransform.__all__:
+            self.assertEqual(name, getattr(SpatialTransform, name).__name__)
+        with self.assertRaises(AttributeError):
+            SpatialTransform.Missing
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from .memory import *
+from .utils import *
+from SpatialTransform import Transform, Hierarchy
+
+
+# defaults leave at least 30% headroom over the measurements, as allocations differ between Python versions
+class Footprint(unittest.TestCase):
+    def assertWithin(self, value: float, name: str, default: float):
+        limit = budget(name, default)
+        self.assertLessEqual(value, limit, f'Memory budget "{name}" exceeded: {value:.1f} > {limit:.1f}')
+
+    def test_transform(self):
+        result = measure(Transform, repeat=1000)
+        self.assertWithin(result.retained, 'transform_bytes', 800)
+        self.assertWithin(result.blocks, 'transform_blocks', 16)
+
+    def test_build(self):
+        count = 10000
+        parents = [-1] + [index // 2 for index in range(count - 1)]
+        result = measure(lambda: Transform.fromArrays(parents))
+        self.assertWithin(result.peak / count, 'build_peak_bytes', 800)
+
+    def test_traverse(self):
+        count = 10000
+        root = Transform.fromArrays([-1] + [index // 2 for index in range(count - 1)])[0]
+        self.assertWithin(measure(root.layout).peak / count, 'layout_peak_bytes', 300)
+        self.assertWithin(measure(lambda: Hierarchy(root).getWorld()).peak / count, 'hierarchy_peak_bytes', 800)
+
+
+class Allocations(unittest.TestCase):
+    def assertWithin(self, value: float, name: str, default: float):
+        limit = budget(name, default)
+        self.assertLessEqual(value, limit, f'Allocation budget "{name}" exceeded: {value:.2f} > {limit:.2f}')
+
+    def test_reads(self):
+        # temporaries of walking along the parents are budgeted per read, the leaf has 9 parents
+        leaf = Transform.fromArrays([-1] + [index // 2 for index in range(999)])[-1]
+        for name, read, bytesPerRead, temporaryPerRead in [
+                ('position', lambda: leaf.Position, 64, 64),
+                ('space', lambda: leaf.Space, 128, 128),
+                ('positionworld', lambda: leaf.PositionWorld, 64, 512),
+                ('spaceworld', lambda: leaf.SpaceWorld, 128, 512)]:
+            result = measure(read, repeat=1000)
+            self.assertWithin(result.blocks, f'{name}_blocks', 1.5)
+            self.assertWithin(result.retained, f'{name}_bytes', bytesPerRead)
+            self.assertWithin(result.temporary, f'{name}_temporary_bytes', temporaryPerRead)
+
+            # without the results nothing is retained
+            self.assertWithin(measure(read, repeat=1000, keep=False).blocks, f'{name}_leaked_blocks', 0.05)
+
+    def test_temporaries(self):
+        # a read that holds a matrix for each parent exceeds the budget of a single world read
+        leaf = Transform.fromArrays([-1] + [index // 2 for index in range(999)])[-1]
+        parents = []
+        node = leaf
+        while node.Parent is not None:
+            node = node.Parent
+            parents.append(node)
+        self.assertGreater(measure(lambda: [parent.Space for parent in parents], repeat=100).temporary, 512)
+
+if __name__ == '__main__':
+    unittest.main()
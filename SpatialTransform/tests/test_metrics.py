@@ -0,0 +1,89 @@
+import glm
+import unittest
+import numpy as np
+from .memory import *
+from .utils import *
+from SpatialTransform import Hierarchy, PoseMetrics
+
+
+def createClip(hierarchy: Hierarchy, frames: int = 10):
+    positions, rotations, scales = hierarchy.getLocal()
+    clipPositions = np.repeat(positions[None], frames, axis=0) + np.array([[tuple(randomPosition() * 0.1) for _ in positions] for _ in range(frames)])
+    clipRotations = np.array([[tuple(randomRotation()) for _ in rotations] for _ in range(frames)])
+    return clipPositions, clipRotations, scales
+
+
+class Errors(unittest.TestCase):
+    def setUp(self):
+        self.hierarchy = Hierarchy(randomHierarchy(20, uniformScale=True))
+        self.metrics = PoseMetrics(self.hierarchy)
+
+    def test_errors(self):
+        a, b = createClip(self.hierarchy, 3), createClip(self.hierarchy, 3)
+        positionErrors = self.metrics.positionErrors(a, b)
+        rotationErrors = self.metrics.rotationErrors(a, b)
+        self.assertEqual((3, len(self.hierarchy)), positionErrors.shape)
+        self.assertEqual((3, len(self.hierarchy)), rotationErrors.shape)
+
+        for frame in range(3):
+            self.hierarchy.setLocal(a[0][frame], a[1][frame])
+            expected = [(node.PositionWorld, node.RotationWorld) for node in self.hierarchy.Nodes]
+            self.hierarchy.setLocal(b[0][frame], b[1][frame])
+            for index, node in enumerate(self.hierarchy.Nodes):
+                angle = glm.angle(glm.normalize(glm.inverse(expected[index][1]) * node.RotationWorld))
+                self.assertAlmostEqual(glm.distance(expected[index][0], node.PositionWorld), positionErrors[frame, index], delta=deltaPosition)
+                self.assertAlmostEqual(min(angle, 2 * np.pi - angle), rotationErrors[frame, index], delta=1e-3)
+
+    def test_current(self):
+        current = self.hierarchy.getLocal()
+        self.assertTrue(np.allclose(0, self.metrics.positionErrors(None)))
+        self.assertTrue(np.allclose(0, self.metrics.rotationErrors((None, -current[1], None))))
+        self.assertAlmostEqual(0, float(self.metrics.distance(current)), delta=deltaPosition)
+
+    def test_distance(self):
+        weights = np.random.rand(len(self.hierarchy))
+        metrics = PoseMetrics(self.hierarchy, weights, rotationWeight=0.5, space='local')
+        a, b = createClip(self.hierarchy, 4), createClip(self.hierarchy, 4)
+
+        expected = np.linalg.norm(a[0] - b[0], axis=-1) + 0.5 * metrics.rotationErrors(a, b)
+        self.assertEqual((4,), metrics.distance(a, b).shape)
+        self.assertTrue(np.allclose(np.average(expected, axis=-1, weights=weights), metrics.distance(a, b)))
+
+    def test_exceptions(self):
+        self.assertRaises(ValueError, PoseMetrics, self.hierarchy, space='parent')
+        self.assertRaises(ValueError, PoseMetrics, self.hierarchy, np.ones(3))
+        self.assertRaises(ValueError, PoseMetrics, self.hierarchy, np.zeros(len(self.hierarchy)))
+        self.assertRaises(ValueError, self.metrics.pairwise, self.hierarchy.getLocal())
+        self.assertRaises(ValueError, self.metrics.pairwise, createClip(self.hierarchy), chunkSize=0)
+
+
+class Pairwise(unittest.TestCase):
+    def setUp(self):
+        self.hierarchy = Hierarchy(randomHierarchy(20, uniformScale=True))
+        self.metrics = PoseMetrics(self.hierarchy)
+
+    def test_pairwise(self):
+        a, b = createClip(self.hierarchy, 7), createClip(self.hierarchy, 5)
+        expected = self.metrics.distance(tuple(values[:, None] for values in a[:2]) + (a[2],), tuple(values[None] for values in b[:2]) + (b[2],))
+        self.assertEqual((7, 5), expected.shape)
+
+        for chunkSize in (1, 2, 3, 64):
+            self.assertTrue(np.allclose(expected, self.metrics.pairwise(a, b, chunkSize)))
+
+    def test_symmetric(self):
+        a = createClip(self.hierarchy, 9)
+        expected = self.metrics.pairwise(a, a)
+        for chunkSize in (1, 4, 64):
+            result = self.metrics.pairwise(a, chunkSize=chunkSize)
+            self.assertTrue(np.allclose(expected, result))
+            self.assertTrue(np.allclose(0, np.diag(result), atol=1e-6))
+
+    def test_memory(self):
+        # the temporary memory depends on the chunk size, not on the amount of frame pairs
+        a = createClip(self.hierarchy, 256)
+        small = measure(lambda: self.metrics.pairwise(a, chunkSize=16)).peak
+        large = measure(lambda: self.metrics.pairwise(a, chunkSize=256)).peak
+        self.assertLess(small * 4, large)
+
+if __name__ == '__main__':
+    unittest.main()
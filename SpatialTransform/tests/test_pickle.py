@@ -0,0 +1,123 @@
+import glm
+import copy
+import pickle
+import unittest
+from .utils import *
+from SpatialTransform import Transform, Pose, Hierarchy, ArrayStorage
+
+
+class Named(Transform):
+    pass
+
+
+class Serialization(unittest.TestCase):
+    def assertTreeEqual(self, expected: Transform, actual: Transform):
+        expectedNodes = expected.layout()
+        actualNodes = actual.layout()
+        self.assertEqual(len(expectedNodes), len(actualNodes))
+        for (expectedNode, _, expectedDepth), (actualNode, _, actualDepth) in zip(expectedNodes, actualNodes):
+            self.assertIsNot(expectedNode, actualNode)
+            self.assertEqual(expectedDepth, actualDepth)
+            self.assertEqual(expectedNode.Name, actualNode.Name)
+            self.assertEqual(expectedNode.Position, actualNode.Position)
+            self.assertEqual(expectedNode.Rotation, actualNode.Rotation)
+            self.assertEqual(expectedNode.Scale, actualNode.Scale)
+            self.assertEqual([child.Name for child in expectedNode.Children], [child.Name for child in actualNode.Children])
+
+    def test_transform(self):
+        root = randomHierarchy(50)
+        self.assertTreeEqual(root, pickle.loads(pickle.dumps(root)))
+        self.assertTreeEqual(root, copy.deepcopy(root))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertTreeEqual(root, pickle.loads(pickle.dumps(root, protocol=protocol)))
+
+    def test_subtree(self):
+        root = randomHierarchy(50)
+        child = root.Children[0]
+        for result in (pickle.loads(pickle.dumps(child)), copy.deepcopy(child)):
+            self.assertIsNone(result.Parent)
+            self.assertTreeEqual(child, result)
+            self.assertEqual(child.Space, result.Space)
+        self.assertIs(root, child.Parent)
+
+    def test_copy(self):
+        root = randomHierarchy(20)
+        root.Tag = 'tagged'
+        result = copy.copy(root)
+        self.assertIs(Transform, type(result))
+        self.assertEqual(root.Name, result.Name)
+        self.assertEqual(root.Space, result.Space)
+        self.assertEqual('tagged', result.Tag)
+        self.assertIsNone(result.Parent)
+        self.assertEqual(0, len(result.Children))
+        self.assertEqual(20, len(root.layout()))
+
+        # the original transforms are not changed by copies
+        before = [(node.Name, node.Position, node.Parent) for node, _, _ in root.layout()]
+        copy.copy(root.Children[0])
+        copy.deepcopy(root.Children[0])
+        self.assertEqual(before, [(node.Name, node.Position, node.Parent) for node, _, _ in root.layout()])
+
+    def test_repeated(self):
+        root = randomHierarchy(50)
+        data = pickle.dumps(root)
+        for _ in range(3):
+            self.assertEqual(data, pickle.dumps(root))
+            self.assertTreeEqual(root, pickle.loads(data))
+
+    def test_deepCopied(self):
+        leaf = Transform.fromArrays([-1] + list(range(20000)))[-1]
+        copy.copy(leaf)
+        copy.deepcopy(leaf.Parent)
+        result = pickle.loads(pickle.dumps(leaf))
+        self.assertIsNone(result.Parent)
+        self.assertEqual(leaf.Name, result.Name)
+
+    def test_subclass(self):
+        root = Named('Root', position=randomPosition())
+        root.attach(Transform('Child'))
+        root.Tag = 'tagged'
+        result = copy.deepcopy(root)
+
+        self.assertIs(Named, type(result))
+        self.assertIs(Transform, type(result.Children[0]))
+        self.assertEqual('tagged', result.Tag)
+        self.assertEqual(root.Position, result.Position)
+
+    def test_storage(self):
+        root = randomHierarchy(10)
+        ArrayStorage(root)
+        result = pickle.loads(pickle.dumps(root))
+        self.assertIs(Transform, type(result))
+        self.assertFalse(hasattr(result, '_Storage'))
+        self.assertTreeEqual(root, result)
+
+    def test_deep(self):
+        root = Transform.fromArrays([-1] + list(range(20000)))[0]
+        result = pickle.loads(pickle.dumps(root))
+        self.assertEqual(20001, len(result.layout()))
+
+    def test_size(self):
+        root = randomHierarchy(200)
+        # flat values and names, plus the class and extra attributes per transform
+        self.assertLess(len(pickle.dumps(root)), 200 * 65)
+
+    def test_pose(self):
+        pose = Pose(randomPosition(), randomRotation(), randomScale())
+        for result in (pickle.loads(pickle.dumps(pose)), copy.deepcopy(pose)):
+            self.assertIsInstance(result, Pose)
+            self.assertEqual(pose.Position, result.Position)
+            self.assertEqual(pose.Rotation, result.Rotation)
+            self.assertEqual(pose.Scale, result.Scale)
+            self.assertEqual(pose.Space, result.Space)
+
+    def test_hierarchy(self):
+        hierarchy = Hierarchy(randomHierarchy(50))
+        result = pickle.loads(pickle.dumps(hierarchy))
+        self.assertEqual(hierarchy.Names, result.Names)
+        self.assertEqual(hierarchy.DType, result.DType)
+        self.assertTrue((hierarchy.Parents == result.Parents).all())
+        self.assertTrue((hierarchy.snapshot() == result.snapshot()).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -169,5 +169,16 @@ class World(unittest.TestCase):
             child.Scale = randomScale()
             self.assertEqual(root.Scale * child.Scale, child.ScaleWorld)
 
+    def test_SpaceAfterWorldChange(self):
+        root = Transform(position=randomPosition(), rotation=randomRotation(), scale=randomScale())
+        child = Transform()
+        root.attach(child, keep=None)
+        child.Space
+
+        child.PositionWorld = randomPosition()
+        child.RotationWorld = randomRotation()
+        child.ScaleWorld = randomScale()
+        self.assertEqual(glm.scale(glm.translate(child.Position), child.Scale) * glm.mat4_cast(child.Rotation), child.Space)
+
 if __name__ == '__main__':
     unittest.main()
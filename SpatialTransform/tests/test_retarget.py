@@ -0,0 +1,60 @@
+import glm
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, Retarget
+
+
+def createRig(names, height, rotation=glm.quat()):
+    parents = [-1, 0, 1, 0, 3, 4]
+    positions = [(0, height, 0), (0, height * 0.3, 0), (0, height * 0.2, 0), (0.1, 0, 0), (0, -height * 0.5, 0), (0, -height * 0.5, 0)]
+    rotations = [rotation, rotation, None, None, None, None]
+    return Transform.fromArrays(parents, positions, rotations, names=names)[0]
+
+
+class Retargeting(unittest.TestCase):
+    def setUp(self):
+        self.source = Hierarchy(createRig(['Hips', 'Spine', 'Head', 'UpLeg', 'Leg', 'Foot'], 1.0))
+        self.target = Hierarchy(createRig(['rig:hips', 'rig:spine', 'rig:head', 'rig:up_leg', 'rig:leg', 'rig:foot'], 2.0, randomRotation()))
+        self.retarget = Retarget(self.source, self.target, sourceLeg=['UpLeg', 'Leg', 'Foot'], targetLeg=['rig:up_leg', 'rig:leg', 'rig:foot'])
+        self.offsets = [glm.inverse(source.RotationWorld) * target.RotationWorld for source, target in zip(self.source.Nodes, self.target.Nodes)]
+
+    def test_mapping(self):
+        self.assertEqual({'Hips': 'rig:hips', 'Spine': 'rig:spine', 'Head': 'rig:head', 'UpLeg': 'rig:up_leg', 'Leg': 'rig:leg', 'Foot': 'rig:foot'}, self.retarget.Mapping)
+        self.assertAlmostEqual(2.0, self.retarget.Ratio, places=5)
+
+        partial = Retarget(self.source, self.target, mapping={'Hips': 'rig:hips', 'Leg': 'rig:leg'})
+        self.assertEqual({'Hips': 'rig:hips', 'Leg': 'rig:leg'}, partial.Mapping)
+        self.assertRaises(ValueError, Retarget, self.source, Transform('Other'))
+
+    def test_restPose(self):
+        positions, rotations, scales = self.retarget.retarget()
+        restPositions, restRotations, restScales = self.target.getLocal()
+
+        self.assertTrue(np.allclose(restPositions, positions, atol=1e-5))
+        self.assertTrue(np.allclose(np.abs(np.sum(restRotations * rotations, axis=-1)), 1, atol=1e-5))
+        self.assertTrue(np.allclose(restScales, scales))
+
+    def test_clip(self):
+        frames = 10
+        positions, rotations, scales = self.source.getLocal()
+        clipPositions = np.repeat(positions[None], frames, axis=0)
+        clipRotations = np.array([[tuple(randomRotation()) for _ in range(len(self.source))] for _ in range(frames)])
+        clipPositions[:, 0] += np.random.uniform(-1, 1, (frames, 3))
+
+        targetPositions, targetRotations, targetScales = self.retarget.retarget(clipPositions, clipRotations, scales)
+        self.assertEqual((frames, len(self.target), 4), targetRotations.shape)
+
+        for frame in range(frames):
+            self.source.setLocal(clipPositions[frame], clipRotations[frame])
+            self.target.setLocal(targetPositions[frame], targetRotations[frame], targetScales[frame])
+            sourceHips, targetHips = self.source.Nodes[0], self.target.Nodes[0]
+            self.assertGreater(deltaPosition, glm.distance2(targetHips.PositionWorld, (sourceHips.PositionWorld - glm.vec3(0, 1, 0)) * 2 + glm.vec3(0, 2, 0)))
+
+            # mapped transforms keep their world space difference of the rest pose
+            for source, target, offset in zip(self.source.Nodes, self.target.Nodes, self.offsets):
+                self.assertGreater(deltaRotation, 1 - abs(glm.dot(source.RotationWorld * offset, target.RotationWorld)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import glm
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, RootMotion
+
+
+def createClip(hierarchy: Hierarchy, frames: int = 10):
+    positions, rotations, scales = hierarchy.getLocal()
+    clipPositions = np.repeat(positions[None], frames, axis=0)
+    clipPositions[:, 0] += np.array([tuple(randomPosition() * 3) for _ in range(frames)])
+    clipRotations = np.array([[tuple(randomRotation()) for _ in rotations] for _ in range(frames)])
+    return clipPositions, clipRotations, scales
+
+
+class Trajectory(unittest.TestCase):
+    def setUp(self):
+        self.hierarchy = Hierarchy(randomHierarchy(20, uniformScale=True))
+        self.motion = RootMotion(self.hierarchy, 1, forward=(0, 0, 1))
+
+    def test_extract(self):
+        clip = createClip(self.hierarchy)
+        trajectory, headings = self.motion.extract(*clip)
+        self.assertEqual((10, 3), trajectory.shape)
+        self.assertEqual((10, 4), headings.shape)
+
+        for frame in range(10):
+            self.hierarchy.setLocal(clip[0][frame], clip[1][frame])
+            joint = self.hierarchy.Nodes[1]
+            facing = joint.RotationWorld * glm.vec3(0, 0, 1)
+            facing = glm.normalize(glm.vec3(facing.x, 0, facing.z))
+
+            self.assertGreater(deltaPosition, glm.distance2(glm.vec3(joint.PositionWorld.x, 0, joint.PositionWorld.z), glm.vec3(trajectory[frame])))
+            self.assertGreater(deltaPosition, glm.distance2(facing, glm.quat(*headings[frame]) * glm.vec3(0, 0, -1)))
+
+    def test_vertical(self):
+        rotations = self.hierarchy.getLocal()[1]
+        clip = np.repeat(rotations[None], 3, axis=0)
+        vertical = np.array(tuple(glm.quatLookAtRH(glm.vec3(0, 1, 0), glm.vec3(1, 0, 0))))
+        self.motion = RootMotion(self.hierarchy, 0)
+        clip[1:, 0] = vertical
+        _, headings = self.motion.extract(rotations=clip)
+        self.assertTrue(np.allclose(headings[0], headings[1]))
+        self.assertTrue(np.allclose(headings[0], headings[2]))
+
+        clip[0, 0] = vertical
+        _, headings = self.motion.extract(rotations=clip)
+        self.assertTrue(np.allclose((1, 0, 0, 0), headings))
+
+    def test_toRelative(self):
+        clip = createClip(self.hierarchy)
+        trajectory, headings = self.motion.extract(*clip)
+        positions, rotations, directions = self.motion.toRelative(*clip)
+        self.assertEqual((10, len(self.hierarchy), 3), positions.shape)
+
+        for frame in range(10):
+            self.hierarchy.setLocal(clip[0][frame], clip[1][frame])
+            root = Transform(position=trajectory[frame], rotation=glm.quat(*headings[frame]))
+            for index, node in enumerate(self.hierarchy.Nodes):
+                self.assertGreater(deltaPosition, glm.distance2(root.pointToLocal(node.PositionWorld), glm.vec3(positions[frame, index])))
+                self.assertGreater(deltaPosition, glm.distance2(root.directionToLocal(node.ForwardWorld), glm.vec3(directions[frame, index])))
+                self.assertGreater(deltaRotation, 1 - abs(glm.dot(root.RotationWorldInverse * node.RotationWorld, glm.quat(*rotations[frame, index]))))
+
+    def test_toWorld(self):
+        clip = createClip(self.hierarchy)
+        trajectory, headings = self.motion.extract(*clip)
+        positions, rotations, _ = self.motion.toRelative(*clip)
+        worldPositions, worldRotations = self.motion.toWorld(trajectory, headings, positions, rotations)
+        expectedPositions, expectedRotations, _ = self.hierarchy.toWorld(*clip)
+
+        self.assertTrue(np.allclose(expectedPositions, worldPositions, atol=1e-5))
+        self.assertTrue(np.allclose(expectedRotations, worldRotations, atol=1e-5))
+        self.assertIsNone(self.motion.toWorld(trajectory, headings, positions)[1])
+
+    def test_exceptions(self):
+        self.assertRaises(ValueError, RootMotion, self.hierarchy, 'missing')
+        self.assertRaises(ValueError, RootMotion, self.hierarchy, 0, forward=(0, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import glm
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, SpatialIndex
+from SpatialTransform.lib.bvh import BoundingVolumeTree
+
+
+class Tree(unittest.TestCase):
+    def setUp(self):
+        self.points = np.random.uniform(-10, 10, (500, 3))
+        self.tree = BoundingVolumeTree(self.points, leafSize=4)
+        self.point = np.random.uniform(-10, 10, 3)
+
+    def test_queryRadius(self):
+        expected = np.flatnonzero(np.linalg.norm(self.points - self.point, axis=1) <= 4)
+        self.assertEqual(sorted(expected.tolist()), sorted(self.tree.queryRadius(self.point, 4).tolist()))
+
+    def test_queryBox(self):
+        expected = np.flatnonzero(np.all((self.points >= -2) & (self.points <= (1, 5, 3)), axis=1))
+        self.assertEqual(sorted(expected.tolist()), sorted(self.tree.queryBox((-2, -2, -2), (1, 5, 3)).tolist()))
+
+    def test_queryNearest(self):
+        distances = np.linalg.norm(self.points - self.point, axis=1)
+        indices, result = self.tree.queryNearest(self.point, k=5)
+        self.assertEqual(np.argsort(distances)[:5].tolist(), indices.tolist())
+        self.assertTrue(np.allclose(np.sort(distances)[:5], result))
+
+    def test_queryRay(self):
+        direction = np.array((1.0, 2.0, -0.5))
+        direction /= np.linalg.norm(direction)
+        offsets = self.points - self.point
+        along = np.maximum(offsets @ direction, 0)
+        distances = np.linalg.norm(offsets - along[:, None] * direction, axis=1)
+
+        indices, result = self.tree.queryRay(self.point, direction * 3, k=3)
+        self.assertEqual(np.argsort(distances)[:3].tolist(), indices.tolist())
+        self.assertTrue(np.allclose(np.sort(distances)[:3], result))
+
+    def test_refit(self):
+        moved = self.points + np.random.uniform(-5, 5, self.points.shape)
+        self.tree.refit(moved)
+        expected = np.flatnonzero(np.linalg.norm(moved - self.point, axis=1) <= 4)
+        self.assertEqual(sorted(expected.tolist()), sorted(self.tree.queryRadius(self.point, 4).tolist()))
+        self.assertRaises(ValueError, self.tree.refit, moved[1:])
+
+
+class Index(unittest.TestCase):
+    def test_queries(self):
+        actorA = randomHierarchy()
+        actorB = randomHierarchy()
+        index = SpatialIndex(actorA, actorB)
+        nodes = [item[0] for item in actorA.layout() + actorB.layout()]
+        point = randomPosition()
+
+        self.assertEqual(len(nodes), len(index))
+        nearest, distance = index.queryNearest(point)[0]
+        self.assertIs(min(nodes, key=lambda node: glm.distance(node.PositionWorld, point)), nearest)
+        self.assertAlmostEqual(glm.distance(nearest.PositionWorld, point), distance, places=4)
+
+        inside = index.queryRadius(point, 1.5)
+        for node in nodes:
+            if glm.distance(node.PositionWorld, point) < 1.5 - 1e-4: self.assertIn(node, inside)
+            if glm.distance(node.PositionWorld, point) > 1.5 + 1e-4: self.assertNotIn(node, inside)
+
+    def test_refit(self):
+        root = Transform('Root').attach(Transform('Hand', position=(1, 0, 0)))
+        index = SpatialIndex(root)
+        self.assertEqual('Hand', index.queryNearest((1, 0, 0))[0][0].Name)
+
+        root.Position = (-10, 0, 0)
+        index.refit()
+        self.assertEqual([], index.queryBox((0, -1, -1), (2, 1, 1)))
+        self.assertEqual('Hand', index.queryNearest((-9, 0, 0))[0][0].Name)
+        self.assertEqual('Root', index.queryRay((-10, 5, 0), (0, -1, 0))[0][0].Name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import copy
+import glm
+import pickle
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Transform, Hierarchy, ArrayStorage
+
+
+class Named(Transform):
+    pass
+
+
+class Views(unittest.TestCase):
+    def setUp(self):
+        self.root = randomHierarchy(20)
+        self.expected = [(node.Position, node.Rotation, node.Scale, node.PositionWorld) for node, _, _ in self.root.layout()]
+        self.storage = ArrayStorage(self.root)
+        self.nodes = self.storage.Source.Nodes
+
+    def test_values(self):
+        self.assertEqual(20, len(self.storage))
+        self.assertEqual(np.float32, self.storage.Positions.dtype)
+        for node, (position, rotation, scale, positionWorld) in zip(self.nodes, self.expected):
+            self.assertIsInstance(node, Transform)
+            self.assertEqual(position, node.Position)
+            self.assertEqual(rotation, node.Rotation)
+            self.assertEqual(scale, node.Scale)
+            self.assertGreater(deltaPosition, glm.distance2(positionWorld, node.PositionWorld))
+
+    def test_scalarWrites(self):
+        node = self.nodes[5]
+        node.Position = glm.vec3(1, 2, 3)
+        node.setEuler((0, 90, 0))
+        node.Scale *= 2
+        self.assertTrue(np.allclose((1, 2, 3), self.storage.Positions[5]))
+        self.assertTrue(np.allclose(tuple(node.Rotation), self.storage.Rotations[5]))
+        self.assertTrue(np.allclose(tuple(self.expected[5][2] * 2), self.storage.Scales[5]))
+
+    def test_arrayWrites(self):
+        # spaces are not cached, so changes of the arrays are seen by the world properties
+        leaf = self.nodes[-1]
+        leaf.SpaceWorld
+        self.storage.Positions[:] += 1
+        self.storage.Rotations[:] = (1, 0, 0, 0)
+        self.storage.Scales[:] = 1
+
+        expected = glm.vec3(0)
+        node = leaf
+        while node is not None:
+            expected += node.Position
+            node = node.Parent
+        self.assertGreater(deltaPosition, glm.distance2(expected, leaf.PositionWorld))
+        self.assertEqual(glm.quat(), leaf.RotationWorld)
+
+    def test_hierarchy(self):
+        hierarchy = Hierarchy(self.root)
+        positions, rotations, scales = hierarchy.getLocal()
+        self.assertTrue(np.array_equal(self.storage.Positions, positions))
+        self.assertFalse(np.shares_memory(self.storage.Positions, positions))
+
+        hierarchy.setLocal(positions + 1, scales=scales * 2)
+        self.assertTrue(np.allclose(positions + 1, self.storage.Positions))
+        self.assertTrue(np.allclose(scales * 2, self.storage.Scales))
+        self.assertTrue(np.allclose(rotations, self.storage.Rotations))
+        self.assertEqual(glm.vec3(positions[3] + 1), self.nodes[3].Position)
+
+        buffer = hierarchy.snapshot()
+        hierarchy.setLocal(positions)
+        hierarchy.restore(buffer)
+        self.assertTrue(np.allclose(positions + 1, self.storage.Positions))
+
+    def test_release(self):
+        node = self.nodes[3]
+        node.Position = glm.vec3(4, 5, 6)
+        self.storage.release()
+        self.assertFalse(self.storage.Active)
+        self.assertIs(Transform, type(node))
+        self.assertEqual(glm.vec3(4, 5, 6), node.Position)
+
+        self.storage.Positions[3] = 0
+        self.assertEqual(glm.vec3(4, 5, 6), node.Position)
+        self.assertTrue(np.allclose((4, 5, 6), Hierarchy(self.root).getLocal()[0][3]))
+        ArrayStorage(self.root)
+
+    def test_structure(self):
+        child = Transform('Child', position=(1, 1, 1))
+        self.nodes[4].attach(child)
+        self.assertIs(Transform, type(child))
+        self.assertEqual(21, len(Hierarchy(self.root).getLocal()[0]))
+
+        copied = copy.deepcopy(self.root)
+        self.assertIs(Transform, type(copied))
+        self.assertEqual([node.Name for node, _, _ in self.root.layout()], [node.Name for node, _, _ in pickle.loads(pickle.dumps(self.root)).layout()])
+
+    def test_detachLast(self):
+        # a hierarchy without the last row can not use the arrays directly
+        root = Transform('Root').attach(Transform('Child1', position=(1, 0, 0)), Transform('Child2', position=(2, 0, 0)))
+        ArrayStorage(root)
+        root.detach(root.Children[1])
+        hierarchy = Hierarchy(root)
+
+        positions = hierarchy.getLocal()[0]
+        self.assertEqual((2, 3), positions.shape)
+        self.assertEqual((2, 3), hierarchy.toWorld()[0].shape)
+        hierarchy.setLocal(np.zeros((2, 3)))
+        self.assertEqual(glm.vec3(0), root.Children[0].Position)
+
+    def test_subclass(self):
+        root = Named('Root')
+        root.attach(Named('Child'))
+        storage = ArrayStorage(root)
+        self.assertTrue(all(isinstance(node, Named) for node in storage.Source.Nodes))
+        storage.release()
+        self.assertIs(Named, type(root))
+
+    def test_exceptions(self):
+        self.assertRaises(ValueError, ArrayStorage, self.root)
+        self.assertRaises(ValueError, ArrayStorage, randomHierarchy(3), dtype=np.int32)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import glm
+import asyncio
+import unittest
+import numpy as np
+from .utils import *
+from SpatialTransform import Hierarchy, PoseStream, Euler
+
+
+async def produce(frames, delay=0.0):
+    for frame in frames:
+        if delay: await asyncio.sleep(delay)
+        yield frame
+
+
+async def consume(stream, frames, delay=0.0):
+    results = []
+    async for result in stream.process(frames):
+        if delay: await asyncio.sleep(delay)
+        results.append(result)
+    return results
+
+
+class Pipeline(unittest.TestCase):
+    def test_process(self):
+        hierarchy = Hierarchy(randomHierarchy())
+        clip = [np.repeat(values[None], 21, axis=0) for values in hierarchy.getLocal()]
+        clip[1] = np.roll(clip[1], 1, axis=0)
+        clip[1] = np.stack([np.roll(clip[1][index], index, axis=0) for index in range(21)])
+        expected = hierarchy.toWorld(*clip)
+
+        stream = PoseStream(hierarchy, batchSize=4)
+        results = asyncio.run(consume(stream, produce(list(zip(*clip)))))
+
+        self.assertEqual(21, len(results))
+        for index, result in enumerate(results):
+            for values, actual in zip(expected, result):
+                self.assertTrue(np.allclose(values[index], actual))
+
+        latency = stream.Latency
+        self.assertEqual(21, latency['total'][0])
+        self.assertGreaterEqual(latency['convert'][0], 6)
+        self.assertLessEqual(latency['batch'][1], latency['batch'][2])
+
+    def test_euler(self):
+        hierarchy = Hierarchy(randomHierarchy(5))
+        positions, rotations, scales = hierarchy.getLocal()
+        degrees = np.array([glm.degrees(Euler.fromQuatTo(glm.quat(*rotation), 'XYZ', True)) for rotation in rotations])
+
+        stream = PoseStream(hierarchy, order='XYZ', extrinsic=True, apply=True)
+        results = asyncio.run(consume(stream, produce([(positions, degrees)] * 3, delay=0.001)))
+
+        for actual, expected in zip(results[-1], hierarchy.getWorld()):
+            self.assertTrue(np.allclose(expected, actual, atol=1e-4) or np.allclose(expected, -actual, atol=1e-4))
+
+    def test_delay(self):
+        # frames that arrive while a batch times out are kept for the next batch
+        hierarchy = Hierarchy(randomHierarchy(5))
+        frames = [tuple(values + index for values in hierarchy.getLocal()) for index in range(30)]
+        stream = PoseStream(hierarchy, batchSize=4, maxDelay=0.002)
+        results = asyncio.run(consume(stream, produce(frames, delay=0.002)))
+
+        self.assertEqual(30, len(results))
+        for frame, result in zip(frames, results):
+            self.assertTrue(np.allclose(hierarchy.toWorld(*frame)[0], result[0]))
+
+    def test_backpressure(self):
+        hierarchy = Hierarchy(randomHierarchy(5))
+        read = []
+
+        async def source():
+            for index in range(200):
+                read.append(index)
+                yield hierarchy.getLocal()
+
+        batchSize, queueSize = 2, 2
+
+        async def run():
+            stream = PoseStream(hierarchy, batchSize=batchSize, queueSize=queueSize)
+            generator = stream.process(source())
+            await generator.__anext__()
+            await asyncio.sleep(0.05)
+            count = len(read)
+            await generator.aclose()
+
+            # the stages are finished once the stream is closed
+            self.assertEqual(set(), asyncio.all_tasks() - {asyncio.current_task()})
+            return count
+
+        # frames held by the frame, batch and result queues, one batch in each stage and the consumer, and one frame waiting in the reader, plus a batch of slack
+        bound = 3 * queueSize * batchSize + 3 * batchSize + 1
+        self.assertLessEqual(asyncio.run(run()), bound + batchSize)
+
+    def test_errors(self):
+        hierarchy = Hierarchy(randomHierarchy(5))
+
+        async def source():
+            yield hierarchy.getLocal()
+            raise RuntimeError('lost connection')
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(consume(PoseStream(hierarchy), source()))
+        with self.assertRaises(ValueError):
+            asyncio.run(consume(PoseStream(hierarchy), produce([(np.zeros((2, 3)), np.zeros((2, 4)), np.ones((2, 3)))])))
+        with self.assertRaises(ValueError):
+            PoseStream(hierarchy, batchSize=0)
+
+if __name__ == '__main__':
+    unittest.main()
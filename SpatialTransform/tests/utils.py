@@ -29,3 +29,9 @@ def randomRotation():
 def randomScale():
     return (glm.vec3(random.random(), random.random(), random.random()) + 0.01) * \
          glm.vec3(-1 if random.random()<0.5 else 1, -1 if random.random()<0.5 else 1, -1 if random.random()<0.5 else 1)
+
+def randomHierarchy(count: int = 20, uniformScale: bool = False):
+    from SpatialTransform import Transform
+    parents = [-1] + [random.randrange(index) for index in range(1, count)]
+    scales = [glm.vec3(abs(randomScale().x) + 0.5) if uniformScale else randomScale() for _ in parents]
+    return Transform.fromArrays(parents, [randomPosition() for _ in parents], [randomRotation() for _ in parents], scales)[0]